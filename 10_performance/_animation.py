@@ -0,0 +1,406 @@
+"""Animation scheduling helpers shared by the performance examples.
+
+Files starting with ``_`` are skipped by ``run_examples.py``; this module is
+imported by the scripts in this directory instead of being run on its own.
+
+Provides:
+- FrameStats: shown/dropped frame counts, achieved fps and frame time percentiles
+- run_adaptive: Animation.run counterpart that holds wall-clock timing by dropping frames
+- run_async: run_adaptive for asyncio, taking sync or async frame sources
+- AsyncProgress / async_progress: ``console.progress()`` refreshed from the event loop
+"""
+
+import asyncio
+import math
+import sys
+import time
+from collections.abc import AsyncIterable, AsyncIterator, Callable, Iterable, Sequence
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, TextIO
+
+from _frames import HIDE_CURSOR, SHOW_CURSOR, FrameDiffer, _FallbackWriter
+from _progress import _text_fallback
+from rich.progress import TaskID
+
+from styledconsole import Console
+from styledconsole.core.progress import StyledProgress
+
+
+def percentile(values: Sequence[float], q: float) -> float:
+    """Nearest-rank percentile (``q`` in 0..1) of values; 0.0 when empty."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(q * len(ordered)) - 1)]
+
+
+@dataclass(frozen=True)
+class FrameStats:
+    """What an animation run achieved.
+
+    ``render_ms`` and ``write_ms`` hold one entry per shown frame: the time
+    spent producing the frame (pulling it from the generator) and writing it
+    to the stream.
+    """
+
+    fps: float  # requested rate
+    shown: int
+    dropped: int
+    elapsed: float  # seconds
+    render_ms: tuple[float, ...]
+    write_ms: tuple[float, ...]
+
+    @property
+    def achieved_fps(self) -> float:
+        """Frames shown per second of wall time."""
+        return self.shown / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def frame_ms(self) -> tuple[float, ...]:
+        """Render plus write time per shown frame."""
+        return tuple(r + w for r, w in zip(self.render_ms, self.write_ms, strict=True))
+
+    @property
+    def p50_ms(self) -> float:
+        """Median frame time in milliseconds."""
+        return percentile(self.frame_ms, 0.50)
+
+    @property
+    def p99_ms(self) -> float:
+        """99th percentile frame time in milliseconds."""
+        return percentile(self.frame_ms, 0.99)
+
+    @property
+    def drop_rate(self) -> float:
+        """Share of scheduled frames that were dropped."""
+        total = self.shown + self.dropped
+        return self.dropped / total if total else 0.0
+
+
+class _Schedule:
+    """Frame slots on the wall clock, shared by run_adaptive and run_async.
+
+    Slot ``i`` is due at ``start + i / fps``. ``plan()`` says how long to
+    wait for the next slot, or how many slots were missed; the caller
+    produces and writes the frame and reports back with ``shown()``.
+    """
+
+    def __init__(
+        self, fps: float, duration: float | None, drop: bool, clock: Callable[[], float]
+    ) -> None:
+        if fps <= 0:
+            raise ValueError(f"fps must be positive, got {fps}")
+        self.fps = fps
+        self.delay = 1.0 / fps
+        self.duration = duration
+        self.drop = drop
+        self.clock = clock
+        self.slot = 0  # index of the frame due next
+        self.dropped = 0
+        self.render_ms: list[float] = []
+        self.write_ms: list[float] = []
+        self._just_dropped = False
+        self.start = clock()
+
+    def over(self) -> bool:
+        """Whether the next slot is past ``duration``."""
+        return self.duration is not None and self.slot * self.delay >= self.duration
+
+    def plan(self) -> tuple[float, int]:
+        """(seconds to wait, slots missed) for the next frame; at most one is non-zero.
+
+        One frame is always shown after a drop, so the animation keeps
+        moving even when producing frames takes longer than a slot.
+        """
+        late = self.clock() - (self.start + self.slot * self.delay)
+        if late < 0:
+            return -late, 0
+        if self.drop and not self._just_dropped and late >= self.delay:
+            self._just_dropped = True
+            return 0.0, int(late / self.delay)
+        self._just_dropped = False
+        return 0.0, 0
+
+    def skipped(self, slots: int, frames: int) -> None:
+        """Record ``slots`` missed slots, for which ``frames`` frames were discarded."""
+        self.slot += slots
+        self.dropped += frames
+
+    def shown(self, begin: float, rendered: float, written: float) -> None:
+        """Record a shown frame's timestamps."""
+        self.render_ms.append((rendered - begin) * 1000)
+        self.write_ms.append((written - rendered) * 1000)
+        self.slot += 1
+
+    def stats(self) -> FrameStats:
+        """FrameStats for the frames recorded so far."""
+        return FrameStats(
+            fps=self.fps,
+            shown=len(self.render_ms),
+            dropped=self.dropped,
+            elapsed=self.clock() - self.start,
+            render_ms=tuple(self.render_ms),
+            write_ms=tuple(self.write_ms),
+        )
+
+
+def _writer(stream: TextIO, separator: str | None) -> FrameDiffer | _FallbackWriter:
+    if stream.isatty():
+        stream.write(HIDE_CURSOR)
+        return FrameDiffer(stream)
+    return _FallbackWriter(stream, separator)
+
+
+def _finish(stream: TextIO) -> None:
+    stream.write(SHOW_CURSOR if stream.isatty() else "\n")
+    stream.flush()
+
+
+def run_adaptive(
+    frames: Iterable[str],
+    fps: float = 10,
+    duration: float | None = None,
+    *,
+    stream: TextIO | None = None,
+    drop: bool = True,
+    fallback_separator: str | None = None,
+    clock: Callable[[], float] = time.perf_counter,
+    sleep: Callable[[float], None] = time.sleep,
+) -> FrameStats:
+    """Play frames like ``Animation.run``, on a wall-clock schedule.
+
+    ``Animation.run`` sleeps a fixed ``1 / fps`` after each frame, so slow
+    frames stretch the animation. Here frame ``i`` is due at ``start + i /
+    fps``: the loop sleeps only for what is left of the slot, and when a
+    frame finishes a whole slot or more late, the frames whose slots have
+    passed are dropped. A 3 second animation takes 3 seconds on a loaded
+    host; it just shows fewer frames.
+
+    Frames from a Sequence (a list of prebuilt frames, for instance) are
+    dropped by index without being produced. Frames from an iterator are
+    pulled and discarded, so a generator's rendering still runs for them;
+    one frame is always shown between drops, so the loop keeps moving.
+
+    Terminals get in-place redraws through FrameDiffer; other streams get
+    Animation's fallback output.
+
+    Args:
+        frames: Frame strings, each ending with a newline
+        fps: Target frames per second
+        duration: Stop after this many seconds (None: until frames run out)
+        stream: Where frames are written (defaults to ``sys.stdout``)
+        drop: Drop late frames (False: play every frame, late ones back to back)
+        fallback_separator: As in ``Animation.run``, for non-terminal streams
+        clock, sleep: Time source and sleep function
+
+    Returns:
+        FrameStats for the run
+    """
+    schedule = _Schedule(fps, duration, drop, clock)
+    stream = stream or sys.stdout
+    sequence = frames if isinstance(frames, Sequence) else None
+    iterator = None if sequence is not None else iter(frames)
+    position = 0  # frames taken from the sequence (shown or dropped)
+    writer = _writer(stream, fallback_separator)
+    try:
+        while not schedule.over():
+            wait, missed = schedule.plan()
+            if missed:
+                if sequence is not None:
+                    skipped = min(missed, len(sequence) - position)
+                    position += skipped
+                else:
+                    skipped = sum(1 for _ in zip(range(missed), iterator, strict=False))
+                schedule.skipped(missed, skipped)
+                continue
+            if wait:
+                sleep(wait)
+
+            begin = clock()
+            if sequence is not None:
+                if position >= len(sequence):
+                    break
+                frame = sequence[position]
+                position += 1
+            else:
+                frame = next(iterator, None)
+                if frame is None:
+                    break
+            rendered = clock()
+            writer.update(frame)
+            schedule.shown(begin, rendered, clock())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        _finish(stream)
+    return schedule.stats()
+
+
+async def run_async(
+    frames: AsyncIterable[str] | Iterable[str],
+    fps: float = 10,
+    duration: float | None = None,
+    *,
+    stream: TextIO | None = None,
+    drop: bool = True,
+    fallback_separator: str | None = None,
+) -> FrameStats:
+    """``run_adaptive`` for asyncio: ``await run_async(frames, fps=...)``.
+
+    Waits with ``asyncio.sleep`` (at least ``sleep(0)`` per frame), so other
+    tasks run between frames and while a frame is awaited. ``frames`` may
+    be an async generator, for frames built from awaited data, or any
+    iterable. Late frames are dropped as in ``run_adaptive``; frames of an
+    async source are awaited and discarded.
+    """
+    loop = asyncio.get_running_loop()
+    schedule = _Schedule(fps, duration, drop, loop.time)
+    stream = stream or sys.stdout
+    if isinstance(frames, AsyncIterable):
+        iterator: AsyncIterator[str] | None = aiter(frames)
+        sync_frames = None
+    else:
+        iterator = None
+        sync_frames = iter(frames)
+
+    async def pull() -> str | None:
+        if iterator is not None:
+            return await anext(iterator, None)
+        return next(sync_frames, None)
+
+    writer = _writer(stream, fallback_separator)
+    try:
+        while not schedule.over():
+            wait, missed = schedule.plan()
+            if missed:
+                skipped = 0
+                while skipped < missed and await pull() is not None:
+                    skipped += 1
+                schedule.skipped(missed, skipped)
+                continue
+            await asyncio.sleep(wait)
+
+            begin = loop.time()
+            frame = await pull()
+            if frame is None:
+                break
+            rendered = loop.time()
+            writer.update(frame)
+            schedule.shown(begin, rendered, loop.time())
+    finally:
+        if iterator is not None and hasattr(iterator, "aclose"):
+            await iterator.aclose()
+        _finish(stream)
+    return schedule.stats()
+
+
+class AsyncProgress:
+    """``console.progress()`` redrawn by an asyncio task instead of a thread.
+
+    Rich's auto-refresh runs a redraw thread per progress display.
+    AsyncProgress creates the display with ``auto_refresh=False`` and
+    redraws it from a task on the running loop at ``refresh_per_second``,
+    so updates from hundreds of coroutines are plain attribute writes on
+    the loop thread and nothing else touches the terminal. Tasks and
+    updates use the StyledProgress API; ``track()`` advances a task for
+    each item of an async (or plain) iterable.
+
+    Outside a terminal the display falls back to StyledProgress's text
+    output, which prints on update and needs no refreshing.
+
+    Args:
+        console: Console whose theme and policy the display uses
+        refresh_per_second: Redraws per second
+        transient: Remove the display when done
+
+    Example:
+        >>> async with AsyncProgress(console) as progress:
+        ...     task = progress.add_task("Deploying", total=len(hosts))
+        ...     await asyncio.gather(*(deploy(host, progress, task) for host in hosts))
+    """
+
+    def __init__(
+        self, console: Console, *, refresh_per_second: float = 10, transient: bool = False
+    ) -> None:
+        if refresh_per_second <= 0:
+            raise ValueError(f"refresh_per_second must be positive, got {refresh_per_second}")
+        self.progress: StyledProgress = console.progress(transient=transient, auto_refresh=False)
+        self.interval = 1.0 / refresh_per_second
+        self.refreshes = 0
+        self._live = not _text_fallback(console)
+        self._task_ids: list[TaskID] = []
+        self._refresher: asyncio.Task | None = None
+
+    def refresh(self) -> None:
+        """Redraw the display now."""
+        if self._live and self._task_ids:
+            self.progress.update(self._task_ids[0], refresh=True)  # redraws every task
+            self.refreshes += 1
+
+    async def _refresh_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            self.refresh()
+
+    async def __aenter__(self) -> "AsyncProgress":
+        self.progress.__enter__()
+        self._refresher = asyncio.create_task(self._refresh_loop())
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> bool:
+        if self._refresher is not None:
+            self._refresher.cancel()
+            try:
+                await self._refresher
+            except asyncio.CancelledError:
+                pass
+            self._refresher = None
+        self.refresh()  # final state
+        return self.progress.__exit__(exc_type, exc_val, exc_tb)
+
+    def add_task(self, description: str, **options: Any) -> TaskID:
+        """Add a task (see ``StyledProgress.add_task``)."""
+        task_id = self.progress.add_task(description, **options)
+        self._task_ids.append(task_id)
+        return task_id
+
+    def update(self, task_id: TaskID, **options: Any) -> None:
+        """Update a task (see ``StyledProgress.update``)."""
+        self.progress.update(task_id, **options)
+
+    @property
+    def finished(self) -> bool:
+        """Whether every task is complete."""
+        return self.progress.finished
+
+    async def track(
+        self,
+        items: AsyncIterable[Any] | Iterable[Any],
+        description: str = "Working...",
+        total: float | None = None,
+    ) -> AsyncIterator[Any]:
+        """Yield items, advancing a new task by one for each."""
+        if total is None and hasattr(items, "__len__"):
+            total = len(items)
+        task = self.add_task(description, total=total)
+        if isinstance(items, AsyncIterable):
+            async for item in items:
+                yield item
+                self.update(task, advance=1)
+        else:
+            for item in items:
+                yield item
+                self.update(task, advance=1)
+                await asyncio.sleep(0)
+
+
+@asynccontextmanager
+async def async_progress(
+    console: Console, *, refresh_per_second: float = 10, transient: bool = False
+) -> AsyncIterator[AsyncProgress]:
+    """``async with async_progress(console) as progress:`` (see AsyncProgress)."""
+    async with AsyncProgress(
+        console, refresh_per_second=refresh_per_second, transient=transient
+    ) as progress:
+        yield progress
@@ -0,0 +1,380 @@
+"""Banner helpers shared by the performance examples.
+
+Files starting with ``_`` are skipped by ``run_examples.py``; this module is
+imported by the scripts in this directory instead of being run on its own.
+
+Provides:
+- FontCache / fonts: parsed FIGlet fonts kept in memory and in a binary cache on disk
+- figlet_lines: memoized uncolored banner layout per (text, font, width)
+- BannerCache: ``console.banner`` output memoized per (text, font, width, options)
+- BannerArt: a banner laid out once and colored per effect from cached gradient ramps
+"""
+
+import marshal
+import sys
+from collections import OrderedDict
+from collections.abc import Iterator
+from functools import lru_cache
+from io import StringIO
+from pathlib import Path
+from typing import Literal, TextIO
+
+import pyfiglet
+from _gradients import ColorSpace, RampCache, _color_line, ramps
+from _width import CACHE_DIR, CacheStats, console_width, fast_width
+
+from styledconsole import PHASE_FULL_CYCLE, Console, EffectSpec, get_border_style
+from styledconsole.core.styles import get_border_chars
+from styledconsole.effects import EFFECTS
+from styledconsole.effects.resolver import get_target_filter
+from styledconsole.utils.text import strip_ansi, truncate_to_width, visual_width
+
+# FigletFont attributes the rendering engine reads, in serialization order
+_FONT_FIELDS = ("chars", "width", "height", "hardBlank", "printDirection", "smushMode", "comment")
+
+
+class _CachedFont(pyfiglet.FigletFont):
+    """FigletFont whose glyph tables come from the cache instead of the font file.
+
+    Built through FigletFont's own constructor; only its two loading steps
+    are replaced.
+    """
+
+    def __init__(self, font: str, fields: tuple) -> None:
+        self._fields = fields
+        super().__init__(font)
+
+    @classmethod
+    def preloadFont(cls, font: str) -> str:
+        return ""  # raw font file; only needed while parsing
+
+    def loadFont(self) -> None:
+        for name, value in zip(_FONT_FIELDS, self._fields, strict=True):
+            setattr(self, name, value)
+
+
+class _CachedFiglet(pyfiglet.Figlet):
+    """Figlet that takes its font from a FontCache instead of loading the file."""
+
+    def __init__(self, fonts: "FontCache", font: str, width: int) -> None:
+        self._fonts = fonts
+        super().__init__(font=font, width=width)
+
+    def setFont(self, **kwargs: str) -> None:
+        if "font" in kwargs:
+            self.font = kwargs["font"]
+        self.Font = self._fonts.get(self.font)
+
+
+class FontCache:
+    """Parsed FIGlet fonts, kept in memory and optionally on disk.
+
+    pyfiglet reads the font file and parses every glyph with regular
+    expressions each time a font is loaded (a few milliseconds per font,
+    paid again by every new process). FontCache keeps parsed fonts per
+    process and, with ``disk=True``, stores the parsed glyph tables as a
+    marshal file next to the other example caches, keyed by pyfiglet and
+    Python version, so later processes skip the parse.
+
+    Only the glyph tables are cached; fonts and renderers are built through
+    pyfiglet's constructors. If a parsed font doesn't have exactly the
+    attributes the cache stores (a pyfiglet release that changed them),
+    the disk cache is switched off and fonts are parsed as usual.
+
+    Args:
+        disk: Read and write the on-disk cache
+        cache_dir: Directory for the cache files
+
+    Example:
+        >>> fonts = FontCache()
+        >>> fonts.get("slant") is fonts.get("slant")
+        True
+    """
+
+    MAGIC = b"SCFF2"
+
+    def __init__(self, disk: bool = True, cache_dir: Path = CACHE_DIR) -> None:
+        self.disk = disk
+        self.cache_dir = cache_dir
+        self._fonts: dict[str, pyfiglet.FigletFont] = {}
+        self.parsed = 0  # fonts parsed from the font file
+        self.loaded = 0  # fonts read from the disk cache
+
+    def cache_path(self, font: str) -> Path:
+        """Disk cache file for a font, the installed pyfiglet and this Python (marshal format)."""
+        python = f"py{sys.version_info.major}{sys.version_info.minor}"
+        return self.cache_dir / f"figlet-{font}-pyfiglet{pyfiglet.__version__}-{python}.bin"
+
+    def _load(self, font: str) -> pyfiglet.FigletFont | None:
+        try:
+            data = self.cache_path(font).read_bytes()
+            if not data.startswith(self.MAGIC):
+                return None
+            fields = marshal.loads(data[len(self.MAGIC) :])
+            return _CachedFont(font, fields)
+        except (OSError, ValueError, EOFError, TypeError):
+            return None
+
+    def _store(self, font: str, parsed: pyfiglet.FigletFont) -> None:
+        if set(vars(parsed)) - {"font", "data"} != set(_FONT_FIELDS):
+            self.disk = False  # pyfiglet's font layout changed: don't cache what we can't rebuild
+            return
+        fields = tuple(getattr(parsed, name) for name in _FONT_FIELDS)
+        try:
+            path = self.cache_path(font)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(self.MAGIC + marshal.dumps(fields))
+        except OSError:
+            pass  # Read-only home or sandbox: keep the in-memory font
+
+    def get(self, font: str) -> pyfiglet.FigletFont:
+        """Return a parsed font.
+
+        Raises:
+            pyfiglet.FontNotFound: If no font with that name is installed
+        """
+        parsed = self._fonts.get(font)
+        if parsed is not None:
+            return parsed
+        parsed = self._load(font) if self.disk else None
+        if parsed is not None:
+            self.loaded += 1
+        else:
+            parsed = pyfiglet.FigletFont(font)
+            self.parsed += 1
+            if self.disk:
+                self._store(font, parsed)
+        self._fonts[font] = parsed
+        return parsed
+
+    def figlet(self, font: str, width: int = 1000) -> pyfiglet.Figlet:
+        """A Figlet renderer using the cached font (no file access)."""
+        return _CachedFiglet(self, font, width)
+
+    def clear(self, disk: bool = False) -> None:
+        """Drop the in-memory fonts (and the disk cache files with ``disk=True``)."""
+        if disk:
+            for font in self._fonts:
+                self.cache_path(font).unlink(missing_ok=True)
+        self._fonts.clear()
+        self.parsed = self.loaded = 0
+
+
+# Shared by figlet_lines and the banner examples
+fonts = FontCache()
+
+
+@lru_cache(maxsize=32)
+def _figlet(font: str) -> pyfiglet.Figlet:
+    # Same layout width as the library's cached Figlet instances
+    return fonts.figlet(font, width=1000)
+
+
+@lru_cache(maxsize=256)
+def figlet_lines(text: str, font: str = "standard", width: int | None = None) -> tuple[str, ...]:
+    """Uncolored banner lines, as ``console.banner`` lays them out.
+
+    Same steps as the library: text with emoji (or an unknown font) falls
+    back to the plain text, trailing blank lines are dropped and lines
+    wider than ``width`` are cut without an ellipsis.
+    """
+    clean = strip_ansi(text)
+    if visual_width(clean) > len(clean):
+        lines = [text]
+    else:
+        try:
+            lines = _figlet(font).renderText(text).rstrip("\n").split("\n")
+        except Exception:
+            lines = [text]  # the library falls back the same way on font errors
+    if width:
+        lines = [
+            truncate_to_width(line, width, suffix="") if visual_width(line) > width else line
+            for line in lines
+        ]
+    return tuple(lines)
+
+
+class BannerCache:
+    """``console.banner`` output memoized per (text, font, width, options).
+
+    The first request renders the banner through a capture Console built
+    with ``console_options``; later requests for the same header return
+    the stored string. Reports that print one banner per section lay each
+    one out once per process.
+
+    Args:
+        maxsize: Maximum number of banners kept (least recently used go first)
+        **console_options: ``Console`` arguments for rendering (width, policy, theme)
+
+    Example:
+        >>> banners = BannerCache.for_console(console)
+        >>> banners.print("SECTION 1", font="slant")
+    """
+
+    def __init__(self, maxsize: int = 64, **console_options) -> None:
+        if maxsize <= 0:
+            raise ValueError(f"maxsize must be positive, got {maxsize}")
+        self.maxsize = maxsize
+        self.console_options = console_options
+        self._banners: OrderedDict[tuple, str] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @classmethod
+    def for_console(
+        cls, console: Console, maxsize: int = 64, *, width: int | None = None
+    ) -> "BannerCache":
+        """Cache banners as they would print on ``console``.
+
+        Pass ``width`` when the console was created with ``Console(width=...)``.
+        """
+        return cls(maxsize, width=console_width(console, width), policy=console.policy)
+
+    def render(self, text: str, *, font: str = "standard", width: int | None = None, **options) -> str:
+        """Return ``console.banner(text, font=font, width=width, **options)`` output."""
+        key = (text, font, width, tuple(sorted(options.items())))
+        banner = self._banners.get(key)
+        if banner is not None:
+            self._hits += 1
+            self._banners.move_to_end(key)
+            return banner
+
+        self._misses += 1
+        buffer = StringIO()
+        Console(file=buffer, **self.console_options).banner(text, font=font, width=width, **options)
+        banner = self._banners[key] = buffer.getvalue()
+        if len(self._banners) > self.maxsize:
+            self._banners.popitem(last=False)
+            self._evictions += 1
+        return banner
+
+    def print(self, text: str, *, file: TextIO | None = None, **options) -> None:
+        """Write a (cached) banner to ``file`` (default: stdout)."""
+        stream = file or sys.stdout
+        stream.write(self.render(text, **options))
+
+    def clear(self) -> None:
+        """Drop all banners and reset the counters."""
+        self._banners.clear()
+        self._hits = self._misses = self._evictions = 0
+
+    def stats(self) -> CacheStats:
+        """Return a snapshot of the cache counters."""
+        return CacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            size=len(self._banners),
+            maxsize=self.maxsize,
+        )
+
+    def __len__(self) -> int:
+        return len(self._banners)
+
+
+class BannerArt:
+    """A banner laid out once and colored per effect.
+
+    ``console.banner(effect=...)`` lays the text out, colors it and wraps it
+    in the border on every call, and only uses the effect's colors (one
+    color per line, no phase or direction). BannerArt splits the work: the
+    uncolored glyph matrix (figlet_lines plus the optional border, rendered
+    with ``render_frame``) is built once, and ``render()`` colors it from a
+    RampCache ramp, honoring the effect's direction, phase and target.
+    Animating the phase only repeats the coloring pass, and ramps for phases
+    already seen come from the cache.
+
+    Bordered banners are colored like ``render_frame(effect=...)`` (top and
+    bottom rows count as border); without a border every glyph row is
+    content.
+
+    Args:
+        console: Console whose width and color policy the banner is laid out for
+        text: Banner text
+        font: FIGlet font name
+        border: Optional border style
+        width: Fixed frame width for bordered banners (None for auto)
+        align: Alignment on screen, as in ``console.banner``
+        padding: Horizontal padding inside the border
+        screen_width: The ``Console(width=...)`` value, if the console has one
+
+    Example:
+        >>> art = BannerArt(console, "LIVE", font="slant")
+        >>> frames = [art.render(EffectSpec.rainbow(phase=i / 30)) for i in range(30)]
+    """
+
+    def __init__(
+        self,
+        console: Console,
+        text: str,
+        *,
+        font: str = "standard",
+        border: str | None = None,
+        width: int | None = None,
+        align: Literal["left", "center", "right"] = "center",
+        padding: int = 1,
+        screen_width: int | None = None,
+    ) -> None:
+        self.console = console
+        screen = console_width(console, screen_width)
+        glyphs = list(figlet_lines(text, font, screen - 4 if border else screen))
+        if border:
+            frame = console.render_frame(
+                glyphs, border=border, width=width, align=align if width else "left", padding=padding
+            )
+            self.lines = tuple(frame.split("\n"))
+            self._border_chars = get_border_chars(get_border_style(border))
+        else:
+            self.lines = tuple(glyphs)
+            self._border_chars: set[str] = set()
+        self.bordered = border is not None
+        self.cols = max(fast_width(line) for line in self.lines)
+
+        widths = [fast_width(line) for line in self.lines]
+        if align == "center":
+            self._indents = tuple(" " * max(0, (screen - w) // 2) for w in widths)
+        elif align == "right":
+            self._indents = tuple(" " * max(0, screen - w) for w in widths)
+        else:
+            self._indents = ("",) * len(self.lines)
+
+    def render(
+        self,
+        effect: EffectSpec | str | None = None,
+        *,
+        color_space: ColorSpace = "truecolor",
+        cache: RampCache | None = None,
+    ) -> str:
+        """Color the glyph matrix with an effect and align it (no trailing newline)."""
+        if effect is None or not self.console.policy.color:
+            lines = self.lines
+        else:
+            spec = EFFECTS.get(effect) if isinstance(effect, str) else effect
+            rows = len(self.lines)
+            ramp = (cache if cache is not None else ramps).get(
+                spec, rows=rows, cols=self.cols, color_space=color_space
+            )
+            target = get_target_filter(spec.target)
+            last = rows - 1
+            lines = [
+                _color_line(
+                    line,
+                    ramp,
+                    target,
+                    self._border_chars,
+                    row,
+                    self.bordered and (row == 0 or row == last),
+                )
+                for row, line in enumerate(self.lines)
+            ]
+        return "\n".join(indent + line for indent, line in zip(self._indents, lines, strict=True))
+
+    def frames(
+        self, effect: EffectSpec | str, *, steps: int = 30, cycles: int = 1, **options
+    ) -> Iterator[str]:
+        """Frames cycling the effect's phase ``steps`` times per cycle, for ``Animation.run``."""
+        spec = EFFECTS.get(effect) if isinstance(effect, str) else effect
+        for index in range(steps * cycles):
+            phase = (spec.phase + (index % steps) * PHASE_FULL_CYCLE / steps) % PHASE_FULL_CYCLE
+            yield self.render(spec.with_phase(phase), **options)
@@ -0,0 +1,526 @@
+"""Frame rendering helpers shared by the performance examples.
+
+Files starting with ``_`` are skipped by ``run_examples.py``; this module is
+imported by the scripts in this directory instead of being run on its own.
+
+Provides:
+- BorderTemplates: per-width cache of prebuilt border strings for a BorderStyle
+- get_templates: one shared BorderTemplates per border style
+- BorderTemplates.render_lines: a whole frame body in one call
+- FrameLayout: a Console.render_frame specification compiled once, filled per render
+- FrameDiffer: in-place redraws that rewrite only the lines that changed
+- run_diffed: Animation.run counterpart built on FrameDiffer
+"""
+
+import re
+import sys
+import time
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import TextIO
+
+from _width import WidthCache, visual_widths
+
+from styledconsole import BorderStyle, Console, get_border_style
+from styledconsole.types import AlignType
+from styledconsole.utils.color import colorize_text
+from styledconsole.utils.text import (
+    adjust_emoji_spacing_in_text,
+    normalize_content,
+    render_markup_to_ansi,
+    truncate_to_width,
+)
+
+# Frame content repeats between redraws; shared by every BorderTemplates
+content_widths = WidthCache(maxsize=4096)
+
+
+@dataclass
+class _WidthTemplates:
+    """Prebuilt strings for one (style, width) pair."""
+
+    top: str
+    bottom: str
+    divider: str
+    empty_line: str
+    blank: str  # inner_width spaces; sliced for padding
+    titled_tops: OrderedDict[str, str] = field(default_factory=OrderedDict)
+
+
+class BorderTemplates:
+    """Caching front-end for a BorderStyle's ``render_*`` methods.
+
+    The library rebuilds every horizontal run on each call. This class keeps
+    the plain top/bottom borders, the divider, the empty content line and the
+    titled top borders for each width it has seen, so redrawing a frame at the
+    same width only has to splice content between two vertical bars.
+
+    Output is identical to the wrapped style's ``render_*`` methods.
+
+    Args:
+        style: Border style to wrap
+        max_widths: Number of distinct widths to keep (least recently used
+            widths are dropped first)
+        max_titles: Titled top borders kept per width
+
+    Example:
+        >>> solid = BorderTemplates(SOLID)
+        >>> solid.render_top_border(20, "Title") == SOLID.render_top_border(20, "Title")
+        True
+    """
+
+    def __init__(self, style: BorderStyle, max_widths: int = 32, max_titles: int = 32) -> None:
+        self.style = style
+        self.max_widths = max_widths
+        self.max_titles = max_titles
+        self._by_width: OrderedDict[int, _WidthTemplates] = OrderedDict()
+        # THICK draws its bottom edge with the lower half block (see BorderStyle)
+        self._bottom_char = (
+            "▄" if style.name == "thick" and style.horizontal == "▀" else style.horizontal
+        )
+
+    def _templates(self, width: int) -> _WidthTemplates:
+        """Return (building if needed) the templates for a width."""
+        templates = self._by_width.get(width)
+        if templates is not None:
+            self._by_width.move_to_end(width)
+            return templates
+
+        style = self.style
+        inner = width - 2
+        templates = _WidthTemplates(
+            top=style.top_left + style.horizontal * inner + style.top_right,
+            bottom=style.bottom_left + self._bottom_char * inner + style.bottom_right,
+            divider=style.left_joint + style.horizontal * inner + style.right_joint,
+            empty_line=style.vertical + " " * inner + style.vertical,
+            blank=" " * max(inner, 0),
+        )
+        self._by_width[width] = templates
+        if len(self._by_width) > self.max_widths:
+            self._by_width.popitem(last=False)
+        return templates
+
+    def render_top_border(self, width: int, title: str | None = None) -> str:
+        """Cached ``BorderStyle.render_top_border``."""
+        templates = self._templates(width)
+        if not title:
+            return templates.top
+
+        cached = templates.titled_tops.get(title)
+        if cached is None:
+            cached = self.style.render_top_border(width, title)
+            templates.titled_tops[title] = cached
+            if len(templates.titled_tops) > self.max_titles:
+                templates.titled_tops.popitem(last=False)
+        return cached
+
+    def render_bottom_border(self, width: int) -> str:
+        """Cached ``BorderStyle.render_bottom_border``."""
+        return self._templates(width).bottom
+
+    def render_divider(self, width: int) -> str:
+        """Cached ``BorderStyle.render_divider``."""
+        return self._templates(width).divider
+
+    def render_line(self, width: int, content: str = "", align: AlignType = "left") -> str:
+        """``BorderStyle.render_line`` splicing content into a cached line."""
+        vertical = self.style.vertical
+        if width < 2:
+            return vertical * width
+
+        templates = self._templates(width)
+        if not content:
+            return templates.empty_line
+
+        inner = width - 2
+        content_width = content_widths(content)
+        if content_width > inner:
+            content = truncate_to_width(content, inner)
+            content_width = content_widths(content)
+
+        padding = templates.blank[: inner - content_width]
+        if align == "center":
+            left = len(padding) // 2
+            return vertical + padding[:left] + content + padding[left:] + vertical
+        if align == "right":
+            return vertical + padding + content + vertical
+        return vertical + content + padding + vertical
+
+    def render_lines(self, width: int, lines: Iterable[str], align: AlignType = "left") -> str:
+        """Render a whole frame body, one bordered line per input line.
+
+        Equivalent to joining ``render_line(width, line, align)`` for every
+        line with newlines, but the widths are measured in one
+        ``visual_widths`` batch and the padding for every line comes from the
+        same cached blank run, so long bodies skip the per-call overhead.
+
+        Args:
+            width: Total frame width including both borders
+            lines: Content lines (without borders)
+            align: Alignment applied to every line
+
+        Returns:
+            Bordered lines joined with ``\\n`` (empty string for no lines)
+
+        Example:
+            >>> get_templates("ascii").render_lines(8, ["ab", "cd"], align="right")
+            '|    ab|\\n|    cd|'
+        """
+        lines = lines if isinstance(lines, list) else list(lines)
+        vertical = self.style.vertical
+        if width < 2:
+            return "\n".join([vertical * width] * len(lines))
+
+        inner = width - 2
+        lines, widths = _fit(lines, inner)
+        blank = self._templates(width).blank
+        return "\n".join(_splice(lines, widths, inner, align, vertical, vertical, blank))
+
+
+def _fit(lines: list[str], width: int) -> tuple[list[str], Sequence[int]]:
+    """Measure lines in one batch, truncating (a copy of) any that overflow."""
+    widths = visual_widths(lines)
+    if widths and max(widths) > width:
+        lines = lines.copy()  # never truncate the caller's list in place
+        for i, line_width in enumerate(widths):
+            if line_width > width:
+                lines[i] = truncate_to_width(lines[i], width)
+                widths[i] = content_widths(lines[i])
+    return lines, widths
+
+
+def _splice(
+    lines: list[str],
+    widths: Sequence[int],
+    width: int,
+    align: AlignType,
+    head: str,
+    tail: str,
+    blank: str,
+) -> list[str]:
+    """Pad measured lines to width and wrap each in head/tail.
+
+    ``blank`` must be at least ``width`` spaces; padding is sliced from it.
+    """
+    if align == "center":
+        return [
+            head + blank[: (width - w) // 2] + line + blank[: width - w - (width - w) // 2] + tail
+            for line, w in zip(lines, widths)
+        ]
+    if align == "right":
+        return [head + blank[: width - w] + line + tail for line, w in zip(lines, widths)]
+    return [head + line + blank[: width - w] + tail for line, w in zip(lines, widths)]
+
+
+_templates_by_style: dict[str, BorderTemplates] = {}
+
+
+def get_templates(style: BorderStyle | str) -> BorderTemplates:
+    """Return the shared BorderTemplates for a style object or name.
+
+    Example:
+        >>> get_templates("rounded").render_bottom_border(10)
+        '╰────────╯'
+    """
+    if isinstance(style, str):
+        style = get_border_style(style)
+    templates = _templates_by_style.get(style.name)
+    if templates is None or templates.style is not style:
+        templates = _templates_by_style[style.name] = BorderTemplates(style)
+    return templates
+
+
+# Width-1 private-use character marking where content goes in a probe render
+_SLOT = "\ue000"
+
+# Content color opening a probe row (Console renders frame colors as truecolor)
+_TRUECOLOR_FG = re.compile(r"\x1b\[38;2;(\d+);(\d+);(\d+)m")
+
+
+@lru_cache(maxsize=4096)
+def _prepare_line(line: str) -> str:
+    """Emoji spacing and markup conversion, as render_frame applies per line.
+
+    Both steps are costly (render_markup_to_ansi spins up a Rich console),
+    and monitoring screens repeat most of their lines between renders.
+    """
+    if line.isascii() and line.isprintable() and "[" not in line and ":" not in line:
+        return line
+    return render_markup_to_ansi(adjust_emoji_spacing_in_text(line))
+
+
+@dataclass(frozen=True, slots=True)
+class FrameLayout:
+    """A ``Console.render_frame`` call compiled for reuse with new content.
+
+    ``compile()`` resolves the border style, title placement, colors, padding
+    and margins once by rendering a probe frame, and keeps the finished top
+    and bottom strings plus the prefix/suffix around each content line.
+    ``render()`` then only prepares, measures and pads the body.
+
+    Output matches ``render_frame`` with the same arguments for plain, emoji
+    and markup content. With ``content_color``, lines that carry their own
+    escapes (markup, pre-colored text) are recolored like ``render_frame``
+    does, so the color comes back after every reset inside the line; other
+    lines take the compiled path. Effects and gradients recolor every line
+    on each render and cannot be compiled; use ``render_frame`` for those.
+
+    Example:
+        >>> layout = FrameLayout.compile(Console(), width=20, title="CPU")
+        >>> layout.render("42%") == Console().render_frame("42%", title="CPU", width=20)
+        True
+    """
+
+    width: int
+    content_width: int
+    align: AlignType
+    top: str  # top margin and top border
+    bottom: str  # bottom border and bottom margin
+    head: str  # left margin, left border, content color and left padding
+    tail: str  # right padding, color reset and right border
+    blank: str
+    left: str  # left margin and left border, without the content color
+    right: str  # right border
+    padding: str
+    content_color: str | None  # resolved "#rrggbb" when the content is colored
+
+    @classmethod
+    def compile(
+        cls,
+        console: Console,
+        *,
+        width: int,
+        title: str | None = None,
+        border: str = "solid",
+        padding: int = 1,
+        align: AlignType = "left",
+        margin: int | tuple[int, int, int, int] = 0,
+        content_color: str | None = None,
+        border_color: str | None = None,
+        title_color: str | None = None,
+    ) -> "FrameLayout":
+        """Resolve a frame specification once.
+
+        Arguments match ``Console.render_frame``, except that ``width`` is
+        required: an auto-sized frame depends on its content.
+
+        Raises:
+            ValueError: If the alignment is invalid or no content fits
+        """
+        if align not in ("left", "center", "right"):
+            raise ValueError(f"Invalid alignment: {align}")
+        content_width = width - 2 - 2 * padding
+        if content_width < 1:
+            raise ValueError(f"Frame width {width} leaves no room for content")
+
+        probe = console.render_frame(
+            _SLOT,
+            title=title,
+            border=border,
+            width=width,
+            padding=padding,
+            margin=margin,
+            content_color=content_color,
+            border_color=border_color,
+            title_color=title_color,
+        ).split("\n")
+        row = next(i for i, line in enumerate(probe) if _SLOT in line)
+        head, after = probe[row].split(_SLOT)
+
+        # The same row without the content color gives the bare borders
+        bare = console.render_frame(
+            _SLOT,
+            title=title,
+            border=border,
+            width=width,
+            padding=padding,
+            margin=margin,
+            border_color=border_color,
+            title_color=title_color,
+        ).split("\n")[row]
+        bare_head, bare_after = bare.split(_SLOT)
+        left = bare_head[: len(bare_head) - padding]
+        color = _TRUECOLOR_FG.match(head, len(left))
+        return cls(
+            width=width,
+            content_width=content_width,
+            align=align,
+            top="\n".join(probe[:row]),
+            bottom="\n".join(probe[row + 1 :]),
+            head=head,
+            tail=after[content_width - 1 :],
+            blank=" " * content_width,
+            left=left,
+            right=bare_after[content_width - 1 + padding :],
+            padding=" " * padding,
+            content_color="#%02x%02x%02x" % tuple(map(int, color.groups())) if color else None,
+        )
+
+    def render_body(self, content: str | list[str]) -> list[str]:
+        """Render only the content rows (head + padded line + tail each)."""
+        lines = [_prepare_line(line) for line in normalize_content(content)]
+        lines, widths = _fit(lines, self.content_width)
+        if self.content_color is None or not any("\x1b" in line for line in lines):
+            return _splice(
+                lines, widths, self.content_width, self.align, self.head, self.tail, self.blank
+            )
+        bodies = _splice(lines, widths, self.content_width, self.align, "", "", self.blank)
+        return [
+            self.left + self._recolor(body) + self.right
+            if "\x1b" in line
+            else self.head + body + self.tail
+            for line, body in zip(lines, bodies)
+        ]
+
+    def _recolor(self, body: str) -> str:
+        """Padded line with escapes in the content color, as render_frame colors it."""
+        return colorize_text(self.padding + body + self.padding, self.content_color)
+
+    def render(self, content: str | list[str]) -> str:
+        """Render the compiled frame around new content."""
+        return "\n".join([self.top, *self.render_body(content), self.bottom])
+
+
+# Cursor control sequences (same ones Animation uses)
+HIDE_CURSOR = "\033[?25l"
+SHOW_CURSOR = "\033[?25h"
+ERASE_LINE_END = "\033[K"
+ERASE_BELOW = "\033[J"
+
+
+class FrameDiffer:
+    """Redraw a multi-line block in place, rewriting only changed lines.
+
+    ``Animation`` moves the cursor back to the top of the previous frame and
+    writes the whole new frame. FrameDiffer remembers the previous frame's
+    lines and emits cursor movements to skip unchanged ones, so a dashboard
+    where one counter ticks sends one line instead of the whole block.
+
+    The cursor is expected to stay where the previous update left it: at the
+    start of the line below the block. Nothing else may write to the stream
+    between updates.
+
+    Args:
+        stream: Where ``update()`` writes (defaults to ``sys.stdout``)
+
+    Example:
+        >>> differ = FrameDiffer()
+        >>> differ.diff("a\\nb\\n")
+        'a\\x1b[K\\nb\\x1b[K\\n'
+        >>> differ.diff("a\\nc\\n")
+        '\\x1b[1Ac\\x1b[K\\n'
+    """
+
+    def __init__(self, stream: TextIO | None = None) -> None:
+        self.stream = stream
+        self._previous: list[str] = []
+        self.bytes_written = 0
+        self.lines_written = 0
+
+    def diff(self, frame: str) -> str:
+        """Return the output that turns the previous frame into this one.
+
+        Also records this frame as the new previous frame.
+        """
+        lines = frame.removesuffix("\n").split("\n")
+        previous = self._previous
+        out: list[str] = []
+        row = len(previous)  # cursor row, relative to the top of the block
+
+        for i, line in enumerate(lines):
+            if i < len(previous) and line == previous[i]:
+                continue
+            if i < row:
+                out.append(f"\033[{row - i}A")
+            elif i > row:
+                out.append(f"\033[{i - row}B")
+            out.append(line + ERASE_LINE_END + "\n")
+            row = i + 1
+            self.lines_written += 1
+
+        if row < len(lines):
+            out.append(f"\033[{len(lines) - row}B")
+        elif row > len(lines):
+            out.append(f"\033[{row - len(lines)}A")
+        if len(lines) < len(previous):
+            out.append(ERASE_BELOW)
+
+        self._previous = lines
+        return "".join(out)
+
+    def update(self, frame: str) -> None:
+        """Write the diff for frame to the stream."""
+        output = self.diff(frame)
+        if output:
+            stream = self.stream or sys.stdout
+            stream.write(output)
+            stream.flush()
+            self.bytes_written += len(output.encode("utf-8"))
+
+    def reset(self) -> None:
+        """Forget the previous frame; the next update draws in full."""
+        self._previous = []
+
+
+class _FallbackWriter:
+    """Animation's non-terminal output: ``\\r`` for one-line frames, else a separator."""
+
+    def __init__(self, stream: TextIO, separator: str | None) -> None:
+        self.stream = stream
+        self.separator = separator
+        self._single_line: bool | None = None
+        self._first = True
+
+    def update(self, frame: str) -> None:
+        if self._single_line is None:
+            self._single_line = "\n" not in frame.rstrip("\n")
+        if self._single_line:
+            self.stream.write("\r" + frame.rstrip("\n"))
+        else:
+            if not self._first and self.separator != "":
+                self.stream.write((self.separator if self.separator is not None else "---") + "\n")
+            self.stream.write(frame)
+        self.stream.flush()
+        self._first = False
+
+
+def run_diffed(
+    frames: Iterator[str],
+    fps: int = 10,
+    duration: float | None = None,
+    *,
+    stream: TextIO | None = None,
+) -> FrameDiffer:
+    """Play frames like ``Animation.run``, rewriting only changed lines.
+
+    When the stream is not a terminal, cursor movement is meaningless, so
+    frames are written to it the way ``Animation.run`` falls back: ``\\r``
+    for one-line frames, a separator between multi-line ones.
+
+    Returns:
+        The FrameDiffer used, for its ``bytes_written``/``lines_written``
+        (nothing is counted in the fallback)
+    """
+    stream = stream or sys.stdout
+    differ = FrameDiffer(stream)
+    tty = stream.isatty()
+    writer = differ if tty else _FallbackWriter(stream, None)
+
+    delay = 1.0 / fps
+    start_time = time.time()
+    try:
+        if tty:
+            stream.write(HIDE_CURSOR)
+        for frame in frames:
+            if duration and (time.time() - start_time > duration):
+                break
+            writer.update(frame)
+            time.sleep(delay)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stream.write(SHOW_CURSOR if tty else "\n")
+        stream.flush()
+    return differ
@@ -0,0 +1,562 @@
+"""Gradient helpers shared by the performance examples.
+
+Files starting with ``_`` are skipped by ``run_examples.py``; this module is
+imported by the scripts in this directory instead of being run on its own.
+
+Provides:
+- GradientRamp / RampCache: resolved SGR colors per (stops, length, color space, direction)
+- color_grid: every cell color of an effect at once (NumPy when installed, else pure Python)
+- apply_ramp: color frame lines from a ramp without going through Rich
+- render_gradient_frame: ``Console.render_frame(effect=...)`` backed by the ramp cache
+- PhaseCycle: every phase step of an animated effect precomputed for one frame layout
+"""
+
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Literal
+
+from _frames import FrameLayout
+from _width import CacheStats, fast_split_graphemes, fast_width
+from rich.color import Color, ColorSystem
+
+from styledconsole import PHASE_FULL_CYCLE, Console, EffectSpec, get_border_style
+from styledconsole.core.styles import get_border_chars
+from styledconsole.effects import EFFECTS
+from styledconsole.effects.engine import apply_gradient
+from styledconsole.effects.resolver import get_target_filter, resolve_effect
+from styledconsole.effects.strategies import TargetFilter
+from styledconsole.utils.color import NEON_RAINBOW_COLORS, RAINBOW_COLORS, parse_color
+
+try:
+    import numpy as np
+except ImportError:  # optional: color_grid falls back to the library's strategies
+    np = None
+
+ColorSpace = Literal["truecolor", "256", "standard"]
+GridEngine = Literal["auto", "numpy", "python"]
+
+HAS_NUMPY = np is not None
+
+_COLOR_SYSTEMS: dict[str, ColorSystem] = {
+    "truecolor": ColorSystem.TRUECOLOR,
+    "256": ColorSystem.EIGHT_BIT,
+    "standard": ColorSystem.STANDARD,
+}
+
+RESET = "\x1b[0m"
+
+
+@lru_cache(maxsize=4096)
+def color_sgr(hex_color: str, color_space: ColorSpace = "truecolor") -> str:
+    """Foreground SGR sequence for a hex color, as Rich emits it.
+
+    Example:
+        >>> color_sgr("#00e2ff")
+        '\\x1b[38;2;0;226;255m'
+        >>> color_sgr("#00e2ff", "256")
+        '\\x1b[38;5;45m'
+    """
+    color = Color.parse(hex_color)
+    if color_space != "truecolor":
+        color = color.downgrade(_COLOR_SYSTEMS[color_space])
+    return f"\x1b[{';'.join(color.get_ansi_codes(foreground=True))}m"
+
+
+def effect_stops(effect: EffectSpec) -> tuple:
+    """Everything about an effect that decides its colors.
+
+    Direction and target are left out: direction is part of the ramp key on
+    its own, and the target only decides which cells are colored.
+    """
+    return (
+        effect.name,
+        effect.colors,
+        effect.saturation,
+        effect.brightness,
+        effect.reverse,
+        effect.neon,
+        effect.phase,
+    )
+
+
+@dataclass(frozen=True)
+class GradientRamp:
+    """Resolved colors for one effect at one frame size.
+
+    Vertical ramps hold one SGR sequence per row, horizontal ramps one per
+    column and diagonal ramps one per cell (row-major), so looking up a
+    cell's color is a single tuple index.
+    """
+
+    direction: str
+    rows: int
+    cols: int
+    sgr: tuple[str, ...]
+
+    def at(self, row: int, col: int) -> str:
+        """SGR sequence for the cell at (row, col)."""
+        if self.direction == "vertical":
+            return self.sgr[row]
+        if self.direction == "horizontal":
+            return self.sgr[col]
+        return self.sgr[row * self.cols + col]
+
+
+def _python_grid(
+    effect: EffectSpec, cells: list[tuple[int, int]], rows: int, cols: int
+) -> list[str]:
+    """Hex color per cell from the library's strategies (today's per-cell loop)."""
+    position, source, _target = resolve_effect(effect)
+    return [source.get_color(position.calculate(row, col, rows, cols)) for row, col in cells]
+
+
+def _numpy_supported(effect: EffectSpec) -> bool:
+    """Whether _numpy_grid reproduces the library for this effect.
+
+    Saturation/brightness adjusted rainbows go through an HSL round trip
+    per color and stay on the pure-Python path.
+    """
+    if effect.is_rainbow():
+        return effect.saturation == 1.0 and effect.brightness == 1.0
+    return len(effect.colors) >= 2
+
+
+def _numpy_grid(effect: EffectSpec, rows: int, cols: int, direction: str) -> "np.ndarray":
+    """RGB per cell, shape (cells, 3), computed with array operations.
+
+    Mirrors the library's float operations step by step (position strategy,
+    phase offset, reverse, segment lookup, Rich's blend_rgb truncation), so
+    results are identical to ``_python_grid``.
+    """
+    row_pos = np.arange(rows, dtype=np.float64) / max(rows - 1, 1)
+    col_pos = np.arange(cols, dtype=np.float64) / max(cols - 1, 1)
+    if direction == "vertical":
+        position = row_pos
+    elif direction == "horizontal":
+        position = col_pos
+    else:
+        position = ((row_pos[:, None] + col_pos[None, :]) / 2.0).ravel()
+    if effect.phase != 0.0:
+        position = np.mod(position + effect.phase, 1.0)
+    if effect.reverse:
+        position = 1.0 - position
+    position = np.clip(position, 0.0, 1.0)
+
+    if effect.is_rainbow():
+        stops = NEON_RAINBOW_COLORS if effect.neon else RAINBOW_COLORS
+        segments = len(stops) - 1
+        segment_size = 1.0 / segments
+        index = np.minimum((position / segment_size).astype(np.int64), segments - 1)
+        local = (position - index * segment_size) / segment_size
+    elif effect.is_multi_stop():
+        stops = effect.colors
+        count = len(stops)
+        offsets = np.array([i / (count - 1) for i in range(count)])
+        index = np.minimum(np.searchsorted(offsets[1:], position, side="left"), count - 2)
+        local = (position - offsets[index]) / (offsets[index + 1] - offsets[index])
+    else:
+        stops = effect.colors[:2]
+        index = np.zeros(position.shape, dtype=np.int64)
+        local = position
+
+    rgb = np.array([parse_color(color) for color in stops], dtype=np.float64)
+    local = np.clip(local, 0.0, 1.0)[:, None]
+    start = rgb[index]
+    return (start + (rgb[index + 1] - start) * local).astype(np.int64)
+
+
+def color_grid(
+    effect: EffectSpec,
+    rows: int,
+    cols: int,
+    color_space: ColorSpace = "truecolor",
+    direction: str | None = None,
+    engine: GridEngine = "auto",
+) -> tuple[str, ...]:
+    """SGR sequence for every cell of a rows x cols frame.
+
+    Row-major for diagonal gradients, one per row (vertical) or per column
+    (horizontal) otherwise. With NumPy installed the whole grid is computed
+    with array operations and only distinct colors are formatted; without it
+    (or with ``engine="python"``) each cell goes through the library's
+    position and color strategies.
+
+    Raises:
+        ValueError: If ``engine="numpy"`` is requested but NumPy is missing
+    """
+    direction = direction or effect.direction
+    if engine == "numpy" and not HAS_NUMPY:
+        raise ValueError("engine='numpy' requires NumPy to be installed")
+    use_numpy = engine != "python" and HAS_NUMPY and _numpy_supported(effect)
+
+    if not use_numpy:
+        if direction == "vertical":
+            cells = [(row, 0) for row in range(rows)]
+        elif direction == "horizontal":
+            cells = [(0, col) for col in range(cols)]
+        else:
+            cells = [(row, col) for row in range(rows) for col in range(cols)]
+        return tuple(color_sgr(color, color_space) for color in _python_grid(effect, cells, rows, cols))
+
+    rgb = _numpy_grid(effect, rows, cols, direction)
+    packed = (rgb[:, 0] << 16) | (rgb[:, 1] << 8) | rgb[:, 2]
+    unique, inverse = np.unique(packed, return_inverse=True)
+    palette = [color_sgr(f"#{int(value):06x}", color_space) for value in unique]
+    return tuple(palette[i] for i in inverse.ravel().tolist())
+
+
+def build_ramp(
+    effect: EffectSpec, rows: int, cols: int, color_space: ColorSpace = "truecolor"
+) -> GradientRamp:
+    """Resolve every color of an effect for a rows x cols frame.
+
+    Colors match the library's own strategies exactly, so a ramp reproduces
+    ``apply_gradient``.
+    """
+    sgr = color_grid(effect, rows, cols, color_space)
+    return GradientRamp(direction=effect.direction, rows=rows, cols=cols, sgr=sgr)
+
+
+class RampCache:
+    """Bounded LRU cache of GradientRamps.
+
+    Keyed on (stops, length, color space, direction), where length is the row
+    count for vertical ramps, the column count for horizontal ones and both
+    for diagonal ones, so a vertical gradient is shared by frames of any
+    width. Memory is bounded by entry count and by total cached cells
+    (diagonal ramps grow with rows x cols).
+
+    Args:
+        maxsize: Maximum number of ramps
+        max_cells: Maximum SGR sequences held across all ramps
+
+    Example:
+        >>> ramps = RampCache()
+        >>> spec = EffectSpec.gradient("cyan", "blue")
+        >>> ramps.get(spec, rows=10, cols=40) is ramps.get(spec, rows=10, cols=80)
+        True
+    """
+
+    def __init__(self, maxsize: int = 256, max_cells: int = 200_000) -> None:
+        if maxsize <= 0:
+            raise ValueError(f"maxsize must be positive, got {maxsize}")
+        self.maxsize = maxsize
+        self.max_cells = max_cells
+        self._ramps: OrderedDict[tuple, GradientRamp] = OrderedDict()
+        self._cells = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(
+        self, effect: EffectSpec, rows: int, cols: int, color_space: ColorSpace = "truecolor"
+    ) -> GradientRamp:
+        """Return the ramp for an effect and frame size, building it on a miss."""
+        direction = effect.direction
+        if direction == "vertical":
+            length: int | tuple[int, int] = rows
+        elif direction == "horizontal":
+            length = cols
+        else:
+            length = (rows, cols)
+        key = (effect_stops(effect), length, color_space, direction)
+
+        ramp = self._ramps.get(key)
+        if ramp is not None:
+            self._hits += 1
+            self._ramps.move_to_end(key)
+            return ramp
+
+        self._misses += 1
+        ramp = build_ramp(effect, rows, cols, color_space)
+        self._ramps[key] = ramp
+        self._cells += len(ramp.sgr)
+        while len(self._ramps) > 1 and (
+            len(self._ramps) > self.maxsize or self._cells > self.max_cells
+        ):
+            _key, evicted = self._ramps.popitem(last=False)
+            self._cells -= len(evicted.sgr)
+            self._evictions += 1
+        return ramp
+
+    def clear(self) -> None:
+        """Drop all ramps and reset the counters."""
+        self._ramps.clear()
+        self._cells = self._hits = self._misses = self._evictions = 0
+
+    def stats(self) -> CacheStats:
+        """Return a snapshot of the cache counters."""
+        return CacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            size=len(self._ramps),
+            maxsize=self.maxsize,
+        )
+
+    def __len__(self) -> int:
+        return len(self._ramps)
+
+
+def _color_line(
+    line: str,
+    ramp: GradientRamp,
+    target: TargetFilter,
+    border_chars: set[str],
+    row: int,
+    edge: bool,
+) -> str:
+    """Color one plain frame line; ``edge`` marks the top and bottom rows."""
+    out: list[str] = []
+    span: list[str] = []
+    span_sgr = None
+    col = 0
+    for grapheme in fast_split_graphemes(line):
+        width = fast_width(grapheme)
+        if width > 0:
+            is_border = edge or grapheme[0] in border_chars
+            if target.should_color(grapheme[0], is_border, row, col):
+                sgr = ramp.at(row, col)
+                if sgr != span_sgr:
+                    if span:
+                        out.append(span_sgr + "".join(span) + RESET)
+                    span = []
+                    span_sgr = sgr
+                span.append(grapheme)
+                col += width
+                continue
+        # Uncolored (or zero-width) grapheme: close the span
+        if span:
+            out.append(span_sgr + "".join(span) + RESET)
+            span = []
+            span_sgr = None
+        out.append(grapheme)
+        col += width
+    if span:
+        out.append(span_sgr + "".join(span) + RESET)
+    return "".join(out)
+
+
+def apply_ramp(
+    lines: list[str],
+    ramp: GradientRamp,
+    target: TargetFilter,
+    border_chars: set[str],
+) -> list[str]:
+    """Color plain frame lines from a ramp.
+
+    Same cell selection and span grouping as the library's
+    ``apply_gradient``, and the same bytes for lines without escape codes,
+    but each span is written directly instead of through a Rich console.
+    Lines must not contain ANSI codes (``render_gradient_frame`` falls back
+    to ``apply_gradient`` for those).
+    """
+    last_row = len(lines) - 1
+    return [
+        _color_line(line, ramp, target, border_chars, row, row == 0 or row == last_row)
+        for row, line in enumerate(lines)
+    ]
+
+
+# Shared by every render_gradient_frame call without an explicit cache
+ramps = RampCache()
+
+
+def render_gradient_frame(
+    console: Console,
+    content: str | list[str],
+    *,
+    effect: EffectSpec | str,
+    color_space: ColorSpace = "truecolor",
+    cache: RampCache | None = None,
+    **frame_options,
+) -> str:
+    """``console.render_frame(content, effect=effect, ...)`` using cached ramps.
+
+    The frame is rendered without the effect, then colored from a cached
+    ramp. ``frame_options`` are passed to ``render_frame`` unchanged. Frames
+    that already carry escape codes (border or content colors) are colored
+    by the library's ``apply_gradient`` instead, with the same result as
+    ``render_frame`` (always truecolor).
+    """
+    output = console.render_frame(content, **frame_options)
+    if not console.policy.color:
+        return output
+
+    spec = EFFECTS.get(effect) if isinstance(effect, str) else effect
+    border_chars = get_border_chars(get_border_style(frame_options.get("border", "solid")))
+    lines = output.splitlines()
+
+    if "\x1b" in output:
+        position, source, target = resolve_effect(spec)
+        return "\n".join(
+            apply_gradient(
+                lines,
+                position_strategy=position,
+                color_source=source,
+                target_filter=target,
+                border_chars=border_chars,
+            )
+        )
+
+    cols = max(fast_width(line) for line in lines)
+    ramp = (cache if cache is not None else ramps).get(spec, rows=len(lines), cols=cols, color_space=color_space)
+    return "\n".join(apply_ramp(lines, ramp, get_target_filter(spec.target), border_chars))
+
+
+@dataclass(frozen=True)
+class _PhaseStep:
+    """One precomputed phase: its ramp and colored border rows."""
+
+    phase: float
+    ramp: GradientRamp
+    top: tuple[str, ...]
+    bottom: tuple[str, ...]
+
+
+class PhaseCycle:
+    """An animated effect precomputed for every phase step of one frame layout.
+
+    Rainbow cycling renders ``EffectSpec.rainbow(phase=phase)`` and advances
+    the phase with ``cycle_phase()`` every frame, so the colors repeat once
+    per cycle. PhaseCycle splits one cycle into ``steps`` evenly spaced
+    phases, compiles the frame once (see FrameLayout), resolves the ramp and
+    colors the top and bottom rows of every step up front, and keeps colored
+    body rows per step. Replaying a step only splices in the body; rows whose
+    text did not change since the last cycle are reused.
+
+    Output matches ``render_gradient_frame`` with the step's phase. The
+    layout must be uncolored (no border, title or content colors) and the
+    content plain text, since the effect colors every cell itself.
+
+    Args:
+        console: Console the layout is compiled with
+        effect: Effect at step 0; later steps advance its phase
+        height: Number of content lines in every frame
+        steps: Phase steps per cycle (30 matches ``cycle_phase()``'s default speed)
+        color_space: Color system the ramps are resolved for
+        max_lines: Colored body rows kept per step
+        **layout_options: ``FrameLayout.compile`` arguments (``width`` is required)
+
+    Example:
+        >>> cycle = PhaseCycle(Console(), EffectSpec.rainbow(), height=1, width=30)
+        >>> frames = [cycle.render(f"tick {i}", step=i) for i in range(90)]
+    """
+
+    def __init__(
+        self,
+        console: Console,
+        effect: EffectSpec | str,
+        *,
+        height: int,
+        steps: int = 30,
+        color_space: ColorSpace = "truecolor",
+        max_lines: int = 256,
+        **layout_options,
+    ) -> None:
+        if height < 1:
+            raise ValueError(f"height must be positive, got {height}")
+        if steps < 1:
+            raise ValueError(f"steps must be positive, got {steps}")
+
+        self.layout = FrameLayout.compile(console, **layout_options)
+        layout = self.layout
+        if "\x1b" in layout.top + layout.head + layout.tail + layout.bottom:
+            raise ValueError("PhaseCycle needs an uncolored layout; drop the color options")
+
+        self.effect = EFFECTS.get(effect) if isinstance(effect, str) else effect
+        self.height = height
+        self.max_lines = max_lines
+        self._target = get_target_filter(self.effect.target)
+        self._border_chars = get_border_chars(
+            get_border_style(layout_options.get("border", "solid"))
+        )
+
+        top = layout.top.split("\n")
+        bottom = layout.bottom.split("\n")
+        if len(bottom) > 1 and bottom[-1] == "":
+            bottom.pop()  # render_frame(effect=...) drops the trailing newline
+        self._first = len(top)
+        self._last = len(top) + height + len(bottom) - 1
+        cols = max(fast_width(line) for line in [*top, *bottom])
+
+        self._steps: list[_PhaseStep] = []
+        for step in range(steps):
+            phase = (self.effect.phase + step * PHASE_FULL_CYCLE / steps) % PHASE_FULL_CYCLE
+            ramp = build_ramp(self.effect.with_phase(phase), self._last + 1, cols, color_space)
+            self._steps.append(
+                _PhaseStep(
+                    phase=phase,
+                    ramp=ramp,
+                    top=tuple(self._color(line, ramp, row) for row, line in enumerate(top)),
+                    bottom=tuple(
+                        self._color(line, ramp, self._last - len(bottom) + 1 + i)
+                        for i, line in enumerate(bottom)
+                    ),
+                )
+            )
+        self._rows: list[dict[tuple[int, str], str]] = [{} for _ in self._steps]
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def _color(self, line: str, ramp: GradientRamp, row: int) -> str:
+        edge = row == 0 or row == self._last
+        return _color_line(line, ramp, self._target, self._border_chars, row, edge)
+
+    @property
+    def steps(self) -> int:
+        """Number of precomputed phase steps."""
+        return len(self._steps)
+
+    def phase(self, step: int) -> float:
+        """Effect phase used for a step (steps wrap around)."""
+        return self._steps[step % len(self._steps)].phase
+
+    def render(self, content: str | list[str], step: int) -> str:
+        """Render a frame at a phase step (steps wrap around).
+
+        Raises:
+            ValueError: If content does not have ``height`` lines or carries
+                escape codes
+        """
+        index = step % len(self._steps)
+        precomputed = self._steps[index]
+        rows = self._rows[index]
+        body = self.layout.render_body(content)
+        if len(body) != self.height:
+            raise ValueError(f"Expected {self.height} content lines, got {len(body)}")
+
+        colored = []
+        for row, line in enumerate(body, start=self._first):
+            key = (row, line)
+            cached = rows.get(key)
+            if cached is None:
+                if "\x1b" in line:
+                    raise ValueError("PhaseCycle content must be plain text")
+                self._misses += 1
+                if len(rows) >= self.max_lines:
+                    self._evictions += len(rows)
+                    rows.clear()
+                cached = rows[key] = self._color(line, precomputed.ramp, row)
+            else:
+                self._hits += 1
+            colored.append(cached)
+        return "\n".join([*precomputed.top, *colored, *precomputed.bottom])
+
+    def frames(self, contents: Iterable[str | list[str]], start: int = 0) -> Iterator[str]:
+        """Render each content at successive steps, for ``Animation.run``."""
+        for step, content in enumerate(contents, start=start):
+            yield self.render(content, step)
+
+    def stats(self) -> CacheStats:
+        """Counters for colored body rows across all steps."""
+        return CacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            size=sum(len(rows) for rows in self._rows),
+            maxsize=self.max_lines * len(self._steps),
+        )
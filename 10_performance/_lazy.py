@@ -0,0 +1,162 @@
+"""Lazy loading of the styledconsole package for short-lived scripts.
+
+Files starting with ``_`` are skipped by ``run_examples.py``; this module is
+imported by the scripts in this directory instead of being run on its own.
+
+``import styledconsole`` runs the package ``__init__``, which imports every
+submodule: effects and presets, banner fonts, the emoji tables, animation,
+export and Rich. ``install()`` puts a package module in ``sys.modules`` in
+its place whose top-level names resolve through a module-level
+``__getattr__`` (PEP 562): ``from styledconsole import Console`` imports
+``styledconsole.console`` and what it needs, and nothing else.
+
+Which submodule defines each top-level name is read from the installed
+package once (in a child process) and cached on disk per package build.
+
+Provides:
+- install: make ``import styledconsole`` lazy for the rest of the process
+- export_map: where each top-level name of the installed package is defined
+- is_lazy: whether ``styledconsole`` is still the lazy package
+"""
+
+import importlib
+import json
+import os
+import subprocess
+import sys
+from importlib.util import find_spec
+from pathlib import Path
+from types import ModuleType
+
+PACKAGE = "styledconsole"
+
+# Same directory as _width.CACHE_DIR; _width itself imports styledconsole
+CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "styledconsole-examples"
+)
+
+# Run in a child process: lists where each public name of the package lives
+_EXPORT_SCRIPT = """
+import json, sys, types
+import styledconsole as package
+submodules = sorted((n for n in sys.modules if n.startswith("styledconsole.")), key=len)
+exports = {}
+for name in dir(package):
+    if name.startswith("_"):
+        continue
+    value = getattr(package, name)
+    if isinstance(value, types.ModuleType):
+        exports[name] = [value.__name__, None]
+        continue
+    owner = next((s for s in submodules if getattr(sys.modules[s], name, None) is value), None)
+    if owner is not None:
+        exports[name] = [owner, name]
+print(json.dumps(exports))
+"""
+
+
+class _LazyPackage(ModuleType):
+    """Package module that keeps names the real ``__init__`` rebinds.
+
+    Importing a submodule binds it on its package. The real ``__init__``
+    then rebinds some of those names (``styledconsole.icons`` the module vs
+    ``icons`` the IconProvider); the lazy package ignores such bindings so
+    ``__getattr__`` resolves the name the way the real package would.
+    """
+
+    _shadowed: frozenset[str] = frozenset()
+
+    def __setattr__(self, name: str, value) -> None:
+        if isinstance(value, ModuleType) and name in self._shadowed:
+            return
+        super().__setattr__(name, value)
+
+
+def _package_spec():
+    spec = find_spec(PACKAGE)
+    if spec is None or spec.origin is None:
+        raise ModuleNotFoundError(f"No module named '{PACKAGE}'", name=PACKAGE)
+    return spec
+
+
+def export_map(cache_dir: Path = CACHE_DIR) -> dict[str, list[str | None]]:
+    """Map each public top-level name to ``[submodule, attribute]``.
+
+    The attribute is None when the name is the submodule itself (``icons``).
+
+    Names defined by the package ``__init__`` itself are left out; accessing
+    them loads the whole package. The map is keyed on the ``__init__`` file's
+    size and modification time, so upgrading the package rebuilds it.
+    """
+    init = Path(_package_spec().origin).stat()
+    path = cache_dir / f"lazy-{PACKAGE}-{init.st_size}-{init.st_mtime_ns}.json"
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        pass
+
+    result = subprocess.run(
+        [sys.executable, "-c", _EXPORT_SCRIPT], capture_output=True, text=True, check=True
+    )
+    exports = json.loads(result.stdout)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(exports, sort_keys=True), encoding="utf-8")
+    except OSError:
+        pass  # Read-only home or sandbox: rebuild next time
+    return exports
+
+
+def install() -> ModuleType:
+    """Make ``import styledconsole`` lazy; returns the package module.
+
+    Call before anything imports styledconsole (including the ``_*.py``
+    helpers that import it at load time). If the package is already
+    imported this does nothing and returns it.
+    """
+    if PACKAGE in sys.modules:
+        return sys.modules[PACKAGE]
+
+    spec = _package_spec()
+    exports = export_map()
+    package = _LazyPackage(PACKAGE)
+    package._shadowed = frozenset(
+        name for name, (owner, attribute) in exports.items() if attribute is not None
+    )
+    package.__spec__ = spec
+    package.__file__ = spec.origin
+    package.__path__ = list(spec.submodule_search_locations)
+    package.__package__ = PACKAGE
+    package.__loader__ = spec.loader
+    package.__lazy__ = True
+    package.__all__ = sorted(exports)
+
+    def load_all() -> None:
+        # Run the real __init__ in place; submodules already imported are reused
+        package.__lazy__ = False
+        package._shadowed = frozenset()
+        del package.__getattr__
+        spec.loader.exec_module(package)
+
+    def __getattr__(name: str):
+        if name.startswith("__") and name != "__version__":
+            raise AttributeError(f"module '{PACKAGE}' has no attribute '{name}'")
+        if name not in exports:
+            load_all()
+            return getattr(package, name)
+        owner, attribute = exports[name]
+        module = importlib.import_module(owner)
+        value = module if attribute is None else getattr(module, attribute)
+        setattr(package, name, value)
+        return value
+
+    package.__getattr__ = __getattr__
+    package.__dir__ = lambda: sorted({*package.__dict__, *exports})
+    sys.modules[PACKAGE] = package
+    return package
+
+
+def is_lazy() -> bool:
+    """Whether ``styledconsole`` is the lazy package and has not been fully loaded."""
+    package = sys.modules.get(PACKAGE)
+    return bool(getattr(package, "__lazy__", False))
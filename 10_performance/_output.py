@@ -0,0 +1,340 @@
+"""Terminal output helpers shared by the performance examples.
+
+Files starting with ``_`` are skipped by ``run_examples.py``; this module is
+imported by the scripts in this directory instead of being run on its own.
+
+Provides:
+- SgrCoalescer / coalesce_sgr: output-stage merging of redundant SGR sequences
+- visible_cells: what a terminal shows for a string, for comparing outputs
+- MeteredStream / MeteredConsole: Console that counts (and optionally coalesces) bytes
+"""
+
+import re
+import sys
+from dataclasses import dataclass
+from typing import TextIO
+
+from styledconsole import Console
+
+# CSI (including SGR), OSC (hyperlinks, titles), escapes with intermediate
+# bytes (ESC ( B) and two-character escapes (ESC 7, ESC =, ESC c, ESC M, ...)
+_ESCAPE = re.compile(
+    r"\x1b\[[0-9;?]*[ -/]*[@-~]"
+    r"|\x1b\][^\x07\x1b]*(?:\x07|\x1b\\)"
+    r"|\x1b[ -/]+[0-~]"
+    r"|\x1b[0-Z\\^-~]"
+)
+# The start of one of those, cut off by the end of a chunk
+_PARTIAL = re.compile(r"\x1b(?:\[[0-9;?]*[ -/]*|\][^\x07\x1b]*\x1b?|[ -/]*)\Z")
+_SGR = re.compile(r"\x1b\[([0-9;]*)m")
+
+# Attribute codes and the codes that switch them off
+_ATTRIBUTE_OFF = {
+    "22": ("1", "2"),
+    "23": ("3",),
+    "24": ("4",),
+    "25": ("5", "6"),
+    "27": ("7",),
+    "28": ("8",),
+    "29": ("9",),
+}
+# Attributes that make a space visible (underline, blink, reverse, strike)
+_VISIBLE_ON_SPACE = frozenset({"4", "5", "6", "7", "9"})
+
+
+@dataclass(frozen=True)
+class SgrState:
+    """Graphic rendition in effect: colors as SGR parameter strings."""
+
+    fg: str | None = None
+    bg: str | None = None
+    attrs: frozenset[str] = frozenset()
+
+    def params(self) -> list[str]:
+        """Parameters that set this state from a reset terminal."""
+        params = sorted(self.attrs)
+        if self.fg:
+            params.append(self.fg)
+        if self.bg:
+            params.append(self.bg)
+        return params
+
+
+DEFAULT = SgrState()
+
+
+def apply_sgr(state: SgrState | None, params: str) -> SgrState | None:
+    """Return the state after an SGR sequence, or None if it is not modelled."""
+    parts = params.split(";") if params else ["0"]
+    known = state is not None  # a reset makes an unknown state known again
+    fg, bg = (state.fg, state.bg) if state else (None, None)
+    attrs = set(state.attrs) if state else set()
+    i = 0
+    while i < len(parts):
+        code = parts[i]
+        if code in ("", "0"):
+            fg = bg = None
+            attrs.clear()
+            known = True
+        elif code in ("38", "48"):
+            size = {"2": 5, "5": 3}.get(parts[i + 1] if i + 1 < len(parts) else "")
+            if size is None or i + size > len(parts):
+                return None
+            color = ";".join(parts[i : i + size])
+            fg, bg = (color, bg) if code == "38" else (fg, color)
+            i += size
+            continue
+        elif code.isdigit() and (30 <= int(code) <= 37 or 90 <= int(code) <= 97):
+            fg = code
+        elif code.isdigit() and (40 <= int(code) <= 47 or 100 <= int(code) <= 107):
+            bg = code
+        elif code == "39":
+            fg = None
+        elif code == "49":
+            bg = None
+        elif code in ("1", "2", "3", "4", "5", "6", "7", "8", "9"):
+            attrs.add(code)
+        elif code in _ATTRIBUTE_OFF:
+            attrs.difference_update(_ATTRIBUTE_OFF[code])
+        else:
+            return None
+        i += 1
+    return SgrState(fg, bg, frozenset(attrs)) if known else None
+
+
+def _transition(current: SgrState | None, wanted: SgrState) -> str:
+    """Shortest SGR sequence that turns current into wanted."""
+    if wanted == DEFAULT:
+        return "\x1b[0m"
+    if current is not None and current.attrs <= wanted.attrs:
+        params = sorted(wanted.attrs - current.attrs)
+        if wanted.fg != current.fg:
+            params.append(wanted.fg or "39")
+        if wanted.bg != current.bg:
+            params.append(wanted.bg or "49")
+        return f"\x1b[{';'.join(params)}m"
+    return f"\x1b[{';'.join(['0', *wanted.params()])}m"
+
+
+def _space_safe(current: SgrState | None, wanted: SgrState) -> bool:
+    """Whether spaces look the same under both states (only fg differs)."""
+    return (
+        current is not None
+        and current.bg == wanted.bg
+        and not (current.attrs | wanted.attrs) & _VISIBLE_ON_SPACE
+    )
+
+
+class SgrCoalescer:
+    """Streaming optimizer that removes redundant SGR sequences.
+
+    Per-character effects emit ``color + char + reset`` for every cell. The
+    coalescer tracks the style the terminal is in and the style the text asks
+    for, and only emits a sequence when visible text needs a different style:
+    runs of the same color merge, ``reset + color`` pairs collapse into a
+    single change, and spaces whose only difference is the foreground color
+    are written without switching. The terminal shows the same cells.
+
+    State carries across ``feed()`` calls, so output can be coalesced as it
+    is written; an escape sequence cut off at the end of a write is held
+    back until the next one (``flush()`` releases it).
+    Each ``feed()`` ends with the terminal back at the default style, so text
+    written around the coalescer is never colored by it.
+
+    Example:
+        >>> SgrCoalescer().feed("\\x1b[31mA\\x1b[0m\\x1b[31mB\\x1b[0m")
+        '\\x1b[31mAB\\x1b[0m'
+    """
+
+    def __init__(self) -> None:
+        self._emitted: SgrState | None = DEFAULT  # None: unknown to us
+        self._wanted: SgrState | None = DEFAULT
+        self._pending = ""  # incomplete escape from the previous feed
+
+    def _text(self, out: list[str], chunk: str) -> None:
+        wanted = self._wanted
+        for i, line in enumerate(chunk.split("\n")):
+            if i:
+                # Never carry a background color onto the next line
+                if self._emitted is None or self._emitted.bg is not None:
+                    out.append("\x1b[0m")
+                    self._emitted = DEFAULT
+                out.append("\n")
+            if not line or wanted is None or wanted == self._emitted:
+                out.append(line)
+                continue
+            if _space_safe(self._emitted, wanted):
+                stripped = line.lstrip(" ")
+                out.append(line[: len(line) - len(stripped)])
+                if not stripped:
+                    continue
+                line = stripped
+            out.append(_transition(self._emitted, wanted))
+            self._emitted = wanted
+            out.append(line)
+
+    def feed(self, text: str) -> str:
+        """Coalesce a chunk of output."""
+        text = self._pending + text
+        self._pending = ""
+        cut = _partial_start(text)
+        if cut is not None:
+            text, self._pending = text[:cut], text[cut:]
+
+        out: list[str] = []
+        position = 0
+        for match in _ESCAPE.finditer(text):
+            self._text(out, text[position : match.start()])
+            position = match.end()
+            sgr = _SGR.fullmatch(match.group())
+            if sgr is None:
+                # Erase sequences fill with the current background: sync first
+                if self._wanted is not None and self._wanted != self._emitted:
+                    out.append(_transition(self._emitted, self._wanted))
+                    self._emitted = self._wanted
+                out.append(match.group())  # cursor movement, erase, OSC, ...
+                continue
+            wanted = apply_sgr(self._wanted, sgr.group(1))
+            if wanted is None:
+                # Not modelled: pass through and stop assuming anything
+                out.append(match.group())
+                self._emitted = None
+                self._wanted = apply_sgr(DEFAULT, sgr.group(1))
+            else:
+                self._wanted = wanted
+        self._text(out, text[position:])
+
+        if self._emitted != DEFAULT:
+            out.append("\x1b[0m")
+            self._emitted = DEFAULT
+        return "".join(out)
+
+
+    def flush(self) -> str:
+        """Release a held-back partial escape unchanged (at the end of output)."""
+        pending, self._pending = self._pending, ""
+        return pending
+
+
+def _partial_start(text: str) -> int | None:
+    """Where an escape cut off by the end of ``text`` starts, if there is one.
+
+    Only the last two ESCs can start it: an OSC cut inside its ``ESC \\``
+    terminator has one ESC before the last.
+    """
+    last = text.rfind("\x1b")
+    if last == -1:
+        return None
+    before = text.rfind("\x1b", 0, last)
+    if before != -1 and _PARTIAL.match(text, before):
+        return before
+    return last if _PARTIAL.match(text, last) else None
+
+
+def coalesce_sgr(text: str) -> str:
+    """Coalesce one complete string (see SgrCoalescer)."""
+    return SgrCoalescer().feed(text)
+
+
+def visible_cells(text: str) -> list[tuple[str, str | None, str | None, frozenset[str]]]:
+    """(char, fg, bg, attrs) for each visible character, as a terminal sees it.
+
+    For spaces only underline/blink/reverse/strike attributes are kept, and
+    the foreground only alongside them, so outputs that differ only in
+    redundant escapes compare equal.
+    """
+    cells = []
+    state: SgrState | None = DEFAULT
+    position = 0
+    for match in [*_ESCAPE.finditer(text), None]:
+        end = match.start() if match else len(text)
+        for char in text[position:end]:
+            if char == "\n":
+                cells.append((char, None, None, frozenset()))
+                continue
+            current = state or DEFAULT
+            fg, attrs = current.fg, current.attrs
+            if char == " ":
+                attrs = attrs & _VISIBLE_ON_SPACE
+                fg = fg if attrs else None
+            cells.append((char, fg, current.bg, attrs))
+        if match is None:
+            break
+        position = match.end()
+        sgr = _SGR.fullmatch(match.group())
+        if sgr:
+            state = apply_sgr(state, sgr.group(1)) or apply_sgr(DEFAULT, sgr.group(1))
+    return cells
+
+
+class MeteredStream:
+    """Text stream wrapper that counts bytes and can coalesce SGR output.
+
+    Args:
+        stream: Underlying stream (defaults to ``sys.stdout``)
+        coalesce: Run everything written through an SgrCoalescer
+    """
+
+    def __init__(self, stream: TextIO | None = None, coalesce: bool = False) -> None:
+        self.stream = stream or sys.stdout
+        self.coalescer = SgrCoalescer() if coalesce else None
+        self.bytes_in = 0
+        self.bytes_out = 0
+
+    def write(self, text: str) -> int:
+        self.bytes_in += len(text.encode("utf-8"))
+        output = self.coalescer.feed(text) if self.coalescer else text
+        self.bytes_out += len(output.encode("utf-8"))
+        self.stream.write(output)
+        return len(text)
+
+    def flush(self) -> None:
+        """Write out anything the coalescer holds back, then flush the stream."""
+        if self.coalescer:
+            output = self.coalescer.flush()
+            self.bytes_out += len(output.encode("utf-8"))
+            self.stream.write(output)
+        self.stream.flush()
+
+    def close(self) -> None:
+        self.flush()
+        self.stream.close()
+
+    def reset_counters(self) -> None:
+        self.bytes_in = self.bytes_out = 0
+
+    def __getattr__(self, name: str):
+        # isatty, fileno, flush, encoding, ... come from the wrapped stream
+        return getattr(self.stream, name)
+
+
+class MeteredConsole(Console):
+    """Console that reports how many bytes it wrote.
+
+    Accepts every ``Console`` argument. ``bytes_written`` is what reached
+    the underlying stream; with ``coalesce=True`` redundant SGR sequences
+    are removed first and ``bytes_saved`` shows the difference.
+
+    Example:
+        >>> console = MeteredConsole(coalesce=True)
+        >>> console.frame("Hello", effect="rainbow")
+        >>> console.bytes_written, console.bytes_saved
+    """
+
+    def __init__(self, *, coalesce: bool = False, file: TextIO | None = None, **kwargs) -> None:
+        self.metered = MeteredStream(file, coalesce=coalesce)
+        super().__init__(file=self.metered, **kwargs)
+
+    @property
+    def bytes_written(self) -> int:
+        """Bytes written to the underlying stream."""
+        return self.metered.bytes_out
+
+    @property
+    def bytes_saved(self) -> int:
+        """Bytes removed by coalescing (0 without ``coalesce``)."""
+        return self.metered.bytes_in - self.metered.bytes_out
+
+    def reset_byte_count(self) -> None:
+        """Start counting from zero."""
+        self.metered.reset_counters()
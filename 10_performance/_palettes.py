@@ -0,0 +1,156 @@
+"""Palette helpers shared by the performance examples.
+
+Files starting with ``_`` are skipped by ``run_examples.py``; this module is
+imported by the scripts in this directory instead of being run on its own.
+
+This module does not import ``styledconsole`` at load time: palette data is
+read straight from the package's bundled ``palettes.json`` on first use, and
+the library is only imported when an EffectSpec is actually built.
+
+Provides:
+- PaletteRegistry / palettes: read-only palette mapping that loads its data on first access
+- palette_effect: cached EffectSpec for an effect preset or palette name
+"""
+
+import json
+from collections.abc import Iterator, Mapping
+from functools import lru_cache
+from importlib.util import find_spec
+from pathlib import Path
+from typing import TYPE_CHECKING, Literal, TypedDict
+
+if TYPE_CHECKING:
+    from styledconsole import EffectSpec
+
+
+class PaletteInfo(TypedDict):
+    """Palette metadata (same shape as ``styledconsole.PALETTES`` values)."""
+
+    colors: list[str]
+    categories: list[str]
+
+
+def bundled_palette_file() -> Path:
+    """Path of the library's palette data, found without importing it.
+
+    Raises:
+        FileNotFoundError: If styledconsole is not installed or has no palette data
+    """
+    spec = find_spec("styledconsole")
+    if spec is None or not spec.submodule_search_locations:
+        raise FileNotFoundError("styledconsole is not installed")
+    path = Path(next(iter(spec.submodule_search_locations))) / "data" / "palettes.json"
+    if not path.exists():
+        raise FileNotFoundError(f"Palette data file not found: {path}")
+    return path
+
+
+class PaletteRegistry(Mapping[str, PaletteInfo]):
+    """Read-only mapping of palette name to PaletteInfo, loaded on first access.
+
+    Drop-in for ``PALETTES`` / ``get_palette`` / ``list_palettes``: nothing
+    is read until the first lookup, and the file is parsed once.
+
+    Args:
+        path: Palette JSON file (defaults to the one bundled with styledconsole)
+
+    Example:
+        >>> registry = PaletteRegistry()
+        >>> registry.loaded
+        False
+        >>> registry.colors("beach")
+        ('#96ceb4', '#ffeead', '#ff6f69', '#ffcc5c', '#88d8b0')
+        >>> registry.loaded
+        True
+    """
+
+    def __init__(self, path: Path | str | None = None) -> None:
+        self._path = Path(path) if path is not None else None
+        self._palettes: dict[str, PaletteInfo] | None = None
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the palette data has been read yet."""
+        return self._palettes is not None
+
+    def _data(self) -> dict[str, PaletteInfo]:
+        if self._palettes is None:
+            path = self._path or bundled_palette_file()
+            self._palettes = json.loads(path.read_text(encoding="utf-8"))
+        return self._palettes
+
+    def __getitem__(self, name: str) -> PaletteInfo:
+        return self._data()[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data())
+
+    def __len__(self) -> int:
+        return len(self._data())
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._data()
+
+    def colors(self, name: str) -> tuple[str, ...]:
+        """Hex colors of a palette.
+
+        Raises:
+            ValueError: If the palette does not exist
+        """
+        palette = self._data().get(name)
+        if palette is None:
+            raise ValueError(f"Palette '{name}' not found")
+        return tuple(palette["colors"])
+
+    def names(self, category: str | None = None) -> list[str]:
+        """Sorted palette names, optionally only those in a category."""
+        data = self._data()
+        if category is None:
+            return sorted(data)
+        return sorted(name for name, info in data.items() if category in info["categories"])
+
+    def categories(self) -> dict[str, int]:
+        """Category names with palette counts."""
+        counts: dict[str, int] = {}
+        for info in self._data().values():
+            for category in info["categories"]:
+                counts[category] = counts.get(category, 0) + 1
+        return dict(sorted(counts.items()))
+
+
+# Shared registry; reads palettes.json on first access
+palettes = PaletteRegistry()
+
+
+@lru_cache(maxsize=256)
+def palette_effect(
+    name: str,
+    *,
+    direction: Literal["vertical", "horizontal", "diagonal"] = "vertical",
+    target: Literal["content", "border", "both"] = "both",
+    reverse: bool = False,
+) -> "EffectSpec":
+    """EffectSpec for an effect preset or, failing that, a palette.
+
+    Preset names win, as with ``console.frame(effect="beach")``; a palette
+    becomes a multi-stop gradient like ``EffectSpec.from_palette``. Each spec
+    is built once per argument set.
+
+    Raises:
+        ValueError: If the name is neither an effect preset nor a palette
+    """
+    # Importing styledconsole is the expensive part; only pay it for effects
+    from styledconsole import EFFECTS, EffectSpec
+
+    if name in EFFECTS:
+        spec = EFFECTS[name]
+        if direction != spec.direction:
+            spec = spec.with_direction(direction)
+        if target != spec.target:
+            spec = spec.with_target(target)
+        return spec.reversed() if reverse else spec
+    if name not in palettes:
+        raise ValueError(f"'{name}' is neither an effect preset nor a palette")
+    return EffectSpec.multi_stop(
+        colors=list(palettes.colors(name)), direction=direction, target=target, reverse=reverse
+    )
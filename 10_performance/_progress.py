@@ -0,0 +1,375 @@
+"""Progress helpers shared by the performance examples.
+
+Files starting with ``_`` are skipped by ``run_examples.py``; this module is
+imported by the scripts in this directory instead of being run on its own.
+
+Provides:
+- TaskCounter: per-task progress counter that worker threads advance without locks
+- BackgroundProgress: ``console.progress()`` fed from TaskCounters by a render thread
+- SharedProgress: BackgroundProgress whose tasks live in worker processes (shared memory)
+- attach_progress / progress_reporter: the worker-process side of SharedProgress
+"""
+
+import multiprocessing
+import sys
+import threading
+from collections import deque
+from multiprocessing.connection import Connection
+from multiprocessing.context import BaseContext
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any
+
+from rich.progress import TaskID
+
+from styledconsole import Console
+from styledconsole.core.progress import StyledProgress
+
+
+class TaskCounter:
+    """Completed-step counter for one progress task.
+
+    Each thread that calls ``advance()`` gets its own cell (a one-item
+    list) and is the only writer of it, so an increment is a thread-local
+    lookup and an in-place add: no lock, and no lost updates. Readers sum
+    the cells; a sum taken while workers run may miss increments still in
+    flight, never count one twice.
+    """
+
+    __slots__ = ("task_id", "total", "_base", "_cells", "_local")
+
+    def __init__(self, task_id: TaskID, total: float | None = None, completed: float = 0) -> None:
+        self.task_id = task_id
+        self.total = total
+        self._base = completed  # set by the render thread on update(completed=...)
+        self._cells: list[list[float]] = []
+        self._local = threading.local()
+
+    def advance(self, amount: float = 1) -> None:
+        """Add ``amount`` completed steps (safe from any thread)."""
+        try:
+            self._local.cell[0] += amount
+        except AttributeError:
+            cell = self._local.cell = [amount]
+            self._cells.append(cell)  # list.append is atomic
+
+    def counted(self) -> float:
+        """Steps added with ``advance()`` so far, across all threads."""
+        return sum(cell[0] for cell in list(self._cells))
+
+    @property
+    def completed(self) -> float:
+        """Completed steps: the last absolute value set plus everything advanced since."""
+        return self._base + self.counted()
+
+
+def _text_fallback(console: Console) -> bool:
+    """Whether ``console.progress()`` prints text lines instead of a live display.
+
+    The test StyledProgress makes: stdout isn't a terminal and the policy
+    has no color, or the policy has no unicode (TERM=dumb).
+    """
+    policy = console.policy
+    return (not sys.stdout.isatty() and not policy.color) or not policy.unicode
+
+
+class BackgroundProgress:
+    """``console.progress()`` with lock-free updates and a render thread.
+
+    StyledProgress.update() goes into Rich's Progress, which takes a lock
+    and updates the task's speed samples on every call, on the worker's
+    thread. Here ``add_task()`` returns a TaskCounter; workers call
+    ``task.advance()`` (or ``progress.update(task, advance=1)``), which
+    only bumps the counter. A background thread wakes up
+    ``refresh_per_second`` times a second, sends each task's total to Rich
+    in one update and redraws: Rich is only ever called from that thread.
+
+    Other update fields (description, total, completed) are queued and
+    applied on the next refresh.
+
+    Args:
+        console: Console whose theme and policy the display uses
+        refresh_per_second: Redraws per second (the cap on Rich work)
+        transient: Remove the display when done
+
+    Example:
+        >>> with BackgroundProgress(console) as progress:
+        ...     task = progress.add_task("Ingest", total=len(records))
+        ...     for record in records:  # in any number of threads
+        ...         task.advance()
+    """
+
+    def __init__(
+        self, console: Console, *, refresh_per_second: float = 10, transient: bool = False
+    ) -> None:
+        if refresh_per_second <= 0:
+            raise ValueError(f"refresh_per_second must be positive, got {refresh_per_second}")
+        self.progress: StyledProgress = console.progress(transient=transient, auto_refresh=False)
+        self.interval = 1.0 / refresh_per_second
+        self.refreshes = 0
+        self._live = not _text_fallback(console)  # text output prints on update instead
+        self._tasks: list[TaskCounter] = []
+        self._sent: dict[TaskID, float] = {}
+        self._changes: deque[tuple[TaskCounter, dict[str, Any], float | None]] = deque()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def __enter__(self) -> "BackgroundProgress":
+        self.progress.__enter__()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="progress-render", daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> bool:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self._flush()  # final counts
+        return self.progress.__exit__(exc_type, exc_val, exc_tb)
+
+    def add_task(
+        self, description: str, *, total: float | None = 100.0, completed: float = 0, **options: Any
+    ) -> TaskCounter:
+        """Add a task and return its counter.
+
+        Call from the thread that entered the context (before starting
+        workers), like ``StyledProgress.add_task``.
+        """
+        task_id = self.progress.add_task(description, total=total, completed=completed, **options)
+        counter = TaskCounter(task_id, total, completed)
+        self._sent[task_id] = completed
+        self._tasks.append(counter)
+        return counter
+
+    def update(self, task: TaskCounter, *, advance: float | None = None, **fields: Any) -> None:
+        """``StyledProgress.update`` counterpart (safe from any thread).
+
+        ``advance`` goes straight to the counter; other fields are applied
+        by the render thread on its next refresh.
+        """
+        if advance is not None:
+            task.advance(advance)
+        if fields:
+            if "total" in fields:
+                task.total = fields["total"]
+            # completed=n is relative to the steps counted now, not at the
+            # next refresh: advances made in between must still add to n
+            base = fields["completed"] - task.counted() if "completed" in fields else None
+            self._changes.append((task, fields, base))
+
+    @property
+    def tasks(self) -> tuple:
+        """Counters of every task, in display order."""
+        return tuple(self._tasks)
+
+    @property
+    def finished(self) -> bool:
+        """Whether every task with a total has reached it."""
+        return all(task.total is None or task.completed >= task.total for task in self._tasks)
+
+    def _flush(self) -> None:
+        """Apply queued changes and counter totals, then redraw (render thread only)."""
+        while self._changes:
+            task, fields, base = self._changes.popleft()
+            if base is not None:
+                task._base = base
+                fields = {**fields, "completed": task.completed}
+            self.progress.update(task.task_id, **fields)
+            self._sent[task.task_id] = task.completed
+        for task in self._tasks:
+            completed = task.completed
+            if completed != self._sent[task.task_id]:
+                self.progress.update(task.task_id, completed=completed)
+                self._sent[task.task_id] = completed
+        if self._live and self._tasks:
+            self.progress.update(self._tasks[0].task_id, refresh=True)  # redraws every task
+        self.refreshes += 1
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self._flush()
+
+
+# Bytes per shared counter (a C double, like Rich's completed values)
+_SLOT_BYTES = 8
+
+
+class SharedTask:
+    """A progress task owned by a worker process.
+
+    ``advance()`` adds to the task's slot in the shared-memory segment: a
+    store into mapped memory, with no system call and no message. Only the
+    process that created the task writes its slot.
+    """
+
+    __slots__ = ("slot", "total", "_counts")
+
+    def __init__(self, slot: int, total: float | None, counts: memoryview) -> None:
+        self.slot = slot
+        self.total = total
+        self._counts = counts
+
+    def advance(self, amount: float = 1) -> None:
+        """Add ``amount`` completed steps."""
+        self._counts[self.slot] += amount
+
+    @property
+    def completed(self) -> float:
+        """Steps completed so far."""
+        return self._counts[self.slot]
+
+
+class ProgressReporter:
+    """Worker-process end of a SharedProgress (see ``attach_progress``)."""
+
+    def __init__(self, name: str, slots: int, lock, sender: Connection) -> None:
+        self._memory = SharedMemory(name=name)  # the parent unlinks it
+        self._counts = self._memory.buf[: (slots + 1) * _SLOT_BYTES].cast("d")
+        self._slots = slots
+        self._lock = lock
+        self._sender = sender
+
+    def add_task(self, description: str, *, total: float | None = 100.0) -> SharedTask:
+        """Claim a counter slot and announce the task to the parent (once).
+
+        Raises:
+            RuntimeError: If every slot of the segment is taken
+        """
+        with self._lock:
+            slot = int(self._counts[0]) + 1  # slot 0 holds the allocation count
+            if slot > self._slots:
+                raise RuntimeError(f"SharedProgress has no free slots (slots={self._slots})")
+            self._counts[0] = slot
+            self._counts[slot] = 0.0
+            # Sent under the lock, so messages from different workers never interleave
+            self._sender.send((slot, description, total))
+        return SharedTask(slot, total, self._counts)
+
+
+_reporter: ProgressReporter | None = None
+
+
+def attach_progress(name: str, slots: int, lock, sender: Connection) -> None:
+    """Pool initializer: connect this worker process to a SharedProgress.
+
+    Example:
+        >>> ProcessPoolExecutor(initializer=attach_progress, initargs=progress.initargs)
+    """
+    global _reporter
+    _reporter = ProgressReporter(name, slots, lock, sender)
+
+
+def progress_reporter() -> ProgressReporter:
+    """The reporter set up by ``attach_progress`` in this worker process.
+
+    Raises:
+        RuntimeError: If the process was not started with ``attach_progress``
+    """
+    if _reporter is None:
+        raise RuntimeError("Worker not attached; pass initializer=attach_progress")
+    return _reporter
+
+
+class _SlotCounter:
+    """Parent-side view of one worker task: reads its slot, never writes it."""
+
+    __slots__ = ("task_id", "slot", "total", "_counts")
+
+    def __init__(
+        self, task_id: TaskID, slot: int, total: float | None, counts: memoryview | list[float]
+    ) -> None:
+        self.task_id = task_id
+        self.slot = slot
+        self.total = total
+        self._counts = counts
+
+    @property
+    def completed(self) -> float:
+        """Last count the worker wrote."""
+        return self._counts[self.slot]
+
+
+class SharedProgress(BackgroundProgress):
+    """One progress display for tasks running in worker processes.
+
+    Funnelling every update through a ``multiprocessing.Queue`` costs a
+    pickle, a pipe write and a parent-side read per increment, and the
+    single reader becomes the bottleneck as workers are added. Here each
+    worker task gets a counter slot in a shared-memory segment:
+    ``task.advance()`` writes the slot directly, and the task's description
+    and total travel over a pipe once, when the task is created. The render
+    thread reads every slot on each refresh; updates cost it no IPC.
+
+    Start workers with ``initializer=attach_progress`` and
+    ``initargs=progress.initargs``; inside a job, create tasks with
+    ``progress_reporter().add_task(...)``. Tasks added in the parent with
+    ``add_task()`` work as in BackgroundProgress.
+
+    Args:
+        console: Console whose theme and policy the display uses
+        slots: Maximum number of worker tasks over the display's lifetime
+        refresh_per_second: Redraws per second
+        transient: Remove the display when done
+        mp_context: Multiprocessing context the workers are started with
+
+    Example:
+        >>> with SharedProgress(console) as progress:
+        ...     with ProcessPoolExecutor(initializer=attach_progress,
+        ...                              initargs=progress.initargs) as pool:
+        ...         list(pool.map(ingest, shards))
+    """
+
+    def __init__(
+        self,
+        console: Console,
+        *,
+        slots: int = 256,
+        refresh_per_second: float = 10,
+        transient: bool = False,
+        mp_context: BaseContext | None = None,
+    ) -> None:
+        if slots <= 0:
+            raise ValueError(f"slots must be positive, got {slots}")
+        super().__init__(console, refresh_per_second=refresh_per_second, transient=transient)
+        self.slots = slots
+        self._memory: SharedMemory | None = None
+        self._counts: memoryview | None = None
+        context = mp_context or multiprocessing.get_context()
+        self._lock = context.Lock()
+        self._receiver, self._sender = context.Pipe(duplex=False)
+
+    @property
+    def initargs(self) -> tuple:
+        """``attach_progress`` arguments for worker processes (inside the context only)."""
+        if self._memory is None:
+            raise RuntimeError("SharedProgress must be used as a context manager")
+        return (self._memory.name, self.slots, self._lock, self._sender)
+
+    def __enter__(self) -> "SharedProgress":
+        self._memory = SharedMemory(create=True, size=(self.slots + 1) * _SLOT_BYTES)
+        self._counts = self._memory.buf[: (self.slots + 1) * _SLOT_BYTES].cast("d")
+        return super().__enter__()
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> bool:
+        try:
+            return super().__exit__(exc_type, exc_val, exc_tb)
+        finally:
+            final = self._counts.tolist()  # worker tasks keep their last counts
+            for task in self._tasks:
+                if isinstance(task, _SlotCounter):
+                    task._counts = final
+            self._counts.release()
+            self._counts = None
+            self._memory.close()
+            self._memory.unlink()
+            self._memory = None
+
+    def _flush(self) -> None:
+        # Task announcements first, so their counters are read in this refresh
+        while self._receiver.poll():
+            slot, description, total = self._receiver.recv()
+            task_id = self.progress.add_task(description, total=total)
+            self._sent[task_id] = 0.0
+            self._tasks.append(_SlotCounter(task_id, slot, total, self._counts))
+        super()._flush()
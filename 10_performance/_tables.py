@@ -0,0 +1,952 @@
+"""Table helpers shared by the performance examples.
+
+Files starting with ``_`` are skipped by ``run_examples.py``; this module is
+imported by the scripts in this directory instead of being run on its own.
+
+Provides:
+- measure_column / fit_widths / sample_widths: StyledTable column widths, measured column by column
+- TableLayout: a StyledTable's columns, box and padding compiled for fixed column widths
+- TableGradient: GradientTable's border colors computed per cell instead of per rendered line
+- PagedTable: StyledTable / GradientTable output for very large row sources, page by page
+- TableWriter: StyledTable / GradientTable printed row by row as results arrive
+- ColumnarTable / ColumnarGradientTable: tables that store rows column by column
+"""
+
+import sys
+from array import array
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from functools import lru_cache
+from io import StringIO
+from itertools import chain, islice, zip_longest
+from typing import Any, TextIO
+
+from _gradients import RESET, ColorSpace, color_sgr
+from _width import console_width, fast_width
+from rich.color import ColorSystem
+from rich.console import Console as RichConsole
+from rich.console import ConsoleOptions, RenderResult
+from rich.cells import cell_len, set_cell_size
+from rich.measure import Measurement
+from rich.text import Text
+
+from styledconsole import Console
+from styledconsole.presets.tables import GradientTable
+from styledconsole.table import StyledTable
+from styledconsole.utils.color import parse_color
+from styledconsole.utils.sanitize import sanitize_emoji_content
+from styledconsole.utils.text import strip_ansi
+
+# What Rich puts at the end of a cell cut with overflow="ellipsis"
+ELLIPSIS = "…"
+
+# Renders markup and resolves theme styles ("table.header") the way the
+# Rich console behind Console.print does
+_rich = RichConsole(file=StringIO(), force_terminal=True, color_system="truecolor", width=10_000)
+
+
+@lru_cache(maxsize=256)
+def style_sgr(style: str) -> str:
+    """SGR prefix for a Rich style definition ("" when it sets nothing)."""
+    if not style:
+        return ""
+    codes = _rich.get_style(style)._make_ansi_codes(ColorSystem.TRUECOLOR)
+    return f"\x1b[{codes}m" if codes else ""
+
+
+@lru_cache(maxsize=4096)
+def render_markup(text: str, style: str = "", color: bool = True) -> str:
+    """One line of Rich markup as ANSI (or plain) text, memoized.
+
+    Table cells repeat a lot (status columns, icons), so each distinct
+    value is parsed and rendered once.
+    """
+    rendered = Text.from_markup(text, style=style)
+    if not color:
+        return rendered.plain
+    with _rich.capture() as capture:
+        _rich.print(rendered, end="", soft_wrap=True)
+    return capture.get()
+
+
+# Widths are measured with Rich's cell_len, not visual_width: the two disagree
+# on emoji such as VS16 sequences ("⚠️"), and StyledTable's layout is Rich's.
+def cell_width(text: str) -> int:
+    """Cells ``text`` takes in a Rich table (escape sequences take none)."""
+    return cell_len(strip_ansi(text) if "\x1b" in text else text)
+
+
+def cut_cells(text: str, width: int) -> str:
+    """``text`` cut to ``width`` cells with an ellipsis, as Rich's overflow="ellipsis"."""
+    if "\x1b" not in text:
+        return set_cell_size(text, width - 1) + ELLIPSIS
+    rendered = Text.from_ansi(text)
+    rendered.truncate(width, overflow="ellipsis")
+    with _rich.capture() as capture:
+        _rich.print(rendered, end="", soft_wrap=True)
+    return capture.get()
+
+
+def _plain_width(value: Any) -> int:
+    text = value if isinstance(value, str) else str(value)
+    return cell_len(render_markup(text, color=False) if "[" in text else text)
+
+
+def measure_column(values: Iterable[Any]) -> int:
+    """Widest value of one column, measured in one batch (markup counts as its text)."""
+    texts = [value if isinstance(value, str) else str(value) for value in values]
+    if any("[" in text for text in texts):
+        texts = [render_markup(text, color=False) if "[" in text else text for text in texts]
+    return max(map(cell_len, texts), default=0)
+
+
+def fit_widths(
+    table: StyledTable, measured: Sequence[int], max_width: int | None = None
+) -> list[int]:
+    """Column widths from measured content widths and the table's column limits.
+
+    Headers count as content when shown. Honors each column's ``width``, ``min_width``
+    and ``max_width`` like Rich. If the table would be wider than
+    ``max_width``, the widest columns are narrowed first; cells that no
+    longer fit are cut with an ellipsis.
+    """
+    widths = []
+    for column, content in zip(table.columns, measured):
+        if column.width is not None:
+            widths.append(column.width)
+            continue
+        width = max(content, _plain_width(column.header)) if table.show_header else content
+        # Same order as Rich's Measurement.clamp: max_width wins over min_width
+        if column.min_width is not None:
+            width = max(width, column.min_width)
+        if column.max_width is not None:
+            width = min(width, column.max_width)
+        widths.append(max(width, 1))
+
+    if max_width is not None:
+        excess = sum(widths) + _chrome_width(table) - max_width
+        while excess > 0:
+            widest = max(range(len(widths)), key=widths.__getitem__)
+            if widths[widest] <= 1:
+                break
+            widths[widest] -= 1
+            excess -= 1
+    return widths
+
+
+def sample_widths(
+    table: StyledTable, rows: Iterable[Sequence[Any]], max_width: int | None = None
+) -> list[int]:
+    """Column widths from the headers and the given rows (see ``fit_widths``).
+
+    Example:
+        >>> sample_widths(table, [["web-01", "23%"], ["db-primary", "5%"]])
+        [10, 3]
+    """
+    measured = [0] * len(table.columns)
+    for index, values in enumerate(zip(*rows)):
+        measured[index] = measure_column(values)
+    return fit_widths(table, measured, max_width)
+
+
+def _padding(table: StyledTable, index: int) -> tuple[int, int]:
+    """Left and right padding of a column, as Rich's ``_get_padding_width``."""
+    _top, right, _bottom, left = table.padding
+    if not table.pad_edge:
+        if index == 0:
+            left = 0
+        if index == len(table.columns) - 1:
+            right = 0
+    return left, right
+
+
+def _chrome_width(table: StyledTable) -> int:
+    """Cells a table adds around its content: padding, dividers and edges."""
+    count = len(table.columns)
+    padding = sum(sum(_padding(table, index)) for index in range(count))
+    return padding + max(count - 1, 0) + (2 if table.show_edge else 0)
+
+
+class TableGradient:
+    """GradientTable's border coloring, one cell at a time.
+
+    GradientTable renders the whole table, then re-parses every output line
+    with ``apply_gradient`` to color it. The color of a cell only depends on
+    its (row, column) in the finished table, so this computes it directly,
+    with the same position strategy and the same RGB blend, for the border
+    cells a line has. Colors are formatted once per distinct RGB value.
+
+    Only the default ``target="border"`` is supported.
+
+    Args:
+        table: GradientTable whose colors and direction to use
+        rows: Line count of the whole table (title and borders included)
+        cols: Width of the table in cells
+        color_space: Escape codes to emit ("truecolor" matches GradientTable)
+
+    Raises:
+        ValueError: If the table's gradient target is not "border"
+    """
+
+    def __init__(
+        self, table: GradientTable, rows: int, cols: int, color_space: ColorSpace = "truecolor"
+    ) -> None:
+        if table.target != "border":
+            raise ValueError(f"only target='border' is supported, got {table.target!r}")
+        self.start = parse_color(table.border_gradient_start)
+        self.end = parse_color(table.border_gradient_end)
+        self.direction = table.border_gradient_direction
+        self.rows = rows
+        self.cols = cols
+        self.color_space = color_space
+        self._sgr: dict[tuple[int, int, int], str] = {}
+
+    def position(self, row: int, col: int) -> float:
+        """Gradient position of a cell, as the library's position strategies."""
+        row_progress = row / max(self.rows - 1, 1)
+        col_progress = col / max(self.cols - 1, 1)
+        if self.direction == "vertical":
+            position = row_progress
+        elif self.direction == "horizontal":
+            position = col_progress
+        else:
+            position = (row_progress + col_progress) / 2.0
+        return max(0.0, min(1.0, position))  # interpolate_rgb clamps
+
+    def sgr(self, row: int, col: int) -> str:
+        """SGR sequence for the cell at (row, col)."""
+        t = self.position(row, col)
+        (r1, g1, b1), (r2, g2, b2) = self.start, self.end
+        # Rich's blend_rgb, which interpolate_rgb calls: truncated, not rounded
+        rgb = (int(r1 + (r2 - r1) * t), int(g1 + (g2 - g1) * t), int(b1 + (b2 - b1) * t))
+        sgr = self._sgr.get(rgb)
+        if sgr is None:
+            sgr = self._sgr[rgb] = color_sgr("#%02x%02x%02x" % rgb, self.color_space)
+        return sgr
+
+    def sgrs(self, row: int, cols: Sequence[int]) -> list[str]:
+        """SGR sequences for several cells of one line (the verticals of a row)."""
+        if self.direction == "vertical":
+            return [self.sgr(row, 0)] * len(cols)
+        if self.direction == "horizontal":
+            return [self.sgr(row, col) for col in cols]
+        # Diagonal, inlined: a 100k-row table asks for this on every row
+        row_progress = row / max(self.rows - 1, 1)
+        col_scale = max(self.cols - 1, 1)
+        (r1, g1, b1), (r2, g2, b2) = self.start, self.end
+        dr, dg, db = r2 - r1, g2 - g1, b2 - b1
+        known = self._sgr
+        out = []
+        for col in cols:
+            t = max(0.0, min(1.0, (row_progress + col / col_scale) / 2.0))
+            rgb = (int(r1 + dr * t), int(g1 + dg * t), int(b1 + db * t))
+            sgr = known.get(rgb)
+            if sgr is None:
+                sgr = known[rgb] = color_sgr("#%02x%02x%02x" % rgb, self.color_space)
+            out.append(sgr)
+        return out
+
+    def line(self, text: str, row: int, prefix: str = "") -> str:
+        """Color every cell of a plain line (the top and bottom lines, rules).
+
+        ``prefix`` is put before each color, to keep a title's italics.
+        """
+        out: list[str] = []
+        span: list[str] = []
+        span_sgr = None
+        for col, char in enumerate(text):
+            sgr = self.sgr(row, col)
+            if sgr != span_sgr:
+                if span:
+                    out.append(prefix + span_sgr + "".join(span) + RESET)
+                span = []
+                span_sgr = sgr
+            span.append(char)
+        if span:
+            out.append(prefix + span_sgr + "".join(span) + RESET)
+        return "".join(out)
+
+
+class _Column:
+    """One column's fitting and styling rules."""
+
+    __slots__ = ("width", "justify", "left", "right", "style", "sgr")
+
+    def __init__(self, width: int, justify: str, left: int, right: int, style: str) -> None:
+        self.width = width
+        self.justify = justify
+        self.left = " " * left
+        self.right = " " * right
+        self.style = style
+        self.sgr = style_sgr(style)
+
+    def fit(self, text: str) -> str:
+        """Cut or pad ``text`` to the column width and add the cell padding."""
+        width = cell_width(text)
+        if width > self.width:
+            text = cut_cells(text, self.width)
+            width = cell_width(text)
+        gap = self.width - width
+        if gap:
+            if self.justify == "right":
+                text = " " * gap + text
+            elif self.justify == "center":
+                text = " " * (gap // 2) + text + " " * (gap - gap // 2)
+            else:
+                text = text + " " * gap
+        return self.left + text + self.right
+
+
+class TableLayout:
+    """A StyledTable's columns, box and padding, compiled for fixed widths.
+
+    Rich measures every cell to choose column widths, then renders each cell
+    through its segment pipeline. With the widths fixed up front a data row
+    is a single line: each value is cut or padded to its column, wrapped in
+    the column's style and joined with the box's verticals. Plain values
+    never go through Rich; markup values are rendered once per distinct
+    value (see ``render_markup``).
+
+    Rows are always one line high, as with ``no_wrap=True`` columns. Title,
+    caption, header, ``row_styles``, ``show_edge`` and ``pad_edge`` follow
+    the table; rows already added to it are ignored.
+
+    Args:
+        table: StyledTable or GradientTable with its columns defined
+        widths: Content width of each column (see ``sample_widths``)
+        color: Emit escape codes (``console.policy.color``)
+
+    Raises:
+        ValueError: If the widths don't match the columns or the table has no box
+    """
+
+    def __init__(self, table: StyledTable, widths: Sequence[int], *, color: bool = True) -> None:
+        if len(widths) != len(table.columns):
+            raise ValueError(f"expected {len(table.columns)} widths, got {len(widths)}")
+        if table.box is None:
+            raise ValueError("tables without a box are not supported")
+        self.table = table
+        self.widths = list(widths)
+        self.color = color
+        self._sanitize = not table._policy.emoji
+        box = table.box if table.show_header else table.box.get_plain_headed_box()
+
+        self.columns = [
+            _Column(width, column.justify, *_padding(table, index), str(column.style or ""))
+            for index, (width, column) in enumerate(zip(self.widths, table.columns))
+        ]
+        if not color:
+            for column in self.columns:
+                column.sgr = ""
+        self.row_sgrs = [style_sgr(str(style)) if color else "" for style in table.row_styles]
+
+        outer = [len(column.left) + column.width + len(column.right) for column in self.columns]
+        edge = table.show_edge
+        self.width = sum(outer) + len(outer) - 1 + (2 if edge else 0)
+        # Cell offsets of the verticals on a row line, edges included
+        self.border_cols = [0] if edge else []
+        col = 1 if edge else 0
+        for width in outer[:-1]:
+            col += width
+            self.border_cols.append(col)
+            col += 1
+        if edge:
+            self.border_cols.append(self.width - 1)
+        self._verticals = {
+            level: (
+                getattr(box, f"{level}_left") if edge else "",
+                getattr(box, f"{level}_vertical"),
+                getattr(box, f"{level}_right") if edge else "",
+            )
+            for level in ("head", "mid", "foot")
+        }
+
+        title_style = str(table.title_style or "table.title")
+        caption_style = str(table.caption_style or "table.caption")
+        self._title = self._annotation(table.title, title_style, table.title_justify)
+        self._caption = self._annotation(table.caption, caption_style, table.caption_justify)
+        self._title_sgr = style_sgr(title_style) if color else ""
+        self._caption_sgr = style_sgr(caption_style) if color else ""
+        self._top = [box.get_top(outer)] if edge else []
+        self._bottom = [box.get_bottom(outer)] if edge else []
+        self._header: list[str] = []
+        self._head_rule: list[str] = []
+        if table.show_header:
+            header_style = str(table.header_style or "")
+            self._header = [
+                column.fit(self._text(spec.header, f"{header_style} {spec.header_style or ''}"))
+                for column, spec in zip(self.columns, table.columns)
+            ]
+            self._head_rule = [box.get_row(outer, "head", edge=edge)]
+
+    def _text(self, value: Any, style: str = "") -> str:
+        """Header or annotation text, styled (rendered once per layout)."""
+        text = value if isinstance(value, str) else str(value)
+        if self._sanitize:
+            text = sanitize_emoji_content(text, with_color=True)
+        return render_markup(text, style.strip(), self.color)
+
+    def _annotation(self, value: Any, style: str, justify: str) -> list[str]:
+        """A title or caption line, aligned over the table width."""
+        if not value:
+            return []
+        text = self._text(value, str(style))
+        gap = max(self.width - cell_width(text), 0)
+        if justify == "left":
+            return [text + " " * gap]
+        if justify == "right":
+            return [" " * gap + text]
+        return [" " * (gap // 2) + text + " " * (gap - gap // 2)]
+
+    @property
+    def header_lines(self) -> int:
+        """Lines printed above the first data row."""
+        return len(self._title) + len(self._top) + (2 if self._header else 0)
+
+    @property
+    def footer_lines(self) -> int:
+        """Lines printed below the last data row."""
+        return len(self._bottom) + len(self._caption)
+
+    def line_count(self, rows: int) -> int:
+        """Lines of the whole table with ``rows`` data rows."""
+        return self.header_lines + rows + self.footer_lines
+
+    def gradient(self, rows: int) -> TableGradient | None:
+        """Border colors for a table of ``rows`` data rows (None for StyledTable)."""
+        if not self.color or not isinstance(self.table, GradientTable):
+            return None
+        return TableGradient(self.table, self.line_count(rows), self.width)
+
+    def _line(self, level: str, cells: list[str], line: int, gradient: TableGradient | None) -> str:
+        """Join cells with the verticals of a box level, coloring the verticals."""
+        left, vertical, right = self._verticals[level]
+        if gradient is None:
+            return left + vertical.join(cells) + right
+        if line == 0 or line == gradient.rows - 1:  # GradientTable colors edge lines in full
+            return gradient.line(strip_ansi(left + vertical.join(cells) + right), line)
+        glyphs = [left] if left else []
+        glyphs += [vertical] * (len(cells) - 1)
+        if right:
+            glyphs.append(right)
+        cols = self.border_cols
+        if not all(cell.isascii() for cell in cells):
+            cols = self._gradient_cols(cells, bool(left))
+        colored = [sgr + glyph + RESET for sgr, glyph in zip(gradient.sgrs(line, cols), glyphs)]
+        head = colored.pop(0) if left else ""
+        tail = colored.pop() if right else ""
+        body = [part for pair in zip(cells, colored) for part in pair]
+        return head + "".join(body) + cells[-1] + tail
+
+    @staticmethod
+    def _gradient_cols(cells: list[str], edge: bool) -> list[int]:
+        """Border offsets as GradientTable's gradient sees them on this line.
+
+        The library positions the gradient with visual_width, which can count
+        an emoji narrower than Rich lays it out (VS16 sequences outside modern
+        terminals), so the verticals after such a cell are colored as if they
+        sat further left.
+        """
+        cols = [0] if edge else []
+        col = 1 if edge else 0
+        for cell in cells[:-1]:
+            col += fast_width(strip_ansi(cell))
+            cols.append(col)
+            col += 1
+        if edge:
+            cols.append(col + fast_width(strip_ansi(cells[-1])))
+        return cols
+
+    @staticmethod
+    def _rule(text: str, line: int, gradient: TableGradient | None, prefix: str = "") -> str:
+        return text if gradient is None else gradient.line(strip_ansi(text), line, prefix)
+
+    def head(self, gradient: TableGradient | None = None) -> list[str]:
+        """Title, top border, header row and header rule."""
+        lines = [self._rule(text, 0, gradient, self._title_sgr) for text in self._title]
+        lines += [self._rule(text, len(lines), gradient) for text in self._top]
+        if self._header:
+            lines.append(self._line("head", self._header, len(lines), gradient))
+            lines.append(self._rule(self._head_rule[0], len(lines), gradient))
+        return lines
+
+    def foot(self, rows: int, gradient: TableGradient | None = None) -> list[str]:
+        """Bottom border and caption of a table with ``rows`` data rows."""
+        first = self.header_lines + rows
+        lines = [self._rule(text, first, gradient) for text in self._bottom]
+        lines += [
+            self._rule(text, first + len(lines), gradient, self._caption_sgr)
+            for text in self._caption
+        ]
+        return lines
+
+    def row(
+        self,
+        values: Sequence[Any],
+        index: int,
+        *,
+        last: bool = False,
+        gradient: TableGradient | None = None,
+        style: str = "",
+        styles: Mapping[int, str] | None = None,
+    ) -> str:
+        """Data row ``index`` as one line.
+
+        Args:
+            values: Cell values (strings with optional markup; others go through ``str``)
+            index: Row index: picks the ``row_styles`` entry and the gradient line
+            last: Whether this is the last data row (Rich draws it with the foot verticals)
+            gradient: Border colors, from ``gradient()``
+            style: Style for the whole row, as ``add_row(style=...)``
+            styles: Styles that replace the column style of single cells, by column index
+        """
+        row_sgr = self.row_sgrs[index % len(self.row_sgrs)] if self.row_sgrs else ""
+        if style and self.color:
+            row_sgr += style_sgr(style)
+        cells = []
+        for position, (column, value) in enumerate(zip(self.columns, values)):
+            text = value if isinstance(value, str) else str(value)
+            if self._sanitize:
+                text = sanitize_emoji_content(text, with_color=True)
+            cell_style, cell_sgr = column.style, column.sgr
+            if styles and position in styles:
+                cell_style = styles[position]
+                cell_sgr = style_sgr(cell_style) if self.color else ""
+            if "[" in text:
+                cells.append(column.fit(render_markup(text, cell_style, self.color)))
+            elif cell_sgr or row_sgr:
+                cells.append(row_sgr + cell_sgr + column.fit(text) + RESET)
+            else:
+                cells.append(column.fit(text))
+        if last:
+            level = "foot"
+        elif index == 0 and not self._header:
+            level = "head"
+        else:
+            level = "mid"
+        return self._line(level, cells, self.header_lines + index, gradient)
+
+
+class PagedTable:
+    """StyledTable / GradientTable output for very large row sources.
+
+    A Rich table keeps every row, measures every cell to choose its column
+    widths and renders the whole table before the first line is written; a
+    GradientTable then re-parses every output line to color the border. For
+    100k-row inventories that is seconds of work and hundreds of MB.
+
+    PagedTable takes columns and styling from ``table`` (the template; rows
+    added to it are ignored) and rows from ``rows``:
+
+    - a Sequence is read only where lines are produced, so ``window()`` can
+      show any slice of it and ``print()`` walks it once;
+    - any other iterable is consumed once by ``lines()`` / ``print()``.
+
+    Column widths come from the headers and ``sample`` rows (the first half
+    of them from the start of a Sequence and the rest spread over it; the
+    first rows of an iterable). Values wider than the sample
+    are cut with an ellipsis. Nothing is kept per row, so memory stays flat
+    however many rows are printed.
+
+    Args:
+        console: Console whose width and color policy are used
+        table: StyledTable or GradientTable with its columns defined
+        rows: Row values, one sequence of cells per row
+        sample: Rows measured for the column widths
+        total: Row count of an iterable (a GradientTable needs it for its gradient)
+        width: Maximum table width (defaults to the console width; pass the
+            ``Console(width=...)`` value when the console has one)
+
+    Raises:
+        ValueError: If a GradientTable's rows are an iterable without ``total``
+
+    Example:
+        >>> pages = PagedTable(console, template, inventory)  # 100k rows
+        >>> pages.print()
+        >>> pages.window(50_000, 20)  # header, 20 rows, bottom border
+    """
+
+    def __init__(
+        self,
+        console: Console,
+        table: StyledTable,
+        rows: Iterable[Sequence[Any]],
+        *,
+        sample: int = 1000,
+        total: int | None = None,
+        width: int | None = None,
+    ) -> None:
+        self.console = console
+        self.table = table
+        self._iterator: Iterator[Sequence[Any]] | None = None
+        if isinstance(rows, Sequence):
+            self._rows: Sequence[Sequence[Any]] | None = rows
+            self.total: int | None = len(rows)
+            # The first rows, plus rows spread over the rest
+            count, first = len(rows), min(sample // 2, len(rows))
+            step = max((count - first) // max(sample - first, 1), 1)
+            spread = islice(range(first, count, step), sample - first)
+            sampled = [rows[index] for index in chain(range(first), spread)]
+        else:
+            self._rows = None
+            iterator = iter(rows)
+            sampled = list(islice(iterator, sample))
+            self._iterator = chain(sampled, iterator)
+            self.total = len(sampled) if len(sampled) < sample else total
+
+        self.widths = sample_widths(table, sampled, console_width(console, width))
+        self.layout = TableLayout(table, self.widths, color=console.policy.color)
+        if self.total is None and isinstance(table, GradientTable) and self.layout.color:
+            raise ValueError("GradientTable rows from an iterable need total=")
+        self.gradient = self.layout.gradient(self.total or 0)
+        self.rows_written = 0
+
+    def __len__(self) -> int:
+        if self.total is None:
+            raise TypeError("row count unknown (iterable rows without total=)")
+        return self.total
+
+    def window(self, start: int, height: int) -> list[str]:
+        """Header, rows ``start`` to ``start + height`` and the bottom border.
+
+        Rows keep the colors they have in the full table, so scrolling a
+        window over a GradientTable shows the gradient moving past.
+
+        Raises:
+            TypeError: If the rows are not a Sequence
+        """
+        if self._rows is None:
+            raise TypeError("window() needs a Sequence of rows")
+        stop = max(0, min(start + height, self.total))
+        start = max(0, min(start, stop))
+        layout, gradient, last = self.layout, self.gradient, self.total - 1
+        lines = layout.head(gradient)
+        lines += [
+            layout.row(self._rows[index], index, last=index == last, gradient=gradient)
+            for index in range(start, stop)
+        ]
+        return lines + layout.foot(self.total, gradient)
+
+    def lines(self) -> Iterator[str]:
+        """Every line of the table, produced as the rows are read.
+
+        Raises:
+            RuntimeError: If iterable rows were already consumed
+        """
+        if self._rows is not None:
+            rows: Iterator[Sequence[Any]] = map(self._rows.__getitem__, range(self.total))
+        elif self._iterator is not None:
+            rows, self._iterator = self._iterator, None
+        else:
+            raise RuntimeError("iterable rows can only be printed once")
+
+        layout, gradient = self.layout, self.gradient
+        yield from layout.head(gradient)
+        count = 0
+        previous: Sequence[Any] = ()
+        for values in rows:  # one row of lookahead, to draw the last row's verticals
+            if count:
+                yield layout.row(previous, count - 1, gradient=gradient)
+            previous = values
+            count += 1
+        if count:
+            yield layout.row(previous, count - 1, last=True, gradient=gradient)
+        self.rows_written = count
+        yield from layout.foot(count, gradient)
+
+    def print(self, file: TextIO | None = None, page_size: int = 1000) -> int:
+        """Write the table ``page_size`` lines at a time; return the rows written.
+
+        Lines go to ``file``, else stdout (pass the ``Console(file=...)``
+        stream when the console writes elsewhere).
+        """
+        file = file or sys.stdout
+        lines = self.lines()
+        while page := list(islice(lines, page_size)):
+            file.write("\n".join(page) + "\n")
+        return self.rows_written
+
+
+class TableWriter:
+    """Print a StyledTable / GradientTable while its rows are still arriving.
+
+    A table is normally printed once every row is known, so users of a
+    long-running query stare at nothing until it finishes. TableWriter
+    fixes the column widths up front, prints the title, top border and
+    header immediately, and writes each ``add_row()`` as one line straight
+    to the output. ``close()`` (or leaving the ``with`` block) draws the
+    bottom border.
+
+    Widths come from ``widths`` (None entries and a missing list fall back
+    to the estimate), else from the headers plus the ``sample`` rows, if
+    any. Values wider than their column are cut with an ellipsis.
+
+    A GradientTable's vertical and diagonal gradients depend on the table's
+    height. Rows are colored for ``expected_rows`` (past it they keep the
+    end color); the bottom border is colored on close for the real row
+    count, so it always ends the gradient like GradientTable's does. Every
+    row is drawn with the box's middle verticals.
+
+    Args:
+        console: Console whose width and color policy are used
+        table: StyledTable or GradientTable with its columns defined
+        widths: Fixed content width per column
+        sample: Rows to estimate the widths from (e.g. the first page of results)
+        expected_rows: Estimated row count for a GradientTable's gradient
+        file: Output stream (defaults to stdout; pass the ``Console(file=...)``
+            stream when the console writes elsewhere)
+        width: Maximum table width (defaults to the console width; pass the
+            ``Console(width=...)`` value when the console has one)
+
+    Example:
+        >>> with TableWriter(console, template, widths=[20, 15, 6], expected_rows=500) as out:
+        ...     for record in cursor:
+        ...         out.add_row(record.host, record.ip, record.cpu)
+    """
+
+    def __init__(
+        self,
+        console: Console,
+        table: StyledTable,
+        *,
+        widths: Sequence[int | None] | None = None,
+        sample: Iterable[Sequence[Any]] = (),
+        expected_rows: int = 100,
+        file: TextIO | None = None,
+        width: int | None = None,
+    ) -> None:
+        estimated = sample_widths(table, sample, console_width(console, width))
+        if widths is not None:
+            if len(widths) != len(estimated):
+                raise ValueError(f"expected {len(estimated)} widths, got {len(widths)}")
+            estimated = [width or guess for width, guess in zip(widths, estimated)]
+        self.layout = TableLayout(table, estimated, color=console.policy.color)
+        self.widths = self.layout.widths
+        self.expected_rows = expected_rows
+        self.gradient = self.layout.gradient(expected_rows)
+        self.file = file or sys.stdout
+        self.rows = 0
+        self.closed = False
+        self._started = False
+
+    def __enter__(self) -> "TableWriter":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def _write(self, lines: list[str]) -> None:
+        self.file.write("\n".join(lines) + "\n")
+        self.file.flush()
+
+    def start(self) -> None:
+        """Print the title, top border and header (once; ``add_row`` calls it too)."""
+        if not self._started:
+            self._started = True
+            self._write(self.layout.head(self.gradient))
+
+    def add_row(self, *values: Any) -> None:
+        """Format one row and write it right away.
+
+        Raises:
+            RuntimeError: If the writer was closed
+        """
+        self.add_rows([values])
+
+    def add_rows(self, rows: Iterable[Sequence[Any]]) -> None:
+        """Write several rows with one write and one flush (a page of results).
+
+        Raises:
+            RuntimeError: If the writer was closed
+        """
+        if self.closed:
+            raise RuntimeError("TableWriter is closed")
+        self.start()
+        layout, gradient = self.layout, self.gradient
+        lines = []
+        for values in rows:
+            lines.append(layout.row(values, self.rows, gradient=gradient))
+            self.rows += 1
+        if lines:
+            self._write(lines)
+
+    def close(self) -> None:
+        """Draw the bottom border (and caption) with the final row count."""
+        if self.closed:
+            return
+        self.start()
+        self.closed = True
+        self._write(self.layout.foot(self.rows, self.layout.gradient(self.rows)))
+
+
+class ColumnarTable(StyledTable):
+    """StyledTable that stores its rows column by column.
+
+    Rich keeps a Row object per row and appends every cell to its column as
+    a separate object; a metrics row of six formatted numbers costs several
+    hundred bytes. Here each column is one contiguous store:
+
+    - columns added with ``format=`` (e.g. ``"{:,.1f} ms"``) keep raw
+      numbers in an ``array("d")``, 8 bytes per cell, and format them only
+      when printed;
+    - other columns keep a list of strings.
+
+    Styles are one per column (the column's ``style``) plus sparse
+    overrides: ``add_row(style=...)`` for a whole row and
+    ``add_row(styles={column: style})`` or ``set_style()`` for single
+    cells. Column widths are measured one column per batch when printed.
+
+    Printing goes through TableLayout, so rows are one line high and values
+    are cut to the column width instead of wrapping; sections
+    (``end_section``, ``add_section()``) are not supported and raise.
+    GradientTable's gradient is applied when the class is mixed with it
+    (see ColumnarGradientTable).
+
+    Example:
+        >>> table = ColumnarTable(title="Latency")
+        >>> table.add_column("HOST")
+        >>> table.add_column("P99", justify="right", format="{:.1f} ms")
+        >>> table.add_row("web-01", 12.5)
+        >>> table.set_style(0, 1, "bold red")
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._stores: list[array | list[str]] = []
+        self._formats: list[str | None] = []
+        self._count = 0
+        self._row_style_overrides: dict[int, str] = {}
+        self._cell_styles: dict[int, dict[int, str]] = {}
+
+    def add_column(
+        self, header: Any = "", footer: Any = "", *, format: str | None = None, **kwargs: Any
+    ) -> None:
+        """Add a column; ``format`` makes it a numeric column (``str.format`` spec).
+
+        Raises:
+            RuntimeError: If rows were already added
+        """
+        if self._count:
+            raise RuntimeError("add every column before the first row")
+        super().add_column(header, footer, **kwargs)
+        self._stores.append(array("d") if format else [])
+        self._formats.append(format)
+
+    def add_row(
+        self,
+        *renderables: Any,
+        style: str | None = None,
+        end_section: bool = False,
+        styles: Mapping[int, str] | None = None,
+    ) -> None:
+        """Append a row: numbers to numeric columns, text (or markup) to the others.
+
+        Missing trailing cells are blank (0 in numeric columns). Emoji are
+        sanitized when the row is printed, as with PagedTable.
+
+        Raises:
+            NotImplementedError: If ``end_section`` is true (sections are not supported)
+            ValueError: If there are more values than columns
+            TypeError: If a numeric column gets something that is not a number
+        """
+        if end_section:
+            raise NotImplementedError("ColumnarTable does not support sections")
+        if len(renderables) > len(self._stores):
+            raise ValueError(f"expected at most {len(self._stores)} values, got {len(renderables)}")
+        added = 0
+        try:
+            for store, fmt, value in zip_longest(self._stores, self._formats, renderables):
+                if fmt:
+                    store.append(value or 0)
+                elif value is None:
+                    store.append("")
+                else:
+                    store.append(value if isinstance(value, str) else str(value))
+                added += 1
+        except TypeError:
+            for store in self._stores[:added]:
+                store.pop()  # keep the columns the same length
+            raise
+        if style:
+            self._row_style_overrides[self._count] = str(style)
+        if styles:
+            self._cell_styles[self._count] = {column: str(s) for column, s in styles.items()}
+        self._count += 1
+
+    def add_section(self) -> None:
+        """Not supported: Rich's version would silently do nothing here.
+
+        Raises:
+            NotImplementedError: Always
+        """
+        raise NotImplementedError("ColumnarTable does not support sections")
+
+    def set_style(self, row: int, column: int, style: str) -> None:
+        """Override the column style of one cell.
+
+        Raises:
+            IndexError: If the cell does not exist
+        """
+        if not (0 <= row < self._count and 0 <= column < len(self._stores)):
+            raise IndexError(f"no cell at row {row}, column {column}")
+        self._cell_styles.setdefault(row, {})[column] = style
+
+    @property
+    def row_count(self) -> int:
+        return self._count
+
+    def column_values(self, column: int) -> list[str]:
+        """Every cell of one column as printed (numbers formatted)."""
+        store, fmt = self._stores[column], self._formats[column]
+        return [fmt.format(value) for value in store] if fmt else list(store)
+
+    def cell(self, row: int, column: int) -> str:
+        """One cell as printed."""
+        value, fmt = self._stores[column][row], self._formats[column]
+        return fmt.format(value) if fmt else value
+
+    def column_widths(self, max_width: int | None = None) -> list[int]:
+        """Column widths for printing, measured one column at a time."""
+        measured = [
+            # Formatted numbers are ASCII: one cell per character
+            max(map(len, map(fmt.format, store)), default=0) if fmt else measure_column(store)
+            for store, fmt in zip(self._stores, self._formats)
+        ]
+        return fit_widths(self, measured, max_width)
+
+    def lines(self, max_width: int | None = None, color: bool = True) -> Iterator[str]:
+        """Every line of the table, rows formatted as they are produced."""
+        layout = TableLayout(self, self.column_widths(max_width), color=color)
+        gradient = layout.gradient(self._count)
+        yield from layout.head(gradient)
+        stores, formats = self._stores, self._formats
+        row_styles, cell_styles = self._row_style_overrides, self._cell_styles
+        last = self._count - 1
+        for index in range(self._count):
+            values = [
+                fmt.format(store[index]) if fmt else store[index]
+                for store, fmt in zip(stores, formats)
+            ]
+            yield layout.row(
+                values,
+                index,
+                last=index == last,
+                gradient=gradient,
+                style=row_styles.get(index, ""),
+                styles=cell_styles.get(index),
+            )
+        yield from layout.foot(self._count, gradient)
+
+    def __rich_console__(self, console: RichConsole, options: ConsoleOptions) -> RenderResult:
+        # Rich downgrades or drops the colors for this console, as for StyledTable
+        for line in self.lines(options.max_width, console.color_system is not None):
+            yield Text.from_ansi(line)
+
+    def __rich_measure__(self, console: RichConsole, options: ConsoleOptions) -> Measurement:
+        widths = self.column_widths(options.max_width)
+        width = sum(widths) + _chrome_width(self)
+        return Measurement(width, width)
+
+
+class ColumnarGradientTable(ColumnarTable, GradientTable):
+    """GradientTable with ColumnarTable's storage (the gradient is applied per line)."""
@@ -0,0 +1,682 @@
+"""Width measurement helpers shared by the performance examples.
+
+Files starting with ``_`` are skipped by ``run_examples.py``; this module is
+imported by the scripts in this directory instead of being run on its own.
+
+Provides:
+- WidthCache: bounded, mode-aware memoization layer for ``visual_width``
+- WidthTable: per-codepoint width table with O(1) lookups
+- fast_width: table-backed ``visual_width`` for text without joined graphemes
+- fast_split_graphemes: ``split_graphemes`` with a zero-copy ASCII path
+- visual_widths / column_widths: batched measurement for frames and tables
+- iter_graphemes / width_prefix / truncate_graphemes: lazy, early-stopping walks
+- AnsiSpans / tokenize_ansi: cached single-pass split of escapes and visible text
+  (widths measured per render target and terminal mode through ``span_widths``)
+- console_width: the width a Console lays out for, from its public terminal profile
+"""
+
+import os
+import re
+import shutil
+from array import array
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Literal
+
+import emoji
+import wcwidth
+
+from styledconsole import Console
+from styledconsole.types import AlignType
+from styledconsole.utils.text import (
+    ANSI_PATTERN,
+    VARIATION_SELECTOR_16,
+    _is_legacy_emoji_mode,
+    _is_modern_terminal_mode,
+    _is_skin_tone_modifier,
+    _parse_ansi_sequence,
+    get_render_target,
+    split_graphemes,
+    visual_width,
+)
+
+EvictionPolicy = Literal["lru", "fifo"]
+
+UNICODE_SIZE = 0x110000
+BLOCK_SIZE = 256
+
+CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "styledconsole-examples"
+)
+
+# Characters that make split_graphemes() join codepoints (ZWJ, VS16, skin tone
+# modifiers) or that visual_width() strips first (ANSI escapes). Text without
+# them is one grapheme per codepoint and can be summed straight from the table.
+_NEEDS_SEGMENTATION = re.compile("[\x1b\u200d\ufe0f\U0001F3FB-\U0001F3FF]")
+
+# SGR (color/style) sequences. The ASCII fast paths only handle these; any
+# other escape sequence goes through the library's ANSI parser.
+_SGR_PATTERN = re.compile(r"\x1b\[[0-9;]*m")
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Snapshot of a cache's counters (WidthCache, RampCache, PhaseCycle)."""
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    maxsize: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache (0.0 - 1.0)."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class WidthCache:
+    """Bounded memoization layer for ``visual_width``.
+
+    Entries are grouped by mode: render target, markup flag and terminal
+    emoji mode. A width measured for a modern terminal is never served to a
+    standard one, and lookups only hash the text itself. Each group holds at
+    most ``maxsize`` entries; in practice only one or two groups are used.
+
+    Detecting the terminal mode reads several environment variables and costs
+    far more than a cache hit, so it is sampled once and re-read only by
+    ``refresh_mode()``. Call it once per redraw (not per label) if the
+    environment may change while the program runs. The render target is a
+    context variable and is checked on every call.
+
+    Args:
+        maxsize: Maximum number of cached widths per mode (must be positive)
+        policy: "lru" moves entries to the back on every hit, "fifo" evicts
+            strictly in insertion order (cheaper hits, worse for skewed keys)
+
+    Example:
+        >>> widths = WidthCache(maxsize=512)
+        >>> widths("🚀 Deploy")
+        9
+        >>> widths.stats().misses
+        1
+    """
+
+    def __init__(self, maxsize: int = 4096, policy: EvictionPolicy = "lru") -> None:
+        if maxsize <= 0:
+            raise ValueError(f"maxsize must be positive, got {maxsize}")
+        if policy not in ("lru", "fifo"):
+            raise ValueError(f"Invalid eviction policy: {policy}")
+        self.maxsize = maxsize
+        self.policy = policy
+        self._groups: dict[tuple[str, bool, bool, bool], OrderedDict[str, int]] = {}
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._terminal_mode = self._detect_terminal_mode()
+        # Hot group: terminal target, no markup, current terminal mode
+        self._plain = self._group("terminal", False)
+
+    @staticmethod
+    def _detect_terminal_mode() -> tuple[bool, bool]:
+        """Return (legacy, modern) exactly as visual_width resolves them."""
+        legacy = _is_legacy_emoji_mode()
+        modern = _is_modern_terminal_mode() if not legacy else False
+        return legacy, modern
+
+    def _group(self, target: str, markup: bool) -> OrderedDict[str, int]:
+        """Entries for a render target/markup pair in the current terminal mode."""
+        key = (target, markup, *self._terminal_mode)
+        group = self._groups.get(key)
+        if group is None:
+            group = self._groups[key] = OrderedDict()
+        return group
+
+    def refresh_mode(self) -> bool:
+        """Re-detect the terminal mode.
+
+        The library keeps its own unkeyed width cache, which is cleared when
+        the mode changes so that misses are measured under the new mode.
+
+        Returns:
+            True if the mode changed since the last check
+        """
+        mode = self._detect_terminal_mode()
+        if mode == self._terminal_mode:
+            return False
+        self._terminal_mode = mode
+        self._plain = self._group("terminal", False)
+        visual_width.cache_clear()  # type: ignore[attr-defined]
+        return True
+
+    def __call__(self, text: str, markup: bool = False) -> int:
+        """Return the visual width of text, measuring it only on a miss."""
+        target = get_render_target()
+        if markup or target != "terminal":
+            entries = self._group(target, markup)
+        else:
+            entries = self._plain
+
+        width = entries.get(text)
+        if width is not None:
+            self._hits += 1
+            if self.policy == "lru":
+                entries.move_to_end(text)
+            return width
+
+        self._misses += 1
+        width = fast_width(text, markup=markup)
+        entries[text] = width
+        if len(entries) > self.maxsize:
+            entries.popitem(last=False)
+            self._evictions += 1
+        return width
+
+    def resize(self, maxsize: int) -> None:
+        """Change the capacity, evicting the oldest entries if needed."""
+        if maxsize <= 0:
+            raise ValueError(f"maxsize must be positive, got {maxsize}")
+        self.maxsize = maxsize
+        for entries in self._groups.values():
+            while len(entries) > maxsize:
+                entries.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self) -> None:
+        """Drop all cached widths and reset the counters."""
+        for entries in self._groups.values():
+            entries.clear()
+        self._hits = self._misses = self._evictions = 0
+
+    def stats(self) -> CacheStats:
+        """Return a snapshot of the hit/miss/eviction counters."""
+        return CacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            size=len(self),
+            maxsize=self.maxsize,
+        )
+
+    def __len__(self) -> int:
+        return sum(len(entries) for entries in self._groups.values())
+
+
+class WidthTable:
+    """Width of every codepoint when it forms a grapheme on its own.
+
+    The library decides single-codepoint widths the same way in every mode
+    (emoji -> 2, otherwise wcwidth, unknown -> 1), so one table serves the
+    modern, standard, legacy and export paths. Joined graphemes (ZWJ, VS16,
+    skin tones) are mode-dependent and stay with ``visual_width``.
+
+    In memory the table is a flat ``bytes`` object indexed by codepoint, which
+    lets ``str.translate`` map a whole string to widths in C. On disk it is
+    stored as a two-level table (block index + unique 256-codepoint blocks),
+    under 40 KB instead of 1.1 MB.
+
+    Example:
+        >>> table = WidthTable.load()
+        >>> table.width("中文 ok")
+        7
+        >>> table[ord("🚀")]
+        2
+    """
+
+    MAGIC = b"SCWT1"
+
+    def __init__(self, flat: bytes) -> None:
+        if len(flat) != UNICODE_SIZE:
+            raise ValueError(f"Width table must cover {UNICODE_SIZE} codepoints")
+        self._flat = flat
+
+    @classmethod
+    def build(cls) -> "WidthTable":
+        """Compute the table from wcwidth and the emoji package (~3s)."""
+        flat = bytearray(UNICODE_SIZE)
+        for cp in range(UNICODE_SIZE):
+            w = wcwidth.wcwidth(chr(cp))
+            flat[cp] = w if w >= 0 else 1
+        for char in emoji.EMOJI_DATA:
+            if len(char) == 1:
+                flat[ord(char)] = 2
+        return cls(bytes(flat))
+
+    @staticmethod
+    def cache_path(cache_dir: Path = CACHE_DIR) -> Path:
+        """Cache file for the installed wcwidth/emoji versions."""
+        return cache_dir / f"width_table-wcwidth{wcwidth.__version__}-emoji{emoji.__version__}.bin"
+
+    @classmethod
+    def load(cls, cache_dir: Path = CACHE_DIR) -> "WidthTable":
+        """Load the table from the on-disk cache, building it on first use."""
+        path = cls.cache_path(cache_dir)
+        try:
+            return cls.from_bytes(path.read_bytes())
+        except (OSError, ValueError):
+            pass
+
+        table = cls.build()
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(table.to_bytes())
+        except OSError:
+            pass  # Read-only home or sandbox: keep the in-memory table
+        return table
+
+    def to_bytes(self) -> bytes:
+        """Serialize as MAGIC + block count + block index + unique blocks."""
+        blocks: dict[bytes, int] = {}
+        index = array("H")
+        for start in range(0, UNICODE_SIZE, BLOCK_SIZE):
+            block = self._flat[start : start + BLOCK_SIZE]
+            index.append(blocks.setdefault(block, len(blocks)))
+        count = array("H", [len(blocks)])
+        return self.MAGIC + count.tobytes() + index.tobytes() + b"".join(blocks)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "WidthTable":
+        """Inverse of to_bytes(); raises ValueError on a corrupt payload."""
+        if not data.startswith(cls.MAGIC):
+            raise ValueError("Not a width table")
+        offset = len(cls.MAGIC)
+        count = array("H", data[offset : offset + 2])[0]
+        offset += 2
+        index_size = (UNICODE_SIZE // BLOCK_SIZE) * 2
+        index = array("H", data[offset : offset + index_size])
+        offset += index_size
+        payload = data[offset:]
+        if len(payload) != count * BLOCK_SIZE:
+            raise ValueError("Truncated width table")
+        blocks = [payload[i * BLOCK_SIZE : (i + 1) * BLOCK_SIZE] for i in range(count)]
+        return cls(b"".join(blocks[i] for i in index))
+
+    def __getitem__(self, codepoint: int) -> int:
+        return self._flat[codepoint]
+
+    def cells(self, text: str) -> bytes:
+        """Width of each codepoint in text, one byte per codepoint."""
+        return text.translate(self._flat).encode("latin-1")
+
+    def width(self, text: str) -> int:
+        """Sum codepoint widths; only valid for one-codepoint graphemes."""
+        return sum(self.cells(text))
+
+
+_width_table: WidthTable | None = None
+
+
+def get_width_table() -> WidthTable:
+    """Return the process-wide WidthTable, loading it on first use."""
+    global _width_table
+    if _width_table is None:
+        _width_table = WidthTable.load()
+    return _width_table
+
+
+def needs_segmentation(text: str) -> bool:
+    """True if text has joined graphemes or ANSI escapes (no table fast path)."""
+    return _NEEDS_SEGMENTATION.search(text) is not None
+
+
+def _ascii_width(text: str) -> int:
+    """Width of 7-bit text: one cell per character except NUL."""
+    return len(text) - text.count("\x00") if "\x00" in text else len(text)
+
+
+def fast_width(text: str, markup: bool = False) -> int:
+    """Drop-in ``visual_width`` that skips grapheme splitting when it can.
+
+    Plain 7-bit ASCII (optionally wrapped in SGR color codes) is measured
+    with ``len()``. Other text where every codepoint is its own grapheme is
+    summed from the WidthTable; markup, other escape sequences and joined
+    emoji fall back to the library implementation.
+    """
+    if markup:
+        return visual_width(text, markup=True)
+    if text.isascii():
+        if "\x1b" not in text:
+            return _ascii_width(text)
+        plain = _SGR_PATTERN.sub("", text)
+        if "\x1b" not in plain:
+            return _ascii_width(plain)
+    if needs_segmentation(text):
+        return visual_width(text, markup=markup)
+    return get_width_table().width(text)
+
+
+def _split_ascii_sgr(text: str) -> list[str]:
+    """split_graphemes() for ASCII text whose escapes are all SGR codes.
+
+    Mirrors the library: escapes attach to the preceding character, and
+    escapes before the first character form a grapheme of their own.
+    """
+    graphemes: list[str] = []
+    pos = 0
+    for match in _SGR_PATTERN.finditer(text):
+        graphemes.extend(text[pos : match.start()])
+        if graphemes:
+            graphemes[-1] += match.group()
+        else:
+            graphemes.append(match.group())
+        pos = match.end()
+    graphemes.extend(text[pos:])
+    return graphemes
+
+
+def fast_split_graphemes(text: str) -> Sequence[str]:
+    """``split_graphemes`` with an up-front ASCII check.
+
+    Plain ASCII text is returned as-is: a ``str`` already is a sequence of
+    one-character graphemes, so nothing is copied. ASCII with SGR codes is
+    split with a single regex scan. Everything else uses the library.
+
+    The result is read-only; wrap it in ``list()`` before mutating.
+    """
+    if text.isascii():
+        if "\x1b" not in text:
+            return text
+        if "\x1b" not in _SGR_PATTERN.sub("", text):
+            return _split_ascii_sgr(text)
+    return split_graphemes(text)
+
+
+def visual_widths(texts: Iterable[str], markup: bool = False) -> array:
+    """Measure many strings in one call.
+
+    The batch is joined and checked once: an all-ASCII batch is measured with
+    ``len()``, and in a batch without joined graphemes only the non-ASCII
+    strings are looked up in the WidthTable. Mixed batches measure each
+    distinct string once with ``fast_width``.
+
+    Args:
+        texts: Strings to measure (frame lines, one table column, ...)
+        markup: Whether to handle Rich markup tags
+
+    Returns:
+        ``array("I")`` with one width per input string, in input order
+
+    Example:
+        >>> list(visual_widths(["OK", "🚀 Launch", "中文"]))
+        [2, 9, 4]
+    """
+    texts = texts if isinstance(texts, list) else list(texts)
+    if markup:
+        return array("I", [visual_width(text, markup=True) for text in texts])
+
+    joined = "".join(texts)
+    if joined.isascii() and "\x1b" not in joined and "\x00" not in joined:
+        return array("I", map(len, texts))
+
+    if not needs_segmentation(joined):
+        table_width = get_width_table().width
+        if "\x00" in joined:
+            return array("I", map(table_width, texts))
+        # Table lookups cost far more than len(); only non-ASCII strings pay
+        return array("I", [len(text) if text.isascii() else table_width(text) for text in texts])
+
+    measured: dict[str, int] = {}
+    widths = array("I")
+    for text in texts:
+        width = measured.get(text)
+        if width is None:
+            width = measured[text] = fast_width(text)
+        widths.append(width)
+    return widths
+
+
+def column_widths(rows: Sequence[Sequence[str]]) -> list[int]:
+    """Widest cell of each column, measured one column per batch.
+
+    Example:
+        >>> column_widths([["Host", "Status"], ["web-01", "✅ OK"]])
+        [6, 6]
+    """
+    if not rows:
+        return []
+    return [max(visual_widths(list(column))) for column in zip(*rows)]
+
+
+def iter_graphemes(text: str) -> Iterator[str]:
+    """Lazily yield the grapheme clusters ``split_graphemes`` would return.
+
+    A cluster is only yielded once the next character shows it cannot be
+    extended, so callers that stop early never segment the rest of the text.
+    ANSI escapes stay attached to the preceding cluster, as in the library.
+    """
+    if text.isascii() and "\x1b" not in text:
+        yield from text
+        return
+
+    current = ""
+    last_real_char: str | None = None
+    i = 0
+    n = len(text)
+    while i < n:
+        if text[i] == "\x1b" and i + 1 < n and text[i + 1] == "[":
+            ansi_code, i = _parse_ansi_sequence(text, i)
+            current += ansi_code
+            continue
+
+        char = text[i]
+        i += 1
+        extends = last_real_char is not None and (
+            char == VARIATION_SELECTOR_16
+            or char == "\u200d"
+            or last_real_char == "\u200d"
+            or _is_skin_tone_modifier(char)
+        )
+        if current and not extends:
+            yield current
+            current = ""
+        current += char
+        last_real_char = char
+
+    if current:
+        yield current
+
+
+def _grapheme_width(grapheme: str) -> int:
+    """Width of one cluster from iter_graphemes()."""
+    if len(grapheme) == 1 and not needs_segmentation(grapheme):
+        return get_width_table()[ord(grapheme)]
+    return fast_width(grapheme)
+
+
+def width_prefix(text: str, max_width: int) -> tuple[str, int]:
+    """Longest prefix of text that fits in max_width cells.
+
+    Stops segmenting as soon as the budget is used up, so the cost depends
+    on max_width rather than on the length of text.
+
+    Returns:
+        Tuple of (prefix, prefix_width)
+
+    Example:
+        >>> width_prefix("🚀 Launch sequence", 8)
+        ('🚀 Launc', 8)
+    """
+    if max_width <= 0:
+        return "", 0
+    if text.isascii() and "\x1b" not in text and "\x00" not in text:
+        prefix = text[:max_width]
+        return prefix, len(prefix)
+
+    parts: list[str] = []
+    used = 0
+    for grapheme in iter_graphemes(text):
+        width = _grapheme_width(grapheme)
+        if used + width > max_width:
+            break
+        parts.append(grapheme)
+        used += width
+    return "".join(parts), used
+
+
+def truncate_graphemes(text: str, width: int, suffix: str = "...") -> str:
+    """Early-stopping equivalent of ``truncate_to_width``.
+
+    ``truncate_to_width`` measures the whole text before cutting it; this
+    walks graphemes only until the text is known not to fit, i.e. at most
+    ``width + 1`` cells in. Cuts fall on grapheme boundaries, so ZWJ and
+    VS16 sequences are never split. ANSI escapes are kept and a reset is
+    appended after the suffix, as in the library.
+    """
+    if text.isascii() and "\x1b" not in text and "\x00" not in text:
+        if len(text) <= width:
+            return text
+        budget = width - len(suffix)
+        return text[:budget] + suffix if budget > 0 else suffix[:width]
+
+    budget = width - fast_width(suffix)
+    parts: list[str] = []
+    used = 0
+    cut = 0
+    for grapheme in iter_graphemes(text):
+        used += _grapheme_width(grapheme)
+        if used > width:
+            if budget <= 0:
+                return suffix[:width]
+            reset = "\x1b[0m" if "\x1b" in text else ""
+            return "".join(parts[:cut]) + suffix + reset
+        parts.append(grapheme)
+        if used <= budget:
+            cut = len(parts)
+    return text
+
+
+# Widths of tokenized text, kept apart from the tokenization: the split into
+# spans never changes, the width depends on the render target and terminal mode
+span_widths = WidthCache()
+
+
+@dataclass(frozen=True)
+class AnsiSpans:
+    """Text split once into escape sequences and visible runs.
+
+    Attributes:
+        spans: ``(is_escape, text)`` pairs in original order
+        plain: Visible text with every escape removed
+        has_escapes: Whether any escape sequence was found
+    """
+
+    spans: tuple[tuple[bool, str], ...]
+    plain: str
+    has_escapes: bool
+
+    @property
+    def width(self) -> int:
+        """Visual width of ``plain`` for the current render target and terminal mode."""
+        return span_widths(self.plain)
+
+
+@lru_cache(maxsize=4096)
+def tokenize_ansi(text: str) -> AnsiSpans:
+    """Split text into escape and visible spans in a single regex pass.
+
+    Results are memoized per string, so measuring, padding and truncating
+    the same pre-colored line share one scan. Escapes are recognized with
+    the library's ``ANSI_PATTERN``, matching what ``strip_ansi`` removes.
+    The width is not part of the memoized result: it is looked up in
+    ``span_widths``, a WidthCache keyed by render target and terminal mode
+    (call ``span_widths.refresh_mode()`` if the emoji environment changes).
+
+    Example:
+        >>> tokenize_ansi("\\033[31mERROR\\033[0m db down").width
+        13
+    """
+    spans: list[tuple[bool, str]] = []
+    visible: list[str] = []
+    pos = 0
+    for match in ANSI_PATTERN.finditer(text):
+        if match.start() > pos:
+            run = text[pos : match.start()]
+            spans.append((False, run))
+            visible.append(run)
+        spans.append((True, match.group()))
+        pos = match.end()
+    if pos < len(text):
+        spans.append((False, text[pos:]))
+        visible.append(text[pos:])
+
+    plain = "".join(visible)
+    return AnsiSpans(
+        spans=tuple(spans),
+        plain=plain,
+        has_escapes=len(visible) != len(spans),
+    )
+
+
+def ansi_width(text: str) -> int:
+    """``visual_width`` for pre-colored text, via the cached tokenization."""
+    return tokenize_ansi(text).width
+
+
+def ansi_pad(text: str, width: int, align: AlignType = "left", fill_char: str = " ") -> str:
+    """``pad_to_width`` that reuses the cached tokenization.
+
+    Raises:
+        ValueError: If text is already wider than width
+    """
+    current = tokenize_ansi(text).width
+    if current > width:
+        raise ValueError(f"Text width ({current}) exceeds target width ({width})")
+    padding = width - current
+    if align == "left":
+        return text + fill_char * padding
+    if align == "right":
+        return fill_char * padding + text
+    if align == "center":
+        left = padding // 2
+        return fill_char * left + text + fill_char * (padding - left)
+    raise ValueError(f"Invalid align value: {align}")
+
+
+def ansi_truncate(text: str, width: int, suffix: str = "...") -> str:
+    """``truncate_to_width`` that reuses the cached tokenization.
+
+    Escapes are copied through without being measured; visible runs are cut
+    with width_prefix(), so only the runs inside the budget are segmented.
+    A reset is appended after the suffix when the text carried escapes.
+    """
+    tokens = tokenize_ansi(text)
+    if tokens.width <= width:
+        return text
+
+    budget = width - fast_width(suffix)
+    if budget <= 0:
+        return suffix[:width]
+
+    parts: list[str] = []
+    for is_escape, span in tokens.spans:
+        if is_escape:
+            parts.append(span)
+            continue
+        prefix, used = width_prefix(span, budget)
+        parts.append(prefix)
+        budget -= used
+        if len(prefix) < len(span):
+            break
+
+    reset = "\x1b[0m" if tokens.has_escapes else ""
+    return "".join(parts) + suffix + reset
+
+
+def console_width(console: Console, width: int | None = None) -> int:
+    """Width ``console`` lays out and aligns for.
+
+    The Console API doesn't expose a ``Console(width=...)`` value, so
+    callers that set one pass it as ``width``; otherwise this is the
+    terminal width detected for the console, or the OS's (``COLUMNS``,
+    then 80) when detection is off or found no size.
+    """
+    if width is not None:
+        return width
+    profile = console.terminal_profile
+    if profile is not None and profile.width > 0:
+        return profile.width
+    return shutil.get_terminal_size().columns
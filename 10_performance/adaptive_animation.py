@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Adaptive Frame Rate Demo
+========================
+
+Animation.run() (see 04_effects/animation.py) writes a frame, then sleeps
+``1 / fps``. Whatever the frame took to render and write comes on top of
+that sleep, so on a loaded host a 2 second animation takes 3 and every
+movement in it slows down.
+
+run_adaptive() in _animation.py schedules frames on the wall clock: it
+sleeps only for what is left of each frame's slot and drops the frames
+whose slots have already passed. This example shows:
+
+- A 2 second animation with slow frames: Animation.run vs run_adaptive
+- Per-frame render and write times, dropped frames and p99 frame time
+- Prebuilt frames (a list) over a slow link, dropped without being rendered
+- A live run in a terminal, with its stats
+"""
+
+import sys
+import time
+from collections.abc import Iterator
+from contextlib import redirect_stdout
+from io import StringIO
+from itertools import islice
+
+from _animation import FrameStats, run_adaptive
+from _frames import FrameLayout
+
+from styledconsole import Console, icons
+from styledconsole.animation import Animation
+
+console = Console()
+
+FPS = 20
+DURATION = 2.0
+SLOW_EVERY = 4  # every 4th frame stalls, as under load or a GC pause
+STALL = 0.12  # seconds
+
+layout = FrameLayout.compile(console, width=40, title="Transfer", border="rounded")
+
+
+def transfer_frames() -> Iterator[str]:
+    """A progress frame per tick; some ticks stall before the frame is ready."""
+    tick = 0
+    while True:
+        if tick % SLOW_EVERY == SLOW_EVERY - 1:
+            time.sleep(STALL)
+        done = min(tick * 100 // int(FPS * DURATION), 100)
+        bar = "█" * (done // 5) + "░" * (20 - done // 5)
+        yield layout.render([f"{bar} {done:3d}%", f"tick {tick}"]) + "\n"
+        tick += 1
+
+
+def stats_rows(stats: FrameStats) -> list[str]:
+    return [
+        f"Frames shown: {stats.shown}  dropped: {stats.dropped} ({stats.drop_rate:.0%})",
+        f"Achieved: {stats.achieved_fps:.1f} fps of {stats.fps:g}",
+        f"Frame time p50: {stats.p50_ms:.2f}ms  p99: {stats.p99_ms:.2f}ms",
+    ]
+
+
+def demo_loaded_host() -> None:
+    """The same stalling animation through both schedulers."""
+    frames = int(FPS * DURATION)
+    start = time.perf_counter()
+    with redirect_stdout(StringIO()):
+        Animation.run(islice(transfer_frames(), frames), fps=FPS)
+    fixed = time.perf_counter() - start
+
+    stats = run_adaptive(transfer_frames(), fps=FPS, duration=DURATION, stream=StringIO())
+
+    console.frame(
+        [
+            f"Target: {frames} frames at {FPS} fps = {DURATION:.1f}s"
+            f" (every {SLOW_EVERY}th frame stalls {STALL * 1000:.0f}ms)",
+            "",
+            f"Animation.run:  {fixed:5.2f}s wall time ({fixed / DURATION - 1:+.0%})",
+            f"run_adaptive:   {stats.elapsed:5.2f}s wall time ({stats.elapsed / DURATION - 1:+.0%})",
+            "",
+            *stats_rows(stats),
+        ],
+        title=f"{icons.STOPWATCH} Loaded Host",
+        border="rounded",
+        border_color="cyan",
+        width=72,
+    )
+
+
+class SlowLink(StringIO):
+    """A stream that takes a while to flush, like a terminal over SSH."""
+
+    LATENCY = 0.045
+
+    def flush(self) -> None:
+        time.sleep(self.LATENCY)
+
+
+def demo_prebuilt() -> None:
+    """Dropping from a list of frames costs nothing."""
+    prebuilt = [layout.render([f"{'█' * (i % 21):20} step", f"frame {i}"]) + "\n" for i in range(60)]
+
+    stats = run_adaptive(prebuilt, fps=30, duration=2.0, stream=SlowLink())
+    console.frame(
+        [
+            f"60 prebuilt frames at 30 fps over a link taking {SlowLink.LATENCY * 1000:.0f}ms per flush",
+            "",
+            *stats_rows(stats),
+            f"Slowest list lookup: {max(stats.render_ms) * 1000:.1f}us",
+        ],
+        title=f"{icons.PACKAGE} Prebuilt Frames",
+        border="rounded",
+        border_color="magenta",
+        width=72,
+    )
+
+
+def demo_live() -> None:
+    """The stalling animation on the terminal."""
+    if not sys.stdout.isatty():
+        console.text("(not a terminal - showing the final frame only)")
+        print(layout.render(["█" * 20 + " 100%", "done"]))
+        return
+    stats = run_adaptive(transfer_frames(), fps=FPS, duration=DURATION)
+    console.text(" | ".join(stats_rows(stats)))
+
+
+def main() -> None:
+    console.banner("ADAPTIVE")
+    console.text("Hold the frame schedule by dropping late frames")
+    console.newline()
+
+    demo_loaded_host()
+    console.newline()
+    demo_prebuilt()
+    console.newline()
+    demo_live()
+
+
+if __name__ == "__main__":
+    main()
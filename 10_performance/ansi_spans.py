@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+ANSI Span Tokenizer Demo
+========================
+
+Pre-colored input (tailed logs, output of other CLI tools) is stripped and
+re-scanned for escape sequences at every stage: measuring, truncating and
+padding. tokenize_ansi() in _width.py splits a line into escape and visible
+spans once and memoizes the result, so the other stages reuse it:
+
+- ansi_width(): width from the cached visible text
+- ansi_truncate(): cuts visible spans only, copies escapes through
+- ansi_pad(): pads using the cached width
+
+See 09_testing/test_rich_ansi.py for how frames display ANSI content.
+"""
+
+import time
+
+from _width import ansi_pad, ansi_truncate, ansi_width, span_widths, tokenize_ansi
+
+from styledconsole import Console, icons
+from styledconsole.utils.text import pad_to_width, truncate_to_width, visual_width
+
+console = Console()
+
+CONTENT_WIDTH = 66
+REPEATS = 20
+
+LEVELS = {
+    "INFO": "\033[32mINFO \033[0m",
+    "WARN": "\033[33mWARN \033[0m",
+    "ERROR": "\033[1;31mERROR\033[0m",
+}
+
+
+def make_colored_logs(count: int) -> list[str]:
+    """Log lines as a colorizing log shipper would emit them."""
+    lines = []
+    for i in range(count):
+        level = ("INFO", "INFO", "WARN", "ERROR")[i % 4]
+        lines.append(
+            f"\033[2m14:23:{i % 60:02d}.{i % 1000:03d}\033[0m {LEVELS[level]} "
+            f"\033[36mworker-{i % 8}:\033[0m processed batch \033[1m{i}\033[0m "
+            + "\033[2m(retry)\033[0m " * (i % 5)
+        )
+    return lines
+
+
+def fit_with_library(line: str) -> str:
+    """Measure, truncate and pad: each step strips escapes again."""
+    if visual_width(line) > CONTENT_WIDTH:
+        line = truncate_to_width(line, CONTENT_WIDTH)
+    return pad_to_width(line, CONTENT_WIDTH)
+
+
+def fit_with_spans(line: str) -> str:
+    """Same result from one cached tokenization per line."""
+    if ansi_width(line) > CONTENT_WIDTH:
+        line = ansi_truncate(line, CONTENT_WIDTH)
+    return ansi_pad(line, CONTENT_WIDTH)
+
+
+def timed_ms(fit, lines: list[str]) -> float:
+    """Fit every line REPEATS times with all caches cold at the start."""
+    visual_width.cache_clear()
+    tokenize_ansi.cache_clear()
+    span_widths.clear()
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        for line in lines:
+            fit(line)
+    return (time.perf_counter() - start) * 1000
+
+
+def demo_pipeline_cost() -> None:
+    """Compare the two pipelines on 200 colored log lines."""
+    lines = make_colored_logs(200)
+    library = timed_ms(fit_with_library, lines)
+    spans = timed_ms(fit_with_spans, lines)
+    same = [fit_with_library(line) for line in lines] == [fit_with_spans(line) for line in lines]
+    info = tokenize_ansi.cache_info()
+
+    console.frame(
+        [
+            f"Lines: {len(lines)}   Redraws: {REPEATS}",
+            "",
+            f"visual_width + truncate + pad:  {library:8.2f}ms",
+            f"tokenize_ansi spans:            {spans:8.2f}ms  ({library / spans:.1f}x faster)",
+            "",
+            f"Tokenizer cache: {info.hits:,} hits, {info.misses:,} misses",
+            f"Identical output: {same}",
+        ],
+        title=f"{icons.HIGH_VOLTAGE} Fitting Pre-colored Lines",
+        border="rounded",
+        border_color="cyan",
+        width=72,
+    )
+
+
+def demo_spans() -> None:
+    """Show what a tokenized line looks like."""
+    line = make_colored_logs(4)[3]
+    tokens = tokenize_ansi(line)
+    rows = [
+        f"{'ESC ' if is_escape else 'TEXT'} {span!r}" for is_escape, span in tokens.spans[:8]
+    ]
+    console.frame(
+        [*rows, "...", "", f"Visible width: {tokens.width}"],
+        title=f"{icons.MAG} Spans of One Line",
+        border="rounded",
+        border_color="magenta",
+        width=72,
+    )
+
+
+def demo_log_tail() -> None:
+    """Tail pre-colored lines into a frame."""
+    console.frame(
+        [fit_with_spans(line) for line in make_colored_logs(8)],
+        title=f"{icons.SCROLL} Colored Log Tail",
+        border="rounded",
+        border_color="blue",
+        width=CONTENT_WIDTH + 4,
+    )
+
+
+def main() -> None:
+    console.banner("ANSI SPANS")
+    console.text("Tokenize escape sequences once, reuse everywhere")
+    console.newline()
+
+    demo_pipeline_cost()
+    console.newline()
+    demo_spans()
+    console.newline()
+    demo_log_tail()
+
+
+if __name__ == "__main__":
+    main()
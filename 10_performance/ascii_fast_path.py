@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+ASCII Fast Path Demo
+====================
+
+Most log lines are plain 7-bit ASCII, yet split_graphemes() still builds a
+list of one-character strings for them and visual_width() walks that list.
+The helpers in _width.py check for ASCII up front:
+
+- fast_width(): len() for ASCII, also when wrapped in SGR color codes
+- fast_split_graphemes(): returns the string itself (a zero-copy sequence)
+
+This example times both on the "Simple frame" and "Long text truncation"
+strings from 09_testing/benchmark.py and on colored log lines.
+"""
+
+import time
+
+from _width import fast_split_graphemes, fast_width
+
+from styledconsole import Console, icons
+from styledconsole.utils.text import split_graphemes, visual_width
+
+console = Console()
+
+ITERATIONS = 2000
+
+SAMPLES = [
+    ("Simple frame", "Content"),
+    ("Truncation", "This is a very long line that will need truncation " * 5),
+    ("Log line", "2025-11-11 14:23:15.234  INFO     [HTTP] GET /api/users -> 200 (23ms)"),
+    (
+        "Colored log",
+        "\033[2m14:23:18.890\033[0m  \033[1;31mERROR\033[0m    [DB] Connection timeout",
+    ),
+]
+
+
+def per_call_us(func, text: str) -> float:
+    """Average microseconds per call over ITERATIONS calls."""
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        func(text)
+    return (time.perf_counter() - start) / ITERATIONS * 1e6
+
+
+def uncached_width(text: str) -> int:
+    """visual_width with the library's internal cache defeated."""
+    visual_width.cache_clear()
+    return visual_width(text)
+
+
+def demo_width() -> None:
+    """visual_width vs fast_width on ASCII input."""
+    lines = [f"{'Case':14} {'Width':>5} {'visual_width':>13} {'fast_width':>11} {'Speedup':>8}"]
+    for name, text in SAMPLES:
+        assert fast_width(text) == visual_width(text)
+        slow = per_call_us(uncached_width, text)
+        fast = per_call_us(fast_width, text)
+        lines.append(
+            f"{name:14} {fast_width(text):>5} {slow:>11.2f}µs {fast:>9.2f}µs {slow / fast:>7.0f}x"
+        )
+
+    console.frame(
+        lines,
+        title=f"{icons.HIGH_VOLTAGE} Width Measurement",
+        border="rounded",
+        border_color="cyan",
+        width=72,
+    )
+
+
+def demo_split() -> None:
+    """split_graphemes vs fast_split_graphemes on ASCII input."""
+    lines = [f"{'Case':14} {'Graphemes':>9} {'split':>11} {'fast_split':>11} {'Result':>8}"]
+    for name, text in SAMPLES:
+        graphemes = fast_split_graphemes(text)
+        assert list(graphemes) == split_graphemes(text)
+        slow = per_call_us(split_graphemes, text)
+        fast = per_call_us(fast_split_graphemes, text)
+        kind = "view" if graphemes is text else "list"
+        lines.append(f"{name:14} {len(graphemes):>9} {slow:>9.2f}µs {fast:>9.2f}µs {kind:>8}")
+
+    console.frame(
+        lines,
+        title=f"{icons.PAPERCLIP} Grapheme Splitting",
+        border="rounded",
+        border_color="magenta",
+        width=72,
+    )
+
+
+def main() -> None:
+    console.banner("ASCII FAST PATH")
+    console.text("Skip grapheme segmentation for plain 7-bit text")
+    console.newline()
+
+    demo_width()
+    console.newline()
+    demo_split()
+    console.newline()
+    console.text(
+        f"{icons.LIGHT_BULB} 'view' means the input string itself was returned: "
+        "no list, no copies."
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Asyncio Animation and Progress Demo
+===================================
+
+Animation.run() sleeps between frames with ``time.sleep`` and
+``console.progress()`` redraws from a Rich refresh thread. Inside an asyncio
+service the first stalls the event loop for the whole animation, and the
+second needs a thread next to the loop that every update races with.
+
+_animation.py adds asyncio-native versions:
+
+- ``await run_async(frames, fps=...)``: waits with ``asyncio.sleep`` and
+  accepts async generators, so frames can be built from awaited data
+- ``async with async_progress(console)``: a progress display redrawn by a
+  task on the loop
+
+This example shows:
+
+- Event loop lag while an animation plays: Animation.run vs run_async
+- An async generator feeding frames from a queue
+- Hundreds of concurrent tasks reporting to one progress display
+"""
+
+import asyncio
+import random
+import sys
+import time
+from collections.abc import AsyncIterator
+from contextlib import redirect_stdout
+from io import StringIO
+
+from _animation import async_progress, run_async
+from _frames import FrameLayout
+
+from styledconsole import Console, icons
+from styledconsole.animation import Animation
+
+console = Console()
+
+FPS = 20
+FRAMES = 30
+TASKS = 300
+
+layout = FrameLayout.compile(console, width=40, title="Deploy", border="rounded")
+
+
+def frame(tick: int) -> str:
+    done = tick * 100 // (FRAMES - 1)
+    return layout.render([f"{'█' * (done // 5):20} {done:3d}%", f"tick {tick}"]) + "\n"
+
+
+async def heartbeat(interval: float, lags: list[float]) -> None:
+    """Wake up every interval and record how late each wake-up was."""
+    loop = asyncio.get_running_loop()
+    while True:
+        expected = loop.time() + interval
+        await asyncio.sleep(interval)
+        lags.append(loop.time() - expected)
+
+
+async def with_heartbeat(work) -> float:
+    """Run ``work()`` next to a 10ms heartbeat; return the worst lag in ms."""
+    lags: list[float] = []
+    beat = asyncio.create_task(heartbeat(0.01, lags))
+    await asyncio.sleep(0)
+    await work()
+    await asyncio.sleep(0.02)  # let the heartbeat record its last wake-up
+    beat.cancel()
+    return max(lags, default=0.0) * 1000
+
+
+async def demo_loop_lag() -> None:
+    """How long other coroutines wait while an animation plays."""
+
+    async def blocking() -> None:
+        with redirect_stdout(StringIO()):
+            Animation.run((frame(i) for i in range(FRAMES)), fps=FPS)
+
+    async def cooperative() -> None:
+        await run_async((frame(i) for i in range(FRAMES)), fps=FPS, stream=StringIO())
+
+    blocked = await with_heartbeat(blocking)
+    cooperating = await with_heartbeat(cooperative)
+    console.frame(
+        [
+            f"{FRAMES} frames at {FPS} fps, next to a 10ms heartbeat task",
+            "",
+            f"Animation.run: heartbeat up to {blocked:7.1f}ms late",
+            f"run_async:     heartbeat up to {cooperating:7.1f}ms late",
+        ],
+        title=f"{icons.STOPWATCH} Event Loop Lag",
+        border="rounded",
+        border_color="cyan",
+        width=68,
+    )
+
+
+async def demo_async_frames() -> None:
+    """Frames built from results arriving on a queue."""
+    results: asyncio.Queue[int | None] = asyncio.Queue()
+
+    async def producer() -> None:
+        for i in range(FRAMES):
+            await asyncio.sleep(random.uniform(0.01, 0.06))
+            await results.put(i)
+        await results.put(None)
+
+    async def frames() -> AsyncIterator[str]:
+        while (tick := await results.get()) is not None:
+            yield frame(tick)
+
+    feed = asyncio.create_task(producer())
+    stats = await run_async(frames(), fps=FPS, stream=StringIO())
+    await feed
+    console.frame(
+        [
+            f"Frames shown: {stats.shown}  dropped: {stats.dropped}",
+            f"Achieved: {stats.achieved_fps:.1f} fps of {FPS}",
+            f"Longest wait for a frame: {max(stats.render_ms):.1f}ms, loop free meanwhile",
+        ],
+        title=f"{icons.PACKAGE} Async Generator Frames",
+        border="rounded",
+        border_color="magenta",
+        width=68,
+    )
+
+
+async def demo_progress() -> None:
+    """Hundreds of concurrent deploy steps on one display."""
+    lags: list[float] = []
+    beat = asyncio.create_task(heartbeat(0.01, lags))
+    start = time.perf_counter()
+
+    async with async_progress(console, transient=True) as progress:
+        task = progress.add_task("Deploying hosts", total=TASKS)
+
+        async def deploy(host: int) -> None:
+            await asyncio.sleep(random.uniform(0.1, 1.0))  # network round trips
+            progress.update(task, advance=1)
+
+        await asyncio.gather(*(deploy(host) for host in range(TASKS)))
+
+        async def checks() -> AsyncIterator[int]:
+            for check in range(20):
+                await asyncio.sleep(0.02)
+                yield check
+
+        async for _ in progress.track(checks(), "Health checks", total=20):
+            pass
+
+    elapsed = time.perf_counter() - start
+    beat.cancel()
+    console.frame(
+        [
+            f"{TASKS} concurrent tasks finished in {elapsed:.2f}s (slowest takes ~1s)",
+            f"Display redraws from the loop: {progress.refreshes}"
+            + ("" if sys.stdout.isatty() else "  (text fallback)"),
+            f"Heartbeat worst lag: {max(lags, default=0.0) * 1000:.1f}ms",
+            f"{icons.CHECK_MARK_BUTTON} All tasks finished: {progress.finished}",
+        ],
+        title=f"{icons.ROCKET} Async Progress",
+        border="rounded",
+        border_color="cyan",
+        width=68,
+    )
+
+
+async def main() -> None:
+    console.banner("ASYNC")
+    console.text("Animations and progress that never block the event loop")
+    console.newline()
+
+    await demo_loop_lag()
+    console.newline()
+    await demo_async_frames()
+    console.newline()
+    await demo_progress()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Background Progress Rendering Demo
+==================================
+
+Worker loops report progress with ``progress.update(task, advance=1)``
+(see 07_showcases/progress_demo.py). Every call goes into Rich's Progress
+on the worker's thread: it takes the progress lock and records a speed
+sample, a few microseconds each. Ingest workers that call it millions of
+times spend seconds on bookkeeping and contend for the lock.
+
+BackgroundProgress in _progress.py gives each task a TaskCounter that
+worker threads advance without locks. A render thread adds the counters
+up and updates Rich at most ``refresh_per_second`` times a second. This
+example shows:
+
+- Update cost from worker threads: StyledProgress vs counters
+- Exact totals with many writer threads (no lost updates)
+- A live multi-task display driven by the render thread
+"""
+
+import sys
+import threading
+import time
+from io import StringIO
+
+from _progress import BackgroundProgress
+
+from styledconsole import Console, RenderPolicy, icons
+
+console = Console()
+
+THREADS = 4
+UPDATES = 100_000  # per thread
+
+
+def run_workers(work) -> float:
+    """Run ``work()`` in THREADS threads; return the wall time in seconds."""
+    workers = [threading.Thread(target=work) for _ in range(THREADS)]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return time.perf_counter() - start
+
+
+def demo_update_cost() -> None:
+    """The same ingest loop reporting through each progress mode."""
+    # Rich output goes to a buffer so only the bookkeeping is measured
+    target = Console(file=StringIO(), policy=RenderPolicy.full())
+    total = THREADS * UPDATES
+
+    with target.progress() as progress:
+        task = progress.add_task("Ingest", total=total)
+
+        def styled_worker() -> None:
+            for _ in range(UPDATES):
+                progress.update(task, advance=1)
+
+        styled = run_workers(styled_worker)
+
+    with BackgroundProgress(target) as background:
+        counter = background.add_task("Ingest", total=total)
+
+        def update_worker() -> None:
+            for _ in range(UPDATES):
+                background.update(counter, advance=1)
+
+        via_update = run_workers(update_worker)
+
+    with BackgroundProgress(target) as background:
+        counter = background.add_task("Ingest", total=total)
+
+        def counter_worker() -> None:
+            advance = counter.advance
+            for _ in range(UPDATES):
+                advance()
+
+        via_counter = run_workers(counter_worker)
+        counted = counter.completed
+    refreshes = background.refreshes
+
+    console.frame(
+        [
+            f"{THREADS} threads x {UPDATES:,} updates = {total:,}",
+            "",
+            f"StyledProgress.update:         {styled:6.2f}s  {styled / total * 1e6:5.2f}us/update",
+            f"BackgroundProgress.update:     {via_update:6.2f}s  {via_update / total * 1e6:5.2f}us/update",
+            f"TaskCounter.advance:           {via_counter:6.2f}s  {via_counter / total * 1e6:5.2f}us/update",
+            "",
+            f"Counted {counted:,.0f} of {total:,} with {refreshes} redraw(s)"
+            f" ({styled / via_counter:.1f}x faster)",
+        ],
+        title=f"{icons.STOPWATCH} Update Cost",
+        border="rounded",
+        border_color="cyan",
+        width=72,
+    )
+
+
+def demo_live() -> None:
+    """Three tasks advanced from worker threads, drawn by the render thread."""
+    if not sys.stdout.isatty():
+        console.text("(not a terminal - text progress on stderr)")
+    with BackgroundProgress(console, refresh_per_second=15) as progress:
+        tasks = [
+            (progress.add_task("Fetching data", total=50_000), 0.5),
+            (progress.add_task("Processing", total=75_000), 0.75),
+            (progress.add_task("Saving", total=100_000), 1.0),
+        ]
+
+        def worker(task, share: float) -> None:
+            for _ in range(int(task.total / share) // 1000):
+                time.sleep(0.015)  # fetch a batch
+                for _ in range(1000):
+                    task.advance(share)
+
+        threads = [threading.Thread(target=worker, args=task) for task in tasks]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    console.text(
+        f"  {icons.CHECK_MARK_BUTTON} All tasks complete: {progress.finished}"
+        f" ({progress.refreshes} redraws)"
+    )
+
+
+def main() -> None:
+    console.banner("COUNTERS")
+    console.text("Progress updates without locks, drawn by a render thread")
+    console.newline()
+
+    demo_update_cost()
+    console.newline()
+    demo_live()
+
+
+if __name__ == "__main__":
+    main()
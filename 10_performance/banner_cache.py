@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Banner Cache Demo
+=================
+
+Welcome screens and reports (see 05_banners/welcome_screens.py) print the
+same few FIGlet headers again and again. Each ``console.banner()`` call lays
+the text out glyph by glyph, colors it and renders it through Rich, and every
+new process parses the font file from scratch before the first banner.
+
+_banners.py caches each stage:
+
+- FontCache: parsed fonts in memory, plus a binary cache on disk so the next
+  process skips the font parse
+- figlet_lines: the uncolored layout, memoized per (text, font, width)
+- BannerCache: the finished banner, memoized per (text, font, width, options)
+
+This example shows:
+
+- Font load time: pyfiglet parse vs disk cache vs memory
+- Layout time: Figlet().renderText() vs figlet_lines()
+- A refreshed report: console.banner() vs BannerCache, same output
+"""
+
+import time
+from io import StringIO
+
+import pyfiglet
+from _banners import BannerCache, FontCache, figlet_lines
+from _width import console_width
+
+from styledconsole import Console, EffectSpec, icons
+
+console = Console()
+
+FONTS = ("standard", "slant", "small")
+SECTIONS = ("OVERVIEW", "BUILD", "TESTS", "DEPLOY", "SUMMARY")
+REFRESHES = 20
+EFFECT = EffectSpec.gradient("cyan", "magenta")
+
+
+def per_call_ms(fn, runs: int = 200) -> float:
+    """Mean time of ``fn()`` in milliseconds."""
+    start = time.perf_counter()
+    for _ in range(runs):
+        fn()
+    return (time.perf_counter() - start) / runs * 1000
+
+
+def demo_font_load() -> None:
+    """Parsing a font vs reading it back from the disk cache."""
+    writer = FontCache()
+    writer.clear(disk=True)
+    rows = [f"{'Font':10} {'Parse':>9} {'Disk':>9} {'Memory':>9}"]
+    for font in FONTS:
+        parse = per_call_ms(lambda f=font: pyfiglet.FigletFont(f), runs=20)
+        writer.get(font)  # parses once and writes the cache file
+        disk = per_call_ms(lambda f=font: FontCache().get(f), runs=20)
+        memory = per_call_ms(lambda f=font: writer.get(f))
+        rows.append(f"{font:10} {parse:7.2f}ms {disk:7.2f}ms {memory:7.4f}ms")
+
+    console.frame(
+        [
+            *rows,
+            "",
+            "Disk: a new FontCache per call, as in a fresh process.",
+            f"Cache files: {writer.cache_dir}",
+        ],
+        title=f"{icons.FLOPPY_DISK} Font Load",
+        border="rounded",
+        border_color="cyan",
+        width=72,
+    )
+
+
+def demo_layout() -> None:
+    """Laying out the same header text again vs the memoized layout."""
+    rows = [f"{'Font':10} {'renderText':>11} {'figlet_lines':>13}  Same"]
+    for font in FONTS:
+        figlet = pyfiglet.Figlet(font=font, width=1000)
+        figlet_lines("OVERVIEW", font)
+        render = per_call_ms(lambda f=figlet: f.renderText("OVERVIEW"))
+        cached = per_call_ms(lambda f=font: figlet_lines("OVERVIEW", f))
+        same = list(figlet_lines("OVERVIEW", font)) == (
+            figlet.renderText("OVERVIEW").rstrip("\n").split("\n")
+        )
+        rows.append(f"{font:10} {render:9.3f}ms {cached:11.4f}ms  {same}")
+
+    console.frame(
+        rows,
+        title=f"{icons.STOPWATCH} Layout per Banner",
+        border="rounded",
+        border_color="magenta",
+        width=72,
+    )
+
+
+def demo_report() -> None:
+    """A report with five section banners, refreshed repeatedly."""
+    width = console_width(console)
+    policy = console.policy
+
+    def plain() -> str:
+        buffer = StringIO()
+        target = Console(file=buffer, width=width, policy=policy)
+        for section in SECTIONS:
+            target.banner(section, font="slant", effect=EFFECT)
+        return buffer.getvalue()
+
+    banners = BannerCache.for_console(console)
+
+    def cached() -> str:
+        buffer = StringIO()
+        for section in SECTIONS:
+            banners.print(section, file=buffer, font="slant", effect=EFFECT)
+        return buffer.getvalue()
+
+    same = plain() == cached()
+    plain_ms = per_call_ms(plain, runs=REFRESHES)
+    cached_ms = per_call_ms(cached, runs=REFRESHES)
+    stats = banners.stats()
+
+    console.frame(
+        [
+            f"console.banner() x{len(SECTIONS)}:  {plain_ms:7.2f}ms per refresh",
+            f"BannerCache x{len(SECTIONS)}:       {cached_ms:7.3f}ms per refresh"
+            f"  ({plain_ms / cached_ms:.0f}x faster)",
+            "",
+            f"Hits: {stats.hits}  Misses: {stats.misses}  Hit rate: {stats.hit_rate:.1%}",
+            f"{icons.CHECK_MARK_BUTTON if same else icons.CROSS_MARK} Output identical: {same}",
+        ],
+        title=f"{icons.ROCKET} Report Refresh ({REFRESHES} refreshes)",
+        border="rounded",
+        border_color="cyan",
+        width=72,
+    )
+    console.newline()
+    banners.print("SUMMARY", font="slant", effect=EFFECT)
+
+
+def main() -> None:
+    console.banner("BANNERS")
+    console.text("Lay out each FIGlet header once and reuse it")
+    console.newline()
+
+    demo_font_load()
+    console.newline()
+    demo_layout()
+    console.newline()
+    demo_report()
+
+
+if __name__ == "__main__":
+    main()
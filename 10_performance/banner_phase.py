@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Banner Phase Animation Demo
+===========================
+
+An animated banner is a FIGlet header whose gradient moves: every frame
+renders the same text with ``EffectSpec.rainbow(phase=...)``. Done the usual
+way (04_effects/animation.py), each frame lays the text out again, builds the
+border and resolves the gradient cell by cell, although only the phase
+changed.
+
+BannerArt in _banners.py splits the banner into an uncolored glyph matrix,
+laid out once, and a coloring pass that takes its colors from a cached
+gradient ramp. This example shows:
+
+- Per-frame cost: layout + render_frame(effect) vs the coloring pass alone
+- Ramps reused across animation cycles (RampCache counters)
+- Identical output to ``render_frame(effect=...)`` on the same glyphs
+- A live animated banner when running in a terminal
+"""
+
+import sys
+import time
+
+import pyfiglet
+from _banners import BannerArt
+from _gradients import RampCache
+
+from styledconsole import Console, EffectSpec, RenderPolicy, icons
+from styledconsole.animation import Animation
+
+console = Console()
+color_console = Console(policy=RenderPolicy.full())
+
+TEXT = "LIVE"
+FONT = "slant"
+STEPS = 30
+CYCLES = 3
+EFFECT = EffectSpec.rainbow(direction="diagonal")
+
+
+def relayout_frame(phase: float) -> str:
+    """One frame the usual way: layout, border and gradient from scratch."""
+    lines = pyfiglet.Figlet(font=FONT, width=1000).renderText(TEXT).rstrip("\n").split("\n")
+    return color_console.render_frame(lines, border="double", effect=EFFECT.with_phase(phase))
+
+
+def demo_frame_cost() -> None:
+    """Three animation cycles rendered both ways."""
+    phases = [(i % STEPS) / STEPS for i in range(STEPS * CYCLES)]
+
+    start = time.perf_counter()
+    relayout = [relayout_frame(phase) for phase in phases]
+    relayout_ms = (time.perf_counter() - start) / len(phases) * 1000
+
+    cache = RampCache()
+    start = time.perf_counter()
+    art = BannerArt(color_console, TEXT, font=FONT, border="double", align="left")
+    split = list(art.frames(EFFECT, steps=STEPS, cycles=CYCLES, cache=cache))
+    split_ms = (time.perf_counter() - start) / len(phases) * 1000
+
+    same = relayout == split
+    stats = cache.stats()
+    console.frame(
+        [
+            f"Frames: {len(phases)} ({CYCLES} cycles of {STEPS} phase steps)",
+            f"Glyph matrix: {len(art.lines)} rows x {art.cols} columns",
+            "",
+            f"Layout + render_frame(effect): {relayout_ms:6.2f}ms per frame",
+            f"BannerArt coloring pass:       {split_ms:6.2f}ms per frame"
+            f"  ({relayout_ms / split_ms:.0f}x faster)",
+            "",
+            f"Ramps built: {stats.misses}  reused: {stats.hits}  hit rate: {stats.hit_rate:.1%}",
+            f"{icons.CHECK_MARK_BUTTON if same else icons.CROSS_MARK} Output identical: {same}",
+        ],
+        title=f"{icons.STOPWATCH} Animated Banner",
+        border="rounded",
+        border_color="cyan",
+        width=72,
+    )
+
+
+def demo_effects() -> None:
+    """One layout, colored with several effects and phases."""
+    art = BannerArt(console, "PHASE", font="small")
+    for effect in (
+        EffectSpec.gradient("cyan", "magenta", direction="horizontal"),
+        EffectSpec.rainbow(direction="diagonal", phase=0.5),
+    ):
+        print(art.render(effect))
+    console.text(f"{icons.CHECK_MARK_BUTTON} Layout built once for {len(art.lines)} rows")
+
+
+def demo_live() -> None:
+    """The banner animated in place."""
+    if not sys.stdout.isatty():
+        console.text("(not a terminal - showing the first frame only)")
+        art = BannerArt(console, TEXT, font=FONT, border="double")
+        print(art.render(EFFECT))
+        return
+    art = BannerArt(console, TEXT, font=FONT, border="double")
+    Animation.run(art.frames(EFFECT, steps=STEPS, cycles=CYCLES), fps=15)
+
+
+def main() -> None:
+    console.banner("PHASE")
+    console.text("Lay the banner out once, recolor it per frame")
+    console.newline()
+
+    demo_frame_cost()
+    console.newline()
+    demo_effects()
+    console.newline()
+    demo_live()
+
+
+if __name__ == "__main__":
+    main()
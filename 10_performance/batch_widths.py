@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Batch Width Measurement Demo
+============================
+
+Frame content lists, table rows and column items are usually measured one
+string at a time. visual_widths() (see _width.py) measures a whole batch in
+one call and returns a compact array("I"), so a 500-row table costs one call
+per column instead of one call per cell.
+
+This example shows:
+- Per-cell visual_width() vs one visual_widths() batch per column
+- A frame sized from a single batch over its lines
+- A GradientTable and StyledColumns given precomputed widths, which lets
+  Rich skip measuring every cell during layout
+"""
+
+import time
+
+from _width import column_widths, visual_widths
+
+from styledconsole import Console, StyledColumns, icons
+from styledconsole.presets.tables import GradientTable
+from styledconsole.utils.text import visual_width
+
+console = Console()
+
+ROW_COUNT = 500
+STATUSES = [
+    f"{icons.CHECK_MARK_BUTTON} Online",
+    f"{icons.ORANGE_CIRCLE} Degraded",
+    f"{icons.CROSS_MARK} Offline",
+]
+
+
+def make_rows(count: int) -> list[list[str]]:
+    """Build an inventory table: host, address, cpu, memory, status."""
+    return [
+        [
+            f"prod-web-{i:03d}",
+            f"10.0.{i // 256}.{i % 256}",
+            f"{(i * 37) % 100}%",
+            f"{(i * 13) % 64 + 1} GB",
+            STATUSES[i % len(STATUSES)],
+        ]
+        for i in range(count)
+    ]
+
+
+def per_cell_widths(rows: list[list[str]]) -> list[int]:
+    """Column widths the usual way: one uncached call per cell."""
+    widths = [0] * len(rows[0])
+    for row in rows:
+        for col, cell in enumerate(row):
+            visual_width.cache_clear()
+            widths[col] = max(widths[col], visual_width(cell))
+    return widths
+
+
+def timed(func, *args):
+    """Return (result, milliseconds)."""
+    start = time.perf_counter()
+    result = func(*args)
+    return result, (time.perf_counter() - start) * 1000
+
+
+def format_rows(rows: list[list[str]], widths: list[int]) -> list[str]:
+    """Left-align cells using widths measured per column in one batch."""
+    columns = [visual_widths(list(column)) for column in zip(*rows)]
+    lines = []
+    for r, row in enumerate(rows):
+        cells = [cell + " " * (widths[c] - columns[c][r]) for c, cell in enumerate(row)]
+        lines.append("  ".join(cells))
+    return lines
+
+
+def demo_table_layout() -> None:
+    """Measure a 500-row table both ways."""
+    rows = make_rows(ROW_COUNT)
+    slow_widths, slow_ms = timed(per_cell_widths, rows)
+    fast_widths, fast_ms = timed(column_widths, rows)
+
+    console.frame(
+        [
+            f"Rows: {ROW_COUNT}   Columns: {len(rows[0])}   Cells: {ROW_COUNT * len(rows[0]):,}",
+            "",
+            f"Per-cell visual_width:  {slow_ms:8.2f}ms",
+            f"visual_widths batches:  {fast_ms:8.2f}ms  ({slow_ms / fast_ms:.0f}x faster)",
+            "",
+            f"Column widths: {fast_widths}",
+            f"Same result:   {slow_widths == fast_widths}",
+        ],
+        title=f"{icons.BAR_CHART} 500-Row Table Layout",
+        border="rounded",
+        border_color="cyan",
+        width=72,
+    )
+
+
+def demo_frame_sizing() -> None:
+    """Size a frame to its content from one batch over all lines."""
+    rows = make_rows(6)
+    header = ["HOST", "ADDRESS", "CPU", "MEMORY", "STATUS"]
+    widths = column_widths([header, *rows])
+    lines = format_rows([header, *rows], widths)
+
+    # Content width + 2 borders + 2 padding
+    frame_width = max(visual_widths(lines)) + 4
+    console.frame(
+        lines,
+        title=f"{icons.LAPTOP} Inventory (frame width {frame_width})",
+        border="rounded",
+        border_color="green",
+        width=frame_width,
+    )
+
+
+def demo_rich_layouts() -> None:
+    """Hand precomputed widths to GradientTable and StyledColumns."""
+    rows = make_rows(5)
+    header = ["HOST", "ADDRESS", "CPU", "MEMORY", "STATUS"]
+    widths = column_widths([header, *rows])
+
+    table = GradientTable(
+        border_style="heavy",
+        border_gradient_start="cyan",
+        border_gradient_end="magenta",
+    )
+    for name, width in zip(header, widths):
+        table.add_column(name, width=width, no_wrap=True)
+    for row in rows:
+        table.add_row(*row)
+    console.print(table)
+
+    items = [f"{icons.PACKAGE} worker-{i:02d}" for i in range(12)]
+    console.print(StyledColumns(items, width=max(visual_widths(items)), padding=(0, 2)))
+
+
+def main() -> None:
+    console.banner("BATCH WIDTHS")
+    console.text("One call per column instead of one call per cell")
+    console.newline()
+
+    demo_table_layout()
+    console.newline()
+    demo_frame_sizing()
+    console.newline()
+    demo_rich_layouts()
+
+
+if __name__ == "__main__":
+    main()
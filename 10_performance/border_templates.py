@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Border Template Cache Demo
+==========================
+
+BorderStyle.render_top_border(), render_line(), render_divider() and
+render_bottom_border() rebuild their horizontal runs on every call. The
+BorderTemplates wrapper in _frames.py keeps prebuilt borders, dividers and
+padded empty lines per width, so redrawing a frame at the same width only
+splices content between two vertical bars.
+
+This example re-runs the frame cases from 09_testing/benchmark.py against
+both and checks that every border style produces identical output.
+"""
+
+import time
+
+from _frames import get_templates
+
+from styledconsole import ASCII, DOTS, DOUBLE, HEAVY, MINIMAL, ROUNDED, SOLID, THICK, Console, icons
+
+console = Console()
+
+ITERATIONS = 2000
+STYLES = [SOLID, DOUBLE, ROUNDED, HEAVY, THICK, DOTS, ASCII, MINIMAL]
+
+
+def simple_frame(border) -> None:
+    border.render_top_border(50, "Test")
+    border.render_line(50, "Content")
+    border.render_bottom_border(50)
+
+
+def emoji_frame(border) -> None:
+    border.render_top_border(50, "🚀 🎨 🎯 Test 🌟 ✨")
+    border.render_line(50, "🔥 Content with emojis 🎉", align="center")
+    border.render_bottom_border(50)
+
+
+def complex_frame(border) -> None:
+    border.render_top_border(60, "🎨 Complex Frame")
+    for i in range(5):
+        border.render_line(60, f"Line {i} with 🎯 emoji", align="left")
+    border.render_divider(60)
+    for i in range(3):
+        border.render_line(60, f"More content {i}", align="center")
+    border.render_bottom_border(60)
+
+
+def per_call_us(case, border) -> float:
+    """Average microseconds per frame over ITERATIONS frames."""
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        case(border)
+    return (time.perf_counter() - start) / ITERATIONS * 1e6
+
+
+def demo_benchmark() -> None:
+    """benchmark.py frame cases: BorderStyle vs BorderTemplates."""
+    lines = [f"{'Case':26} {'BorderStyle':>12} {'Templates':>10} {'Speedup':>8}"]
+    for name, case, style in [
+        ("Simple frame", simple_frame, SOLID),
+        ("Emoji frame", emoji_frame, ROUNDED),
+        ("Complex frame (10 lines)", complex_frame, DOUBLE),
+    ]:
+        plain = per_call_us(case, style)
+        cached = per_call_us(case, get_templates(style))
+        lines.append(f"{name:26} {plain:>10.2f}µs {cached:>8.2f}µs {plain / cached:>7.1f}x")
+
+    console.frame(
+        lines,
+        title=f"{icons.STOPWATCH} Redraw Loop Cost",
+        border="rounded",
+        border_color="cyan",
+        width=68,
+    )
+
+
+def demo_equivalence() -> None:
+    """Every requested border style renders byte-identical output."""
+    rows = []
+    for style in STYLES:
+        templates = get_templates(style)
+        checks = 0
+        for width in (10, 30, 60):
+            for text in ("", "Content", "🔥 Content with emojis 🎉", "x" * 80):
+                for align in ("left", "center", "right"):
+                    assert templates.render_line(width, text, align) == style.render_line(
+                        width, text, align
+                    )
+                    checks += 1
+                assert templates.render_top_border(width, text) == style.render_top_border(
+                    width, text
+                )
+            assert templates.render_divider(width) == style.render_divider(width)
+            assert templates.render_bottom_border(width) == style.render_bottom_border(width)
+            checks += 6
+        rows.append(f"{icons.CHECK_MARK_BUTTON} {style.name:8} {checks} renders identical")
+
+    console.frame(
+        rows,
+        title=f"{icons.MAG} Output Equivalence",
+        border="rounded",
+        border_color="green",
+        width=68,
+    )
+
+
+def demo_cached_frame() -> None:
+    """A frame drawn entirely from cached templates."""
+    border = get_templates(HEAVY)
+    width = 50
+    print(border.render_top_border(width, "⚡ Cached Templates"))
+    print(border.render_line(width, "Borders and empty lines are prebuilt", align="center"))
+    print(border.render_line(width))
+    print(border.render_divider(width))
+    for i in range(3):
+        print(border.render_line(width, f"  Row {i}: only this text is spliced in"))
+    print(border.render_bottom_border(width))
+
+
+def main() -> None:
+    console.banner("TEMPLATES")
+    console.text("Prebuilt border strings per (style, width)")
+    console.newline()
+
+    demo_benchmark()
+    console.newline()
+    demo_equivalence()
+    console.newline()
+    demo_cached_frame()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Columnar Table Storage Demo
+===========================
+
+Every ``add_row()`` on a StyledTable stores a Row object and appends each
+cell to its column as a separate string, and printing measures each of
+those cells one by one. A table of numeric metrics costs several hundred
+bytes per row before anything is printed.
+
+ColumnarTable in _tables.py keeps each column in one contiguous store:
+numeric columns (``add_column(..., format="{:.1f}")``) are an
+``array("d")`` formatted only when printed, other columns a list of
+strings. Styles are one per column plus sparse per-row and per-cell
+overrides, and widths are measured one column per batch. This example
+shows:
+
+- Memory per row for a metrics table: StyledTable vs ColumnarTable
+- The same output as StyledTable and GradientTable
+- Per-cell style overrides without a style stored on every cell
+"""
+
+import time
+import tracemalloc
+from io import StringIO
+
+from _tables import ColumnarGradientTable, ColumnarTable
+
+from styledconsole import Console, RenderPolicy, icons
+from styledconsole.presets.tables import GradientTable
+from styledconsole.table import StyledTable
+from styledconsole.utils.text import strip_ansi
+
+console = Console()
+
+METRICS = ["CPU %", "MEM %", "P50 ms", "P95 ms", "P99 ms", "RPS", "ERR %"]
+ROWS = 100_000
+
+
+def sample(index: int) -> list[float]:
+    """One minute of service metrics (synthetic)."""
+    return [
+        float(index),
+        index * 37 % 1000 / 10,
+        index * 13 % 1000 / 10,
+        index * 7 % 400 / 10 + 2,
+        index * 11 % 900 / 10 + 20,
+        index * 17 % 2400 / 10 + 60,
+        index * 29 % 50000 / 10,
+        index % 97 / 100,
+    ]
+
+
+def build(cls: type[StyledTable], rows: int) -> StyledTable:
+    """A metrics table; columnar tables get raw numbers, others formatted strings."""
+    columnar = issubclass(cls, ColumnarTable)
+    table = cls(title="Service Metrics")
+    table.add_column("MINUTE", justify="right", **({"format": "{:.0f}"} if columnar else {}))
+    for header in METRICS:
+        table.add_column(header, justify="right", **({"format": "{:.1f}"} if columnar else {}))
+    for index in range(rows):
+        values = sample(index)
+        if columnar:
+            table.add_row(*values)
+        else:
+            table.add_row(f"{values[0]:.0f}", *(f"{value:.1f}" for value in values[1:]))
+    return table
+
+
+def held_bytes(cls: type[StyledTable], rows: int) -> float:
+    """Memory still allocated once the table is built, in bytes."""
+    tracemalloc.start()
+    try:
+        table = build(cls, rows)
+        held = tracemalloc.get_traced_memory()[0]
+        del table
+        return held
+    finally:
+        tracemalloc.stop()
+
+
+def render(table: StyledTable) -> str:
+    buffer = StringIO()
+    Console(file=buffer, policy=RenderPolicy.full(), width=100).print(table)
+    return buffer.getvalue()
+
+
+def demo_memory() -> None:
+    """Bytes per row while the rows wait to be printed."""
+    styled = held_bytes(StyledTable, ROWS) / ROWS
+    columnar = held_bytes(ColumnarTable, ROWS) / ROWS
+
+    table = build(ColumnarTable, ROWS)
+    start = time.perf_counter()
+    widths = table.column_widths()
+    measured = (time.perf_counter() - start) * 1000
+
+    console.frame(
+        [
+            f"{ROWS:,} rows x {len(METRICS) + 1} numeric columns",
+            "",
+            f"StyledTable:    {styled:6.0f} bytes/row  ({styled * ROWS / 1e6:5.1f} MB)",
+            f"ColumnarTable:  {columnar:6.0f} bytes/row  ({columnar * ROWS / 1e6:5.1f} MB)",
+            f"{styled / columnar:.1f}x less memory",
+            "",
+            f"Column widths {widths} measured in {measured:.0f}ms",
+        ],
+        title=f"{icons.BAR_CHART} Memory per Row",
+        border="rounded",
+        border_color="cyan",
+        width=72,
+    )
+
+
+def demo_same_output() -> None:
+    """ColumnarTable next to StyledTable, and the gradient variants."""
+    results = []
+    for library, columnar in ((StyledTable, ColumnarTable), (GradientTable, ColumnarGradientTable)):
+        # GradientTable writes a blank line after every line; compare the others
+        expected = [strip_ansi(line) for line in render(build(library, 50)).split("\n") if line]
+        got = [strip_ansi(line) for line in render(build(columnar, 50)).split("\n") if line]
+        results.append((library.__name__, columnar.__name__, expected == got))
+
+    console.frame(
+        [
+            f"{icons.CHECK_MARK_BUTTON if same else icons.CROSS_MARK}"
+            f" {columnar} prints the same text as {library}: {same}"
+            for library, columnar, same in results
+        ],
+        title=f"{icons.SPARKLES} Output Check",
+        border="rounded",
+        border_color="magenta",
+        width=72,
+    )
+
+
+def demo_overrides() -> None:
+    """Column styles, plus a handful of overrides for the outliers."""
+    table = ColumnarGradientTable(title="Slowest Minutes")
+    table.add_column("MINUTE", justify="right", style="dim", format="{:.0f}")
+    for header in METRICS:
+        table.add_column(header, justify="right", style="cyan", format="{:.1f}")
+    day = sorted(range(1440), key=lambda minute: sample(minute)[5], reverse=True)
+    overrides = 0
+    for index in sorted(day[:10]):
+        values = sample(index)
+        table.add_row(*values, styles={7: "bold yellow"} if values[7] > 0.5 else None)
+        if values[5] >= 299.5:
+            table.set_style(table.row_count - 1, 5, "bold red")
+        overrides += (values[7] > 0.5) + (values[5] >= 299.5)
+    console.print(table)
+    console.text(
+        f"  {icons.LIGHT_BULB} {len(table.columns)} column styles and {overrides} cell overrides"
+        f" for {table.row_count * len(table.columns)} cells"
+    )
+
+
+def main() -> None:
+    console.banner("COLUMNS")
+    console.text("Metrics tables stored column by column")
+    console.newline()
+
+    demo_memory()
+    console.newline()
+    demo_same_output()
+    console.newline()
+    demo_overrides()
+
+
+if __name__ == "__main__":
+    main()
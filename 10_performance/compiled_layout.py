@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Compiled Frame Layout Demo
+==========================
+
+Console.render_frame() resolves the border style, title, colors, padding and
+margins on every call. A monitoring screen that redraws the same frame shell
+ten times per second with new numbers repeats that work every time.
+
+FrameLayout.compile() in _frames.py resolves the specification once into an
+immutable object holding the finished borders and the prefix/suffix around
+each content line; render() only fills in the body. This example shows:
+
+- render_frame() vs FrameLayout.render() for a metrics panel
+- Identical output across titles, colors, margins and alignments
+- A panel redrawn from one compiled layout
+"""
+
+import time
+
+from _frames import FrameLayout
+
+from styledconsole import Console, RenderPolicy, icons
+
+console = Console()
+
+ITERATIONS = 300
+PANEL = {
+    "width": 48,
+    "title": "📈 web-01 metrics",
+    "border": "rounded",
+    "border_color": "cyan",
+    "title_color": "white",
+    "padding": 2,
+}
+
+
+def metrics(tick: int) -> list[str]:
+    """Panel body for one refresh; the numbers change, the labels do not."""
+    return [
+        f"CPU      {(tick * 7) % 100:3d}%",
+        f"Memory   {(tick * 3) % 64:3d} GB",
+        f"Requests {tick * 13 % 5000:5d}/s",
+        "",
+        "🟢 healthy" if tick % 10 else "🟠 degraded",
+    ]
+
+
+def per_call_us(render) -> float:
+    """Average microseconds per refresh over ITERATIONS refreshes."""
+    start = time.perf_counter()
+    for tick in range(ITERATIONS):
+        render(metrics(tick))
+    return (time.perf_counter() - start) / ITERATIONS * 1e6
+
+
+def demo_benchmark() -> None:
+    """Per-refresh cost at ten refreshes per second."""
+    layout = FrameLayout.compile(console, **PANEL)
+
+    plain = per_call_us(lambda body: console.render_frame(body, **PANEL))
+    compiled = per_call_us(layout.render)
+
+    console.frame(
+        [
+            f"render_frame():       {plain:9.1f}µs per refresh",
+            f"FrameLayout.render(): {compiled:9.1f}µs per refresh",
+            f"Speedup:              {plain / compiled:9.1f}x",
+            "",
+            f"CPU per second at 10 Hz: {plain * 10 / 1000:.2f}ms -> {compiled * 10 / 1000:.2f}ms",
+        ],
+        title=f"{icons.BAR_CHART} Monitoring Refresh Cost",
+        border="rounded",
+        border_color="cyan",
+        width=68,
+    )
+
+
+def demo_equivalence() -> None:
+    """Compiled layouts reproduce render_frame() byte for byte, colors included."""
+    colored = Console(policy=RenderPolicy.full())  # colors on even when piped
+    specs = [
+        {"width": 40},
+        {"width": 40, "title": "CPU", "border": "double", "align": "center"},
+        {"width": 44, "border": "heavy", "margin": (1, 0, 1, 4), "align": "right"},
+        {"width": 44, "title": "🎨 Colors", "border_color": "magenta", "content_color": "green"},
+    ]
+    bodies = [
+        metrics(0),
+        metrics(5),
+        ["[bold]markup[/] after", "\033[31mpre-colored\033[0m after", "⚠️ VS16 emoji", "x" * 80],
+        "",
+    ]
+
+    rows = []
+    for spec in specs:
+        layout = FrameLayout.compile(colored, **spec)
+        for body in bodies:
+            assert layout.render(body) == colored.render_frame(body, **spec)
+        options = ", ".join(key for key in spec if key != "width")
+        rows.append(f"{icons.CHECK_MARK_BUTTON} width={spec['width']} {options or '(defaults)'}")
+
+    console.frame(
+        rows,
+        title=f"{icons.MAG} Output Equivalence ({len(bodies)} bodies each)",
+        border="rounded",
+        border_color="green",
+        width=68,
+    )
+
+
+def demo_panel() -> None:
+    """One layout, several refreshes."""
+    layout = FrameLayout.compile(console, **PANEL)
+    for tick in (9, 10):
+        print(layout.render(metrics(tick)))
+
+
+def main() -> None:
+    console.banner("LAYOUTS")
+    console.text("Compile the frame shell once, fill in the body per refresh")
+    console.newline()
+
+    demo_benchmark()
+    console.newline()
+    demo_equivalence()
+    console.newline()
+    demo_panel()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Incremental Frame Diffing Demo
+==============================
+
+Animation.run() (see 04_effects/animation.py) redraws a frame in place by
+moving the cursor to the top of the previous frame and writing the whole new
+one. For a dashboard where only a few counters change, most of those bytes
+repaint identical lines; over SSH that saturates slow links and flickers.
+
+FrameDiffer in _frames.py remembers the previous frame's lines and emits
+cursor movements to skip the unchanged ones. This example shows:
+
+- Bytes sent per refresh: full redraw vs diffed redraw
+- A live dashboard driven by run_diffed() (terminals only)
+"""
+
+import sys
+from collections.abc import Iterator
+
+from _frames import FrameDiffer, FrameLayout, run_diffed
+
+from styledconsole import Console, icons
+
+console = Console()
+
+TICKS = 100
+SERVICES = ["api", "auth", "billing", "cache", "db", "queue", "search", "web"]
+
+layout = FrameLayout.compile(
+    console,
+    width=52,
+    title="🖥️ Service Dashboard",
+    border="rounded",
+    border_color="cyan",
+)
+
+
+def dashboard(tick: int) -> str:
+    """Frame for one tick: the request counter of one service changes."""
+    lines = ["SERVICE   STATUS        REQUESTS", ""]
+    for i, name in enumerate(SERVICES):
+        # Each service is polled on every len(SERVICES)-th tick
+        polls = (tick - i) // len(SERVICES) + 1 if tick >= i else 0
+        requests = 1000 * (i + 1) + 37 * polls
+        status = "🟢 up" if (tick // 25 + i) % 7 else "🟠 slow"
+        lines.append(f"{name:9} {status:12} {requests:8,d}")
+    lines += ["", f"tick {tick:4d}"]
+    return layout.render(lines) + "\n"
+
+
+def full_redraw(previous: str | None, frame: str) -> str:
+    """What Animation.run writes: cursor up over the old frame, then all of it."""
+    if previous is None:
+        return frame
+    return f"\033[{previous.count(chr(10))}A\r" + frame
+
+
+def demo_bytes() -> None:
+    """Bytes written per refresh, full redraw vs diff."""
+    differ = FrameDiffer()
+    previous = None
+    full_bytes = diff_bytes = 0
+    for tick in range(TICKS):
+        frame = dashboard(tick)
+        full_bytes += len(full_redraw(previous, frame).encode("utf-8"))
+        diff_bytes += len(differ.diff(frame).encode("utf-8"))
+        previous = frame
+
+    line_count = frame.count("\n")
+    console.frame(
+        [
+            f"Frame: {line_count} lines, {TICKS} refreshes",
+            "",
+            f"Full redraw:  {full_bytes:8,d} bytes  ({full_bytes / TICKS:7.1f}/refresh)",
+            f"FrameDiffer:  {diff_bytes:8,d} bytes  ({diff_bytes / TICKS:7.1f}/refresh)",
+            f"Lines rewritten: {differ.lines_written:,d} of {line_count * TICKS:,d}",
+            "",
+            f"At 10 refreshes/s: {full_bytes / TICKS * 80 / 1000:.0f} kbit/s -> "
+            f"{diff_bytes / TICKS * 80 / 1000:.0f} kbit/s",
+        ],
+        title=f"{icons.BAR_CHART} Terminal Bytes per Refresh",
+        border="rounded",
+        border_color="cyan",
+        width=68,
+    )
+
+
+def frames() -> Iterator[str]:
+    for tick in range(40):
+        yield dashboard(tick)
+
+
+def demo_live() -> None:
+    """Animate the dashboard with diffed redraws."""
+    if not sys.stdout.isatty():
+        print("(not a terminal - showing the final frame only)")
+        print(dashboard(39), end="")
+        return
+
+    differ = run_diffed(frames(), fps=10)
+    console.text(
+        f"{icons.CHECK_MARK_BUTTON} {differ.lines_written} lines rewritten, "
+        f"{differ.bytes_written:,d} bytes written"
+    )
+
+
+def main() -> None:
+    console.banner("DIFFING")
+    console.text("Redraw only the lines that changed")
+    console.newline()
+
+    demo_bytes()
+    console.newline()
+    demo_live()
+
+
+if __name__ == "__main__":
+    main()
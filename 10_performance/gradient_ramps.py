@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Gradient Ramp Cache Demo
+========================
+
+EffectSpec.gradient("cyan", "blue") is the most common effect in these
+examples. On every render the library re-parses the color names and
+interpolates a color for every colored cell, then rebuilds each line through
+a Rich console.
+
+RampCache in _gradients.py resolves the colors once per (stops, length,
+color space, direction) and render_gradient_frame() colors the frame straight
+from the cached ramp. This example shows:
+
+- Plain vs gradient vs cached-gradient frame cost
+- Ramp cache hits for a dashboard of same-sized panels
+- The same ramp resolved for truecolor, 256 and 16 color terminals
+"""
+
+import time
+
+from _gradients import RampCache, render_gradient_frame
+
+from styledconsole import Console, EffectSpec, RenderPolicy, icons
+
+console = Console()
+# Effects are skipped when color is disabled; force it so the costs are real
+color_console = Console(policy=RenderPolicy.full())
+
+ITERATIONS = 200
+BODY = [f"worker-{i:02d}  queue={i * 7 % 50:3d}  errors={i % 3}" for i in range(8)]
+FRAME = {"title": "⚙ Workers", "border": "rounded", "width": 48}
+GRADIENT = EffectSpec.gradient("cyan", "blue")
+
+
+def per_call_ms(render) -> float:
+    """Average milliseconds per frame over ITERATIONS frames."""
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        render()
+    return (time.perf_counter() - start) / ITERATIONS * 1000
+
+
+def demo_benchmark() -> None:
+    """Cost of a gradient frame with and without the ramp cache."""
+    cache = RampCache()
+    plain = per_call_ms(lambda: color_console.render_frame(BODY, **FRAME))
+    library = per_call_ms(lambda: color_console.render_frame(BODY, effect=GRADIENT, **FRAME))
+    cached = per_call_ms(
+        lambda: render_gradient_frame(color_console, BODY, effect=GRADIENT, cache=cache, **FRAME)
+    )
+    same = render_gradient_frame(color_console, BODY, effect=GRADIENT, **FRAME) == (
+        color_console.render_frame(BODY, effect=GRADIENT, **FRAME)
+    )
+
+    console.frame(
+        [
+            f"Plain frame:              {plain:6.2f}ms",
+            f"render_frame(effect=...): {library:6.2f}ms  ({library / plain:.1f}x plain)",
+            f"render_gradient_frame():  {cached:6.2f}ms  ({cached / plain:.1f}x plain)",
+            "",
+            f"Identical output: {same}",
+        ],
+        title=f"{icons.STOPWATCH} Gradient Frame Cost ({len(BODY)} lines)",
+        border="rounded",
+        border_color="cyan",
+        width=68,
+    )
+
+
+def demo_cache_stats() -> None:
+    """A dashboard of panels shares ramps across frame widths and content."""
+    cache = RampCache(maxsize=32)
+    effects = [
+        EffectSpec.gradient("cyan", "blue"),
+        EffectSpec.gradient("red", "gold", direction="horizontal"),
+        EffectSpec.rainbow(direction="diagonal"),
+    ]
+    for refresh in range(20):
+        for i, effect in enumerate(effects):
+            for width in (40, 48, 56):
+                body = [f"refresh {refresh}", f"panel {i} width {width}"]
+                render_gradient_frame(color_console, body, effect=effect, cache=cache, width=width)
+
+    stats = cache.stats()
+    console.frame(
+        [
+            "20 refreshes x 3 effects x 3 widths = 180 frames",
+            "",
+            f"Ramps built: {stats.misses}  Reused: {stats.hits}  Hit rate: {stats.hit_rate:.1%}",
+            "",
+            "Vertical ramps are shared by every width; horizontal and",
+            "diagonal ramps are resolved once per width.",
+        ],
+        title=f"{icons.BAR_CHART} Ramp Cache",
+        border="rounded",
+        border_color="magenta",
+        width=68,
+    )
+
+
+def demo_color_spaces() -> None:
+    """One effect resolved for three color systems."""
+    effect = EffectSpec.gradient("cyan", "magenta", direction="horizontal")
+    for color_space in ("truecolor", "256", "standard"):
+        print(
+            render_gradient_frame(
+                color_console,
+                f"Ramp resolved for {color_space} terminals",
+                effect=effect,
+                color_space=color_space,
+                border="heavy",
+                width=48,
+            )
+        )
+
+
+def main() -> None:
+    console.banner("RAMPS")
+    console.text("Resolve gradient colors once per frame size")
+    console.newline()
+
+    demo_benchmark()
+    console.newline()
+    demo_cache_stats()
+    console.newline()
+    demo_color_spaces()
+
+
+if __name__ == "__main__":
+    main()
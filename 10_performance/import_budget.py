@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Import-Time Budget Demo
+=======================
+
+Every example starts with ``from styledconsole import Console, EffectSpec,
+icons``. The package ``__init__`` imports effects and presets, banner fonts,
+the emoji tables, animation and export before the first line is printed, so
+a small script called thousands of times a day from shell pipelines spends
+most of its life importing.
+
+install() in _lazy.py replaces the package with one whose top-level names
+are resolved by a module-level ``__getattr__``, importing only the
+submodules a script uses. This example is also the cold-start benchmark:
+
+- Import cost per scenario, each in a fresh interpreter (best of N)
+- Comparison against the budgets checked in next to this script
+  (import_budget.json): the most styledconsole modules each lazy scenario
+  may load. Module counts are the same on every host, unlike timings, so
+  the check doesn't depend on how fast the machine is. Exits with status
+  1 when a scenario is over its budget or has none, or loads as many
+  modules as the eager import in the same run
+
+Usage:
+    python import_budget.py            # check against import_budget.json
+    python import_budget.py --update   # write budgets from the current module counts (review and commit)
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+from styledconsole import Console, icons
+
+console = Console()
+
+HERE = Path(__file__).parent
+BUDGETS = HERE / "import_budget.json"
+EAGER = "eager import"  # the reference every lazy scenario is compared with
+LAZY = "import _lazy; _lazy.install()\n"
+SCENARIOS = {
+    EAGER: "from styledconsole import Console, EffectSpec, icons",
+    "lazy import": LAZY + "from styledconsole import Console, EffectSpec, icons",
+    "lazy status line": LAZY + "from styledconsole import Console\nConsole().text('deploy ok')",
+    "lazy gradient frame": LAZY
+    + "from styledconsole import Console, EffectSpec\n"
+    + "Console().frame('ok', effect=EffectSpec.gradient('cyan', 'blue'))",
+}
+
+# Wraps a scenario: time it and count the styledconsole modules it loaded
+_HARNESS = """
+import json, sys, time
+start = time.perf_counter()
+exec(compile({code!r}, "<scenario>", "exec"))
+elapsed = time.perf_counter() - start
+modules = sum(1 for name in sys.modules if name.startswith("styledconsole"))
+print(json.dumps({{"ms": elapsed * 1000, "modules": modules}}), file=sys.stderr)
+"""
+
+
+def run_scenario(code: str) -> dict:
+    """Time one scenario in a fresh interpreter: {"ms": ..., "modules": ...}."""
+    result = subprocess.run(
+        [sys.executable, "-c", _HARNESS.format(code=code)],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=HERE,
+    )
+    return json.loads(result.stderr.strip().splitlines()[-1])
+
+
+def measure(runs: int) -> dict[str, tuple[float, int]]:
+    """Best time (ms) and modules loaded per scenario.
+
+    Scenarios are interleaved round by round, so a busy moment on the host
+    slows all of them instead of one.
+    """
+    best = {name: (float("inf"), 0) for name in SCENARIOS}
+    for _ in range(runs):
+        for name, code in SCENARIOS.items():
+            sample = run_scenario(code)
+            best[name] = (min(best[name][0], sample["ms"]), sample["modules"])
+    return best
+
+
+def load_budgets() -> dict[str, int]:
+    """Most styledconsole modules each lazy scenario may load, from the checked-in file.
+
+    Raises:
+        OSError: If the file can't be read
+        ValueError: If it is not valid JSON
+    """
+    return json.loads(BUDGETS.read_text(encoding="utf-8"))
+
+
+def save_budgets(modules: dict[str, int]) -> dict[str, int]:
+    """Write the lazy scenarios' module counts as their budgets.
+
+    Counts don't vary between runs, so no headroom is added: a scenario
+    that starts loading one more module fails until the budget is
+    reviewed and raised.
+    """
+    budgets = {name: count for name, count in modules.items() if name != EAGER}
+    BUDGETS.write_text(json.dumps(budgets, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    return budgets
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Cold-start import benchmark")
+    parser.add_argument("--update", action="store_true", help="write new budgets")
+    parser.add_argument("--runs", type=int, default=7, help="fresh interpreters per scenario")
+    args = parser.parse_args()
+
+    console.banner("IMPORTS")
+    console.text("Only import the parts of styledconsole a script uses")
+    console.newline()
+
+    budgets: dict[str, int] = {}
+    if not args.update:
+        try:
+            budgets = load_budgets()
+        except (OSError, ValueError) as e:
+            console.text(f"{icons.CROSS_MARK} Can't read budgets from {BUDGETS}: {e}")
+            console.text("Run with --update to create them, then commit the file.")
+            return 1
+
+    measured = measure(args.runs)
+    if args.update:
+        budgets = save_budgets({name: modules for name, (_elapsed, modules) in measured.items()})
+
+    eager_ms, eager_modules = measured[EAGER]
+    failures = []
+    rows = [f"{'Scenario':22} {'Time':>9} {'Modules':>8} {'Budget':>7}  Status"]
+    for name, (elapsed, modules) in measured.items():
+        budget = budgets.get(name)
+        if name == EAGER:
+            status, reference = "reference", "-"
+        elif budget is None:
+            status, reference = "NO BUDGET", "-"
+            failures.append(name)
+        elif modules > budget or modules >= eager_modules:
+            status, reference = "OVER", str(budget)
+            failures.append(name)
+        else:
+            status, reference = "ok", str(budget)
+        rows.append(f"{name:22} {elapsed:7.1f}ms {modules:>8} {reference:>7}  {status}")
+
+    lazy_ms, lazy_modules = measured["lazy import"]
+    rows += [
+        "",
+        f"Lazy import loads {lazy_modules} of {eager_modules} styledconsole modules",
+        f"and saved {eager_ms - lazy_ms:.1f}ms ({1 - lazy_ms / eager_ms:.0%}) per invocation this run",
+    ]
+
+    if failures:
+        footer = f"{icons.CROSS_MARK} Over budget or missing: {', '.join(failures)}"
+    elif args.update:
+        footer = f"{icons.CHECK_MARK_BUTTON} Budgets written; review and commit them"
+    else:
+        footer = f"{icons.CHECK_MARK_BUTTON} Within budget"
+
+    console.frame(
+        [*rows, "", footer],
+        title=f"{icons.STOPWATCH} Cold Start, best of {args.runs}",
+        border="rounded",
+        border_color="red" if failures else "cyan",
+        width=72,
+    )
+    console.text(f"Budgets: {BUDGETS}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Lazy Palette Registry Demo
+==========================
+
+PALETTES, get_palette(), EFFECTS.load_palette() and EffectSpec.from_palette()
+expose 90 curated palettes, and the preset effects used by
+04_effects/comunity_palette_showcase.py add more. All of them come with
+``import styledconsole``, so a CLI tool that prints one colored status line
+pays for the whole package first.
+
+PaletteRegistry in _palettes.py reads the library's bundled palettes.json on
+first access without importing styledconsole, and palette_effect() builds an
+EffectSpec only when one is asked for. This example shows:
+
+- Where ``import styledconsole`` spends its time (palette data is a sliver)
+- Cold start of a one-line status script: full import vs lazy registry
+- Palette and preset frames built on demand
+"""
+
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+from _palettes import PaletteRegistry, palette_effect, palettes
+
+from styledconsole import Console, icons
+
+console = Console()
+
+HERE = Path(__file__).parent
+RUNS = 5
+
+# One status line, colored with the first color of a palette
+FULL_IMPORT = """
+from styledconsole import Console, PALETTES
+colors = PALETTES["ocean_depths"]["colors"]
+Console().text("deploy ok", color=colors[0])
+"""
+LAZY_IMPORT = """
+from _palettes import palettes
+r, g, b = (int(palettes.colors("ocean_depths")[0][i : i + 2], 16) for i in (1, 3, 5))
+print(f"\\x1b[38;2;{r};{g};{b}mdeploy ok\\x1b[0m")
+"""
+
+
+def import_times() -> dict[str, int]:
+    """Cumulative import time in microseconds per module, from -X importtime."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import styledconsole"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        match = re.match(r"import time:\s+\d+ \|\s+(\d+) \| (\s*)(\S+)", line)
+        if match:
+            times[match.group(3)] = int(match.group(1))
+    return times
+
+
+def cold_start_ms(code: str) -> float:
+    """Best wall time of a fresh interpreter running `code`, in milliseconds."""
+    best = float("inf")
+    for _ in range(RUNS):
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import time; t = time.perf_counter()\n"
+                + code
+                + "\nimport sys; print(time.perf_counter() - t, file=sys.stderr)",
+            ],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=HERE,
+        )
+        best = min(best, float(result.stderr.split()[-1]) * 1000)
+    return best
+
+
+def demo_import_breakdown() -> None:
+    """Share of the package import spent on palettes and effects."""
+    times = import_times()
+    total = times["styledconsole"]
+    rows = []
+    for module in (
+        "styledconsole.data.palettes",
+        "styledconsole.effects",
+        "styledconsole.utils.emoji_support",
+        "rich.console",
+        "styledconsole.builders",
+    ):
+        if module in times:
+            rows.append(f"{module:36} {times[module] / 1000:6.1f}ms {times[module] / total:6.1%}")
+
+    console.frame(
+        [
+            f"{'import styledconsole':36} {total / 1000:6.1f}ms",
+            "",
+            *rows,
+            "",
+            "Palette data is a JSON file loaded in about a millisecond;",
+            "emoji tables, Rich and the builders dominate the import.",
+        ],
+        title=f"{icons.STOPWATCH} Import Breakdown",
+        border="rounded",
+        border_color="cyan",
+        width=68,
+    )
+
+
+def demo_cold_start() -> None:
+    """A one-line status script, with and without the package import."""
+    full = cold_start_ms(FULL_IMPORT)
+    lazy = cold_start_ms(LAZY_IMPORT)
+    registry = PaletteRegistry()
+    before = registry.loaded
+    registry.colors("ocean_depths")
+
+    console.frame(
+        [
+            f"Console().text() with PALETTES:   {full:6.1f}ms",
+            f"palettes.colors() + raw ANSI:     {lazy:6.1f}ms  ({full / lazy:.0f}x faster)",
+            "",
+            f"Registry loaded before first lookup: {before}, after: {registry.loaded}",
+            f"Palettes: {len(registry)}  Categories: {len(registry.categories())}",
+        ],
+        title=f"{icons.ROCKET} Status Line Cold Start (best of {RUNS})",
+        border="rounded",
+        border_color="magenta",
+        width=68,
+    )
+
+
+def demo_effects() -> None:
+    """Frames for a preset and two palettes, built on demand."""
+    for name in ("autumn", "ocean_depths", palettes.names("pastel")[0]):
+        effect = palette_effect(name, direction="horizontal")
+        kind = "palette" if name in palettes and effect.colors == palettes.colors(name) else "preset"
+        console.frame(
+            [f"{kind}: {name}", ", ".join(effect.colors)],
+            effect=effect,
+            title=name,
+            border="rounded",
+            width=60,
+        )
+    console.text(f"{icons.CHECK_MARK_BUTTON} {palette_effect.cache_info().currsize} effects built")
+
+
+def main() -> None:
+    console.banner("PALETTES")
+    console.text("Load palette data only when a palette is used")
+    console.newline()
+
+    demo_import_breakdown()
+    console.newline()
+    demo_cold_start()
+    console.newline()
+    demo_effects()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+Paged Table Rendering Demo
+==========================
+
+StyledTable and GradientTable (see 04_effects/gradient_table.py) keep every
+row, measure every cell to choose the column widths and render the whole
+table before printing its first line. A GradientTable then re-parses every
+output line to color the border. Inventory tables with 100k+ rows take
+minutes and hundreds of MB.
+
+PagedTable in _tables.py uses the table only as a template (columns,
+styles, box, gradient). It measures column widths from a sample of rows and
+formats one line per row, straight from the row source, so memory stays
+flat however many rows are printed. This example shows:
+
+- Render time and memory: StyledTable / GradientTable vs PagedTable
+- The same text and border colors as GradientTable
+- A window into a million-row table, without touching the other rows
+"""
+
+import sys
+import time
+import tracemalloc
+from collections.abc import Sequence
+from io import StringIO
+
+from _tables import PagedTable
+from rich.console import Console as RichConsole
+from rich.text import Text
+
+from styledconsole import Console, RenderPolicy, icons
+from styledconsole.presets.tables import GradientTable
+from styledconsole.table import StyledTable
+from styledconsole.utils.text import strip_ansi
+
+console = Console()
+
+COLUMNS = [
+    ("SERVER", "left"),
+    ("IP ADDRESS", "left"),
+    ("CPU", "right"),
+    ("MEMORY", "right"),
+    ("UPTIME", "right"),
+    ("STATUS", "center"),
+]
+STATUSES = ["[green]UP[/]"] * 14 + ["[yellow]⚠️ DEGRADED[/]", "[red]DOWN[/]"]
+ROLES = ["web", "api", "db", "cache", "queue", "worker"]
+
+
+class Inventory(Sequence):
+    """Server inventory rows computed from their index (nothing is stored)."""
+
+    def __init__(self, count: int) -> None:
+        self.count = count
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getitem__(self, index: int) -> tuple[str, ...]:
+        if not 0 <= index < self.count:
+            raise IndexError(index)
+        return (
+            f"prod-{ROLES[index % 6]}-{index:07d}",
+            f"10.{index >> 16 & 255}.{index >> 8 & 255}.{index & 255}",
+            f"{index * 37 % 100}%",
+            f"{index * 13 % 64}.{index % 10} GB",
+            f"{index % 200}d {index % 24}h",
+            STATUSES[index % len(STATUSES)],
+        )
+
+
+def template(cls: type[StyledTable] = GradientTable) -> StyledTable:
+    table = cls(title="Server Inventory")
+    for header, justify in COLUMNS:
+        table.add_column(header, justify=justify)
+    return table
+
+
+def library_output(cls: type[StyledTable], rows: Inventory) -> str:
+    """Today's approach: add every row, then print the table."""
+    table = template(cls)
+    for row in rows:
+        table.add_row(*row)
+    buffer = StringIO()
+    Console(file=buffer, policy=RenderPolicy.full(), width=100).print(table)
+    return buffer.getvalue()
+
+
+def paged_output(cls: type[StyledTable], rows: Inventory, file=None) -> str:
+    buffer = StringIO()
+    target = Console(file=buffer, policy=RenderPolicy.full(), width=100)
+    PagedTable(target, template(cls), rows, width=100).print(file or buffer)
+    return buffer.getvalue()
+
+
+class NullWriter:
+    """Terminal stand-in that drops what it is given."""
+
+    def write(self, text: str) -> int:
+        return len(text)
+
+
+def timed(func, *args) -> float:
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def peak_mb(func, *args) -> float:
+    """Peak memory allocated while ``func`` runs, in MB."""
+    tracemalloc.start()
+    try:
+        func(*args)
+        return tracemalloc.get_traced_memory()[1] / 1e6
+    finally:
+        tracemalloc.stop()
+
+
+def demo_cost() -> None:
+    """The library's tables vs PagedTable on the same inventory."""
+    styled = timed(library_output, StyledTable, Inventory(2_000))
+    gradient = timed(library_output, GradientTable, Inventory(300))
+    paged = timed(paged_output, GradientTable, Inventory(100_000), NullWriter())
+    library_mb = peak_mb(library_output, StyledTable, Inventory(1_000))
+    small_mb = peak_mb(paged_output, GradientTable, Inventory(1_000), NullWriter())
+    large_mb = peak_mb(paged_output, GradientTable, Inventory(10_000), NullWriter())
+
+    console.frame(
+        [
+            f"StyledTable,     2,000 rows: {styled:6.2f}s  ({styled / 2_000 * 1e6:6.0f}us/row)",
+            f"GradientTable,     300 rows: {gradient:6.2f}s  ({gradient / 300 * 1e6:6.0f}us/row)",
+            f"PagedTable,    100,000 rows: {paged:6.2f}s  ({paged / 100_000 * 1e6:6.0f}us/row)",
+            "",
+            f"Peak memory, StyledTable  1,000 rows: {library_mb:5.1f} MB",
+            f"Peak memory, PagedTable   1,000 rows: {small_mb:5.1f} MB",
+            f"Peak memory, PagedTable  10,000 rows: {large_mb:5.1f} MB",
+        ],
+        title=f"{icons.STOPWATCH} Render Cost",
+        border="rounded",
+        border_color="cyan",
+        width=72,
+    )
+
+
+def border_colors(line: str) -> list[tuple[int, str]]:
+    """Color of every box-drawing character on a line."""
+    text = Text.from_ansi(line)
+    rich_console = RichConsole()  # only resolves style names; the parsed styles have none
+    return [
+        (offset, str(text.get_style_at_offset(rich_console, offset).color))
+        for offset, char in enumerate(text.plain)
+        if "─" <= char <= "╿"
+    ]
+
+
+def demo_same_output() -> None:
+    """PagedTable next to GradientTable, line by line."""
+    rows = Inventory(200)
+    # GradientTable writes a blank line after every line; compare the others
+    expected = [line for line in library_output(GradientTable, rows).split("\n") if line]
+    got = paged_output(GradientTable, rows).rstrip("\n").split("\n")
+    same_text = [strip_ansi(line) for line in expected] == [strip_ansi(line) for line in got]
+    same_colors = all(border_colors(a) == border_colors(b) for a, b in zip(expected, got))
+
+    console.frame(
+        [
+            f"{len(got)} lines of a 200-row GradientTable",
+            "",
+            f"{icons.CHECK_MARK_BUTTON if same_text else icons.CROSS_MARK} Same text: {same_text}",
+            f"{icons.CHECK_MARK_BUTTON if same_colors else icons.CROSS_MARK}"
+            f" Same border colors: {same_colors}",
+        ],
+        title=f"{icons.SPARKLES} Output Check",
+        border="rounded",
+        border_color="magenta",
+        width=72,
+    )
+
+
+def demo_window() -> None:
+    """Any 8 rows of a million-row table."""
+    pages = PagedTable(console, template(), Inventory(1_000_000))
+    start = time.perf_counter()
+    lines = pages.window(654_321, 8)
+    elapsed = (time.perf_counter() - start) * 1000
+    sys.stdout.write("\n".join(lines) + "\n")
+    console.text(
+        f"  {icons.ROCKET} Rows 654,321-654,328 of {len(pages):,} in {elapsed:.2f}ms"
+    )
+
+
+def main() -> None:
+    console.banner("PAGED")
+    console.text("Tables with 100k+ rows, one page at a time")
+    console.newline()
+
+    demo_cost()
+    console.newline()
+    demo_same_output()
+    console.newline()
+    demo_window()
+
+
+if __name__ == "__main__":
+    main()
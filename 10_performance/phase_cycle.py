@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Phase-Indexed Effect Cache Demo
+===============================
+
+04_effects/animation.py and 04_effects/rainbow_cycling.py build a new Console
+and EffectSpec.rainbow(phase=...) for every animation frame and advance the
+phase with cycle_phase(). The phase is periodic, so the colored borders of
+frame 30 are the ones of frame 0 again, yet every frame recolors all of them.
+
+PhaseCycle in _gradients.py splits one cycle into N phase steps, colors the
+border rows of every step once and keeps colored body rows per step, so
+replaying the cycle only splices in the body. This example shows:
+
+- Per-frame cost: animation.py's loop vs ramp cache vs PhaseCycle
+- How much of a warmed-up idle screen comes from the cache
+- A live rainbow idle screen replayed from the cycle (terminals only)
+"""
+
+import sys
+import time
+from io import StringIO
+
+from _frames import run_diffed
+from _gradients import PhaseCycle, render_gradient_frame
+
+from styledconsole import Console, EffectSpec, RenderPolicy, icons
+
+console = Console()
+color_console = Console(policy=RenderPolicy.full())
+
+FRAMES = 90  # three cycles, as in animation.py
+EFFECT = EffectSpec.rainbow(direction="diagonal")
+FRAME = {"title": "🚀 Animation Demo", "border": "double", "width": 40}
+
+
+def body(frame: int) -> list[str]:
+    """animation.py's content; the counter changes once per 10 frames."""
+    return ["✨ Animated Gradients ✨", "", f"Uptime: {frame // 10}s", "", "Watch the colors cycle!"]
+
+
+def per_frame_ms(render) -> float:
+    """Average milliseconds per frame over FRAMES frames."""
+    start = time.perf_counter()
+    for frame in range(FRAMES):
+        render(frame)
+    return (time.perf_counter() - start) / FRAMES * 1000
+
+
+def demo_benchmark() -> None:
+    """Three rainbow cycles rendered three ways."""
+    cycle = PhaseCycle(color_console, EFFECT, height=5, **FRAME)
+
+    def animation_loop(frame: int) -> str:
+        buffer = StringIO()
+        Console(file=buffer, policy=RenderPolicy.full()).frame(
+            body(frame), effect=EFFECT.with_phase(cycle.phase(frame)), **FRAME
+        )
+        return buffer.getvalue()
+
+    def ramp_cache(frame: int) -> str:
+        return render_gradient_frame(
+            color_console, body(frame), effect=EFFECT.with_phase(cycle.phase(frame)), **FRAME
+        )
+
+    start = time.perf_counter()
+    PhaseCycle(color_console, EFFECT, height=5, **FRAME)
+    precompute = (time.perf_counter() - start) * 1000
+
+    loop = per_frame_ms(animation_loop)
+    cached = per_frame_ms(ramp_cache)
+    replay = per_frame_ms(lambda frame: cycle.render(body(frame), frame))
+    same = all(cycle.render(body(f), f) == ramp_cache(f) for f in range(FRAMES))
+
+    console.frame(
+        [
+            f"Precompute {cycle.steps} phase steps:     {precompute:7.2f}ms (once)",
+            "",
+            f"animation.py loop:            {loop:7.3f}ms/frame",
+            f"render_gradient_frame():      {cached:7.3f}ms/frame  ({loop / cached:.0f}x)",
+            f"PhaseCycle.render():          {replay:7.3f}ms/frame  ({loop / replay:.0f}x)",
+            "",
+            f"Same output as the ramp cache: {same}",
+        ],
+        title=f"{icons.STOPWATCH} {FRAMES} Frames, Diagonal Rainbow",
+        border="rounded",
+        border_color="cyan",
+        width=68,
+    )
+
+
+def demo_idle_screen() -> None:
+    """Body rows served from the cycle once it has been around once."""
+    cycle = PhaseCycle(color_console, EFFECT, height=5, **FRAME)
+    for frame in range(cycle.steps):
+        cycle.render(body(0), frame)
+    warm_up = cycle.stats()
+    for frame in range(cycle.steps, 10 * cycle.steps):
+        cycle.render(body(0), frame)
+    stats = cycle.stats()
+
+    console.frame(
+        [
+            f"First cycle:   {warm_up.misses} body rows colored, {warm_up.hits} reused",
+            f"Next 9 cycles: {stats.misses - warm_up.misses} body rows colored, "
+            f"{stats.hits - warm_up.hits} reused",
+            "",
+            "Colored rows are kept per phase step, so the first cycle",
+            "colors each row once. After that an unchanged screen is",
+            "only string joins.",
+        ],
+        title=f"{icons.BAR_CHART} Idle Screen Cache",
+        border="rounded",
+        border_color="magenta",
+        width=68,
+    )
+
+
+def demo_live() -> None:
+    """Replay the cycle in place."""
+    cycle = PhaseCycle(color_console, EFFECT, height=5, **FRAME)
+    if not sys.stdout.isatty():
+        print("(not a terminal - showing one frame only)")
+        print(cycle.render(body(0), 0))
+        return
+
+    run_diffed(cycle.frames(body(frame) for frame in range(FRAMES)), fps=10)
+    console.text(f"{icons.CHECK_MARK_BUTTON} {cycle.stats().hit_rate:.0%} of body rows from the cache")
+
+
+def main() -> None:
+    console.banner("PHASES")
+    console.text("Precompute one rainbow cycle, replay it with new content")
+    console.newline()
+
+    demo_benchmark()
+    console.newline()
+    demo_idle_screen()
+    console.newline()
+    demo_live()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Bulk Frame Body Demo
+====================
+
+Frame bodies are usually built one line at a time, as in
+09_testing/benchmark.py::complex_frame:
+
+    for line in body:
+        out.append(DOUBLE.render_line(60, line))
+
+For long bodies (log tails, 1,000-row reports) the per-call overhead is larger
+than the formatting itself. BorderTemplates.render_lines() in _frames.py takes
+the whole body, measures it with one visual_widths() batch and returns a single
+joined string. This example shows:
+
+- render_line() loops vs render_lines() for bodies of 10 to 1,000 lines
+- Identical output for every alignment
+- A frame assembled from one render_lines() call
+"""
+
+import time
+
+from _frames import get_templates
+
+from styledconsole import DOUBLE, ROUNDED, Console, icons
+
+console = Console()
+
+WIDTH = 60
+ICON_CHOICES = ["🚀", "✅", "❌", "📊", "🔥"]
+
+
+def make_body(count: int) -> list[str]:
+    """Log-style lines; every fifth line carries an emoji."""
+    return [
+        f"{ICON_CHOICES[i % 5]} job-{i:04d} finished" if i % 5 == 0 else f"job-{i:04d} ok in {i % 97}ms"
+        for i in range(count)
+    ]
+
+
+def per_call_ms(render, body: list[str], repeat: int) -> float:
+    """Average milliseconds to render one body."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        render(body)
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def library_loop(body: list[str]) -> str:
+    return "\n".join([DOUBLE.render_line(WIDTH, line) for line in body])
+
+
+def templates_loop(body: list[str]) -> str:
+    border = get_templates(DOUBLE)
+    return "\n".join([border.render_line(WIDTH, line) for line in body])
+
+
+def templates_bulk(body: list[str]) -> str:
+    return get_templates(DOUBLE).render_lines(WIDTH, body)
+
+
+def demo_benchmark() -> None:
+    """Per-line loops vs one render_lines() call."""
+    rows = [f"{'Lines':>6} {'render_line':>12} {'cached loop':>12} {'render_lines':>13} {'Speedup':>8}"]
+    for count, repeat in ((10, 500), (100, 100), (1000, 20)):
+        body = make_body(count)
+        plain = per_call_ms(library_loop, body, repeat)
+        loop = per_call_ms(templates_loop, body, repeat)
+        bulk = per_call_ms(templates_bulk, body, repeat)
+        rows.append(
+            f"{count:>6} {plain:>10.3f}ms {loop:>10.3f}ms {bulk:>11.3f}ms {plain / bulk:>7.1f}x"
+        )
+
+    console.frame(
+        [*rows, "", "render_line = BorderStyle, cached loop = BorderTemplates"],
+        title=f"{icons.BAR_CHART} Frame Body Cost (width {WIDTH})",
+        border="rounded",
+        border_color="cyan",
+        width=70,
+    )
+
+
+def demo_equivalence() -> None:
+    """render_lines() matches joined render_line() output."""
+    body = [*make_body(20), "", "中文 wide text", "x" * 80]
+    border = get_templates(DOUBLE)
+    rows = []
+    for align in ("left", "center", "right"):
+        expected = "\n".join(DOUBLE.render_line(WIDTH, line, align) for line in body)
+        assert border.render_lines(WIDTH, body, align) == expected
+        rows.append(f"{icons.CHECK_MARK_BUTTON} {align:6} {len(body)} lines identical")
+
+    console.frame(
+        rows,
+        title=f"{icons.MAG} Output Equivalence",
+        border="rounded",
+        border_color="green",
+        width=70,
+    )
+
+
+def demo_bulk_frame() -> None:
+    """A complete frame: cached borders around one render_lines() body."""
+    border = get_templates(ROUNDED)
+    width = 44
+    print(border.render_top_border(width, "📜 Build Log"))
+    print(border.render_lines(width, make_body(6)))
+    print(border.render_divider(width))
+    print(border.render_lines(width, ["6 jobs", "0 failures"], align="center"))
+    print(border.render_bottom_border(width))
+
+
+def main() -> None:
+    console.banner("BULK LINES")
+    console.text("One call per frame body instead of one per line")
+    console.newline()
+
+    demo_benchmark()
+    console.newline()
+    demo_equivalence()
+    console.newline()
+    demo_bulk_frame()
+
+
+if __name__ == "__main__":
+    main()
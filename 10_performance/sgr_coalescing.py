@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+SGR Coalescing Demo
+===================
+
+Gradient and rainbow effects emit a full color escape for every character:
+``ESC[38;2;r;g;bm`` + char + ``ESC[0m``. After downgrading to 256 or 16
+colors, neighbouring cells often quantize to the same color, yet every cell
+still carries its own escape and reset.
+
+MeteredConsole in _output.py is a Console that counts the bytes it writes
+and can run them through an SgrCoalescer first, which merges runs with the
+same style and drops redundant resets. This example shows:
+
+- Bytes for the 04_effects/rainbow_cycling.py frames and for diagonal
+  rainbows resolved for truecolor, 256 and 16 colors
+- That the coalesced output shows exactly the same cells
+- A live frame printed through a coalescing console
+"""
+
+from io import StringIO
+
+from _gradients import render_gradient_frame
+from _output import MeteredConsole, visible_cells
+
+from styledconsole import EFFECTS, Console, EffectSpec, RenderPolicy, icons
+
+console = Console()
+color_console = Console(policy=RenderPolicy.full())
+
+CONTENT = [
+    "Line 1 - Red spectrum",
+    "Line 2 - Orange spectrum",
+    "Line 3 - Yellow spectrum",
+    "Line 4 - Green spectrum",
+    "Line 5 - Blue spectrum",
+    "Line 6 - Indigo spectrum",
+    "Line 7 - Violet spectrum",
+    "Line 8 - Back to red",
+]
+
+
+def rainbow_cycling(target: Console) -> None:
+    """The frames printed by 04_effects/rainbow_cycling.py."""
+    target.frame(CONTENT, effect="rainbow", border="rounded", title="Smooth Rainbow Gradient")
+    target.frame(CONTENT, effect="rainbow_neon", border="heavy", title="Neon Rainbow")
+    target.frame(
+        ["Line 1", "Line 2", "Line 3", "Line 4"],
+        effect=EFFECTS.rainbow_pastel,
+        border="double",
+        title="Pastel Rainbow",
+    )
+    target.frame(
+        ["Custom", "Gradient", "Effect"],
+        effect=EffectSpec.gradient("gold", "purple", direction="vertical"),
+        border="thick",
+        title="Custom Gradient",
+    )
+    target.frame(
+        ["Plain content", "Gradient borders only"],
+        effect=EffectSpec.gradient("cyan", "magenta", target="border"),
+        border="heavy",
+        title="Border Gradient",
+    )
+
+
+DIAGONAL = [
+    (EffectSpec.rainbow(direction="diagonal"), "rounded"),
+    (EffectSpec.rainbow(neon=True, direction="diagonal"), "heavy"),
+]
+
+
+def diagonal_frames(target: MeteredConsole, color_space: str) -> None:
+    """The same content with a per-cell diagonal rainbow, as in animation.py."""
+    for effect, border in DIAGONAL:
+        frame = render_gradient_frame(
+            color_console, CONTENT, effect=effect, color_space=color_space, border=border, width=48
+        )
+        target.metered.write(frame + "\n")
+
+
+def measure(render) -> tuple[int, int, bool]:
+    """Render through a raw and a coalescing console: (raw, coalesced, same cells)."""
+    outputs = []
+    for coalesce in (False, True):
+        buffer = StringIO()
+        render(MeteredConsole(coalesce=coalesce, file=buffer, width=80, policy=RenderPolicy.full()))
+        outputs.append(buffer.getvalue())
+    raw, coalesced = outputs
+    same = visible_cells(raw) == visible_cells(coalesced)
+    return len(raw.encode("utf-8")), len(coalesced.encode("utf-8")), same
+
+
+def demo_byte_counts() -> None:
+    """Raw vs coalesced bytes for line-colored and cell-colored frames."""
+    cases = [("rainbow_cycling.py", "truecolor", rainbow_cycling)]
+    for color_space in ("truecolor", "256", "standard"):
+        render = lambda t, cs=color_space: diagonal_frames(t, cs)  # noqa: E731
+        cases.append(("diagonal rainbow", color_space, render))
+
+    rows = [f"{'Frames':19} {'Colors':9} {'Raw':>7} {'Coalesced':>9} {'Saved':>6}  Same"]
+    for name, color_space, render in cases:
+        raw, coalesced, same = measure(render)
+        rows.append(
+            f"{name:19} {color_space:9} {raw:>7,d} {coalesced:>9,d} {1 - coalesced / raw:>6.0%}  {same}"
+        )
+
+    console.frame(
+        [
+            *rows,
+            "",
+            "Vertical effects already color whole lines, so little",
+            "is redundant. Per-cell effects repeat an escape for every",
+            "character, and fewer colors means longer same-color runs.",
+        ],
+        title=f"{icons.BAR_CHART} Bytes Written",
+        border="rounded",
+        border_color="cyan",
+        width=72,
+    )
+
+
+def demo_live() -> None:
+    """Print through a coalescing console and report its byte count."""
+    metered = MeteredConsole(coalesce=True, policy=RenderPolicy.full())
+    metered.frame(
+        ["Runs of the same color share one escape", "Spaces skip foreground changes"],
+        effect=EffectSpec.rainbow(direction="diagonal"),
+        border="rounded",
+        title="🌈 Coalesced",
+        width=52,
+    )
+    console.text(
+        f"{icons.CHECK_MARK_BUTTON} {metered.bytes_written:,d} bytes written, "
+        f"{metered.bytes_saved:,d} bytes saved"
+    )
+
+
+def main() -> None:
+    console.banner("COALESCE")
+    console.text("Merge redundant color escapes before they reach the terminal")
+    console.newline()
+
+    demo_byte_counts()
+    console.newline()
+    demo_live()
+
+
+if __name__ == "__main__":
+    main()
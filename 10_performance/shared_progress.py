@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Multi-Process Progress Demo
+===========================
+
+ProcessPoolExecutor jobs can't call ``progress.update()`` on the parent's
+display, so each update is usually sent back through a
+``multiprocessing.Queue``: a pickle and a pipe write in the worker, a read
+and an unpickle in the parent, per increment. With many workers the single
+reader in the parent can't keep up.
+
+SharedProgress in _progress.py gives each worker task a counter slot in a
+shared-memory segment. ``task.advance()`` writes that slot directly; the
+task's description and total are sent over a pipe once. The parent's render
+thread reads all slots on every refresh. This example shows:
+
+- The same jobs reporting through a Queue vs shared memory
+- Exact per-job totals read by the parent
+- One display line per job in a live run
+"""
+
+import multiprocessing
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from io import StringIO
+
+from _progress import SharedProgress, attach_progress, progress_reporter
+
+from styledconsole import Console, RenderPolicy, icons
+
+console = Console()
+
+WORKERS = 4
+JOBS = 8
+STEPS = 25_000  # per job
+
+_queue = None
+
+
+def attach_queue(queue) -> None:
+    global _queue
+    _queue = queue
+
+
+def queue_job(job: int) -> int:
+    """Report every step through the queue (the usual workaround)."""
+    _queue.put((job, "add"))
+    for _ in range(STEPS):
+        _queue.put((job, 1))
+    _queue.put((job, None))
+    return job
+
+
+def shared_job(job: int) -> int:
+    """Report every step through a shared-memory counter."""
+    task = progress_reporter().add_task(f"Shard {job}", total=STEPS)
+    for _ in range(STEPS):
+        task.advance()
+    return job
+
+
+def paced_job(job: int) -> int:
+    """A job that does some I/O between batches, so the display has time to move."""
+    task = progress_reporter().add_task(f"Shard {job}", total=STEPS)
+    for _ in range(STEPS // 1000):
+        time.sleep(0.01 + job * 0.002)
+        for _ in range(1000):
+            task.advance()
+    return job
+
+
+def timed_queue_run(target: Console) -> tuple[float, float]:
+    """Wall time and total counted for the Queue version."""
+    queue = multiprocessing.Queue()
+    counted = 0
+
+    with target.progress() as progress:
+        tasks = {}
+
+        def reader() -> None:
+            nonlocal counted
+            done = 0
+            while done < JOBS:
+                job, step = queue.get()
+                if step == "add":
+                    tasks[job] = progress.add_task(f"Shard {job}", total=STEPS)
+                elif step is None:
+                    done += 1
+                else:
+                    progress.update(tasks[job], advance=step)
+                    counted += step
+
+        start = time.perf_counter()
+        drain = threading.Thread(target=reader)
+        drain.start()
+        with ProcessPoolExecutor(WORKERS, initializer=attach_queue, initargs=(queue,)) as pool:
+            list(pool.map(queue_job, range(JOBS)))
+        drain.join()
+        elapsed = time.perf_counter() - start
+    return elapsed, counted
+
+
+def timed_shared_run(target: Console) -> tuple[float, float, int]:
+    """Wall time, total counted and redraws for the shared-memory version."""
+    start = time.perf_counter()
+    with SharedProgress(target, slots=JOBS) as progress:
+        with ProcessPoolExecutor(
+            WORKERS, initializer=attach_progress, initargs=progress.initargs
+        ) as pool:
+            list(pool.map(shared_job, range(JOBS)))
+    elapsed = time.perf_counter() - start
+    return elapsed, sum(task.completed for task in progress.tasks), progress.refreshes
+
+
+def demo_throughput() -> None:
+    """Both backends on the same jobs; Rich output goes to a buffer."""
+    target = Console(file=StringIO(), policy=RenderPolicy.full())
+    total = JOBS * STEPS
+    queued, queue_counted = timed_queue_run(target)
+    shared, shared_counted, refreshes = timed_shared_run(target)
+
+    console.frame(
+        [
+            f"{JOBS} jobs x {STEPS:,} steps on {WORKERS} worker processes",
+            "",
+            f"multiprocessing.Queue: {queued:6.2f}s  counted {queue_counted:,.0f} / {total:,}",
+            f"SharedProgress:        {shared:6.2f}s  counted {shared_counted:,.0f} / {total:,}",
+            "",
+            f"Messages to the parent: Queue {total + 2 * JOBS:,}, shared memory {JOBS}",
+            f"Parent redraws: {refreshes}  ({queued / shared:.0f}x faster overall)",
+        ],
+        title=f"{icons.STOPWATCH} Worker Progress",
+        border="rounded",
+        border_color="cyan",
+        width=72,
+    )
+
+
+def demo_live() -> None:
+    """One display line per job."""
+    if not sys.stdout.isatty():
+        console.text("(not a terminal - text progress on stderr)")
+    with SharedProgress(console, slots=JOBS, refresh_per_second=15) as progress:
+        with ProcessPoolExecutor(
+            WORKERS, initializer=attach_progress, initargs=progress.initargs
+        ) as pool:
+            list(pool.map(paced_job, range(JOBS)))
+    console.text(
+        f"  {icons.CHECK_MARK_BUTTON} {len(progress.tasks)} jobs complete: {progress.finished}"
+    )
+
+
+def main() -> None:
+    console.banner("SHARED")
+    console.text("Progress from worker processes without per-update IPC")
+    console.newline()
+
+    demo_throughput()
+    console.newline()
+    demo_live()
+
+
+if __name__ == "__main__":
+    main()
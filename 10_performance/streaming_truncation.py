@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Streaming Truncation Demo
+=========================
+
+truncate_to_width() measures the whole string before cutting it, so fitting
+a 10 KB log line into a 90-column frame segments all 10 KB. The helpers in
+_width.py walk graphemes lazily instead:
+
+- iter_graphemes(): generator version of split_graphemes()
+- width_prefix(): longest prefix that fits a width budget
+- truncate_graphemes(): stops as soon as the line is known not to fit
+
+This example times both approaches on long log lines and then tails them
+into a frame, the way 08_applications/logs_viewer.py displays logs.
+"""
+
+import time
+from itertools import islice
+
+from _width import iter_graphemes, truncate_graphemes, width_prefix
+
+from styledconsole import Console, icons
+from styledconsole.utils.text import truncate_to_width, visual_width
+
+console = Console()
+
+FRAME_WIDTH = 90
+CONTENT_WIDTH = FRAME_WIDTH - 4  # 2 borders + 2 padding
+ITERATIONS = 50
+
+LONG_LINES = {
+    "ASCII": "2025-11-11 14:23:15.234 INFO [HTTP] GET /api/users?page=1 -> 200 " * 150,
+    "Emoji": f"{icons.CHECK_MARK_BUTTON} deploy step ok {icons.ROCKET} 中文 " * 300,
+    "Colored": "\033[32mINFO\033[0m \033[2m[worker-7]\033[0m processed batch 4711 " * 220,
+}
+
+
+def per_call_ms(func, *args) -> float:
+    """Average milliseconds per call over ITERATIONS calls."""
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        visual_width.cache_clear()  # Real log lines are never repeated
+        func(*args)
+    return (time.perf_counter() - start) / ITERATIONS * 1000
+
+
+def demo_truncation_cost() -> None:
+    """truncate_to_width vs truncate_graphemes on ~10 KB lines."""
+    lines = [f"{'Line':8} {'Length':>7} {'truncate_to_width':>18} {'streaming':>10} {'Speedup':>8}"]
+    for name, text in LONG_LINES.items():
+        full = per_call_ms(truncate_to_width, text, CONTENT_WIDTH)
+        lazy = per_call_ms(truncate_graphemes, text, CONTENT_WIDTH)
+        lines.append(
+            f"{name:8} {len(text):>7,} {full:>16.3f}ms {lazy:>8.3f}ms {full / lazy:>7.0f}x"
+        )
+
+    console.frame(
+        lines,
+        title=f"{icons.STOPWATCH} Fitting a 10 KB line into {FRAME_WIDTH} columns",
+        border="rounded",
+        border_color="cyan",
+        width=72,
+    )
+
+
+def demo_lazy_iteration() -> None:
+    """Only the graphemes that are consumed get segmented."""
+    text = LONG_LINES["Emoji"]
+    first = list(islice(iter_graphemes(text), 6))
+    prefix, width = width_prefix(text, 20)
+
+    console.frame(
+        [
+            f"First 6 graphemes: {first}",
+            f"width_prefix(text, 20) -> width {width}: {prefix!r}",
+        ],
+        title=f"{icons.MAG} Lazy Grapheme Iteration",
+        border="rounded",
+        border_color="magenta",
+        width=72,
+    )
+
+
+def demo_log_tail() -> None:
+    """Tail long log lines into a fixed-width frame."""
+    tail = [
+        f"{icons.INFORMATION} 14:28:45.123  INFO   [HTTP] GET /api/users " + "?id=1234" * 400,
+        f"{icons.CROSS_MARK} 14:28:46.789  ERROR  [DB] Query failed: " + "SELECT * FROM t; " * 600,
+        f"{icons.CHECK_MARK_BUTTON} 14:28:47.012  INFO   [JOB] Processed 847 items in 1.2s",
+        f"{icons.FIRE} 14:28:48.345  WARN   [CACHE] Evicted keys: " + "user:1234 " * 800,
+    ]
+    console.frame(
+        [truncate_graphemes(line, CONTENT_WIDTH) for line in tail],
+        title=f"{icons.SCROLL} Live Log Tail (long lines truncated)",
+        border="solid",
+        border_color="blue",
+        width=FRAME_WIDTH,
+    )
+
+
+def main() -> None:
+    console.banner("STREAMING")
+    console.text("Stop segmenting once the width budget is used up")
+    console.newline()
+
+    demo_truncation_cost()
+    console.newline()
+    demo_lazy_iteration()
+    console.newline()
+    demo_log_tail()
+
+
+if __name__ == "__main__":
+    main()
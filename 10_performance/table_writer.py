@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Streaming Table Writer Demo
+===========================
+
+A StyledTable or GradientTable is printed once all of its rows are known.
+When the rows come from a long-running query, nothing at all appears on
+screen until the last one arrives, and then the whole table is laid out
+at once.
+
+TableWriter in _tables.py fixes the column widths up front (given, or
+estimated from a first page of results), prints the title, top border and
+header immediately, and writes every ``add_row()`` as one line straight to
+the output. Closing it draws the bottom border, colored for the final row
+count. This example shows:
+
+- Time until the first line and the first row: GradientTable vs TableWriter
+- Rows from a slow query appearing as they arrive
+- A gradient estimated for the expected row count, finalized on close
+"""
+
+import time
+from collections.abc import Iterator
+from io import StringIO
+
+from _tables import TableWriter
+
+from styledconsole import Console, RenderPolicy, icons
+from styledconsole.presets.tables import GradientTable
+
+console = Console()
+
+ROWS = 120
+ROW_LATENCY = 0.01  # seconds per row from the "database"
+ENDPOINTS = ["/api/users", "/api/orders", "/api/products", "/api/payments", "/api/reports"]
+
+
+def query(rows: int, latency: float) -> Iterator[tuple[str, ...]]:
+    """A slow query: API call records, one every ``latency`` seconds."""
+    for index in range(rows):
+        time.sleep(latency)
+        status = "[red]5xx[/]" if index % 23 == 7 else "[green]200[/]"
+        yield (
+            f"{index:05d}",
+            ENDPOINTS[index % len(ENDPOINTS)],
+            ["GET", "POST"][index % 2],
+            f"{(index * 37) % 900 + 12} ms",
+            status,
+        )
+
+
+def template() -> GradientTable:
+    table = GradientTable(title="API Calls")
+    table.add_column("ID", justify="right")
+    table.add_column("ENDPOINT")
+    table.add_column("METHOD", justify="center")
+    table.add_column("LATENCY", justify="right")
+    table.add_column("STATUS", justify="center")
+    return table
+
+
+class WriteClock:
+    """Output stream that remembers when its first and second writes happened."""
+
+    def __init__(self) -> None:
+        self.buffer = StringIO()
+        self.start = time.perf_counter()
+        self.writes: list[float] = []
+
+    def write(self, text: str) -> int:
+        self.writes.append(time.perf_counter() - self.start)
+        return self.buffer.write(text)
+
+    def flush(self) -> None:
+        pass
+
+
+def demo_latency() -> None:
+    """How long the user waits for the first line of output."""
+    library = WriteClock()
+    table = template()
+    for row in query(ROWS, ROW_LATENCY):
+        table.add_row(*row)
+    Console(file=library, policy=RenderPolicy.full(), width=80).print(table)
+    library_total = time.perf_counter() - library.start
+
+    streamed = WriteClock()
+    target = Console(file=streamed, policy=RenderPolicy.full(), width=80)
+    with TableWriter(
+        target, template(), widths=[5, 14, 6, 7, 6], expected_rows=ROWS, file=streamed, width=80
+    ) as out:
+        for row in query(ROWS, ROW_LATENCY):
+            out.add_row(*row)
+    streamed_total = time.perf_counter() - streamed.start
+
+    console.frame(
+        [
+            f"{ROWS} rows from a query returning one row every {ROW_LATENCY * 1000:.0f}ms",
+            "",
+            "                 first line   first row    table done",
+            f"GradientTable:   {library.writes[0]:8.3f}s   {library.writes[0]:8.3f}s"
+            f"   {library_total:8.3f}s",
+            f"TableWriter:     {streamed.writes[0]:8.3f}s   {streamed.writes[1]:8.3f}s"
+            f"   {streamed_total:8.3f}s",
+        ],
+        title=f"{icons.STOPWATCH} Time to First Output",
+        border="rounded",
+        border_color="cyan",
+        width=72,
+    )
+
+
+def demo_live() -> None:
+    """Pages of results printed as they arrive, widths from the first page."""
+    results = query(36, 0.05)
+    first_page = [next(results) for _ in range(12)]
+    with TableWriter(console, template(), sample=first_page, expected_rows=36) as out:
+        out.add_rows(first_page)
+        for row in results:
+            out.add_row(*row)
+    console.text(
+        f"  {icons.CHECK_MARK_BUTTON} {out.rows} rows streamed; widths {out.widths}"
+        " estimated from the first page"
+    )
+
+
+def main() -> None:
+    console.banner("STREAM")
+    console.text("Styled tables that print while the query is still running")
+    console.newline()
+
+    demo_latency()
+    console.newline()
+    demo_live()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Width Cache Demo
+================
+
+Status dashboards redraw the same few hundred labels every second, and every
+label, title and cell goes through visual_width(). This example wraps it in a
+bounded WidthCache (see _width.py) and shows:
+
+- Hit/miss/eviction counters for a dashboard redraw loop
+- LRU vs FIFO eviction when the working set exceeds the cache size
+- Correct widths after the terminal emoji mode changes at runtime
+"""
+
+import os
+import time
+
+from _width import WidthCache
+
+from styledconsole import Console, icons
+from styledconsole.utils.text import visual_width
+
+console = Console()
+
+LABEL_COUNT = 300
+REDRAWS = 50
+ICON_CHOICES = ["🚀", "✅", "⚠️", "❌", "📊", "🔥", "👨‍💻"]
+
+
+def make_labels(count: int) -> list[str]:
+    """Build dashboard-style labels mixing ASCII, emoji, VS16 and ZWJ."""
+    return [
+        f"{ICON_CHOICES[i % len(ICON_CHOICES)]} service-{i:03d} p99={i % 97}ms"
+        for i in range(count)
+    ]
+
+
+def time_redraws(measure, labels: list[str], redraws: int) -> float:
+    """Measure every label `redraws` times, return seconds elapsed."""
+    start = time.perf_counter()
+    for _ in range(redraws):
+        for label in labels:
+            measure(label)
+    return time.perf_counter() - start
+
+
+def uncached_width(text: str) -> int:
+    """visual_width with the library's internal cache defeated."""
+    visual_width.cache_clear()
+    return visual_width(text)
+
+
+def demo_redraw_loop() -> None:
+    """Compare uncached measurement against WidthCache for a redraw loop."""
+    labels = make_labels(LABEL_COUNT)
+    widths = WidthCache(maxsize=1024)
+
+    uncached = time_redraws(uncached_width, labels, REDRAWS)
+    cached = time_redraws(widths, labels, REDRAWS)
+    stats = widths.stats()
+    total = LABEL_COUNT * REDRAWS
+
+    console.frame(
+        [
+            f"Labels per redraw:  {LABEL_COUNT}",
+            f"Redraws:            {REDRAWS}",
+            "",
+            f"Uncached:   {uncached * 1000:8.2f}ms  ({uncached / total * 1e6:6.2f}µs/label)",
+            f"WidthCache: {cached * 1000:8.2f}ms  ({cached / total * 1e6:6.2f}µs/label)",
+            "",
+            f"Hits: {stats.hits}  Misses: {stats.misses}  Evictions: {stats.evictions}",
+            f"Hit rate: {stats.hit_rate:.1%}  Size: {stats.size}/{stats.maxsize}",
+        ],
+        title=f"{icons.BAR_CHART} Dashboard Redraw Loop",
+        border="rounded",
+        border_color="cyan",
+        width=70,
+    )
+
+
+def demo_eviction_policies() -> None:
+    """Show how LRU keeps a hot set alive when cold labels stream through."""
+    hot = make_labels(100)
+    cold = [f"request-{i} handled" for i in range(2000)]
+
+    lines = []
+    for policy in ("lru", "fifo"):
+        widths = WidthCache(maxsize=256, policy=policy)
+        for i, label in enumerate(cold):
+            widths(label)
+            widths(hot[i % len(hot)])
+        stats = widths.stats()
+        lines.append(
+            f"{policy.upper():5} hit rate {stats.hit_rate:6.1%}  "
+            f"evictions {stats.evictions:5}  size {stats.size}/{stats.maxsize}"
+        )
+
+    console.frame(
+        [
+            "Working set: 100 hot labels + 2,000 one-off log lines",
+            "Cache size:  256 entries",
+            "",
+            *lines,
+        ],
+        title=f"{icons.GEAR} Eviction Policies",
+        border="rounded",
+        border_color="magenta",
+        width=70,
+    )
+
+
+def demo_mode_switch() -> None:
+    """Widths stay correct when the terminal emoji mode changes."""
+    widths = WidthCache()
+    label = "⚠️ Disk almost full"
+    saved = os.environ.get("STYLEDCONSOLE_MODERN_TERMINAL")
+
+    rows = []
+    try:
+        for value in ("0", "1", "0"):
+            os.environ["STYLEDCONSOLE_MODERN_TERMINAL"] = value
+            changed = widths.refresh_mode()
+            mode = "modern" if value == "1" else "standard"
+            rows.append(
+                f"{mode:8} width={widths(label):2}  "
+                f"mode changed={str(changed):5}  misses={widths.stats().misses}"
+            )
+    finally:
+        if saved is None:
+            os.environ.pop("STYLEDCONSOLE_MODERN_TERMINAL", None)
+        else:
+            os.environ["STYLEDCONSOLE_MODERN_TERMINAL"] = saved
+        widths.refresh_mode()
+
+    console.frame(
+        [
+            f"Label: {label!r} (VS16 emoji)",
+            "",
+            *rows,
+            "",
+            "Returning to a mode reuses its cached entries.",
+        ],
+        title=f"{icons.LAPTOP} Terminal Mode Changes",
+        border="rounded",
+        border_color="green",
+        width=70,
+    )
+
+
+def main() -> None:
+    console.banner("WIDTH CACHE")
+    console.text("Memoized visual_width for redraw-heavy dashboards")
+    console.newline()
+
+    demo_redraw_loop()
+    console.newline()
+    demo_eviction_policies()
+    console.newline()
+    demo_mode_switch()
+
+
+if __name__ == "__main__":
+    main()
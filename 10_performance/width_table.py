@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Codepoint Width Table Demo
+==========================
+
+visual_width() splits text into graphemes and works out every grapheme's
+width from scratch. For text where each codepoint is its own grapheme (no
+ZWJ, VS16 or skin tone modifiers) the width is just a sum over a
+precomputed table, which _width.WidthTable provides.
+
+This example shows:
+- Building the table once and loading it from the on-disk cache afterwards
+- fast_width() vs uncached visual_width() on the benchmark.py strings
+- That both agree, and which strings still take the full grapheme path
+"""
+
+import time
+
+from _width import WidthTable, fast_width, get_width_table, needs_segmentation
+
+from styledconsole import Console, icons
+from styledconsole.utils.text import pad_to_width, visual_width
+
+console = Console()
+
+ITERATIONS = 2000
+
+SAMPLES = [
+    "🚀 🎨 🎯 Test 🌟 ✨",  # Emoji frame title (benchmark.py)
+    "🔥 Content with emojis 🎉",  # Emoji frame body
+    "Test 🚀 with emoji 🎉 content",  # Visual width calc
+    "中文 日本語 한국어 wide",  # Wide CJK
+    "⚠️ Warning: VS16 path",  # VS16 -> full path
+    "👨‍💻 Developer mode",  # ZWJ -> full path
+]
+
+
+def per_call_us(func, text: str) -> float:
+    """Average microseconds per call over ITERATIONS calls."""
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        func(text)
+    return (time.perf_counter() - start) / ITERATIONS * 1e6
+
+
+def uncached_width(text: str) -> int:
+    """visual_width with the library's internal cache defeated."""
+    visual_width.cache_clear()
+    return visual_width(text)
+
+
+def uncached_fast_width(text: str) -> int:
+    """fast_width with the fallback path's cache defeated as well."""
+    visual_width.cache_clear()
+    return fast_width(text)
+
+
+def demo_table_loading() -> None:
+    """Show first-build vs cached-load cost of the table."""
+    path = WidthTable.cache_path()
+    cached = path.exists()
+
+    start = time.perf_counter()
+    get_width_table()
+    first = time.perf_counter() - start
+
+    start = time.perf_counter()
+    WidthTable.load()
+    reload = time.perf_counter() - start
+
+    console.frame(
+        [
+            f"Cache file: {path.name}",
+            f"On disk:    {path.stat().st_size:,} bytes" if path.exists() else "On disk:    (not writable)",
+            "",
+            f"First load: {first * 1000:8.2f}ms ({'cached' if cached else 'built'})",
+            f"Reload:     {reload * 1000:8.2f}ms (cached)",
+        ],
+        title=f"{icons.FILE_FOLDER} Width Table",
+        border="rounded",
+        border_color="cyan",
+        width=76,
+    )
+
+
+def demo_lookup_speed() -> None:
+    """Compare fast_width against uncached visual_width."""
+    lines = [f"{'Text':30} {'Width':>5} {'Path':>9} {'Uncached':>10} {'Fast':>10}"]
+    for text in SAMPLES:
+        expected = visual_width(text)
+        got = fast_width(text)
+        ok = "" if got == expected else f" {icons.CROSS_MARK} expected {expected}"
+        path = "graphemes" if needs_segmentation(text) else "table"
+        slow = per_call_us(uncached_width, text)
+        fast = per_call_us(uncached_fast_width, text)
+        lines.append(
+            f"{pad_to_width(text, 30)} {got:>5} {path:>9} {slow:>8.2f}µs {fast:>8.2f}µs{ok}"
+        )
+
+    console.frame(
+        lines,
+        title=f"{icons.HIGH_VOLTAGE} Per-call Cost",
+        border="rounded",
+        border_color="magenta",
+        width=76,
+    )
+
+
+def main() -> None:
+    console.banner("WIDTH TABLE")
+    console.text("O(1) codepoint lookups instead of per-grapheme branching")
+    console.newline()
+
+    demo_table_loading()
+    console.newline()
+    demo_lookup_speed()
+    console.newline()
+    console.text(
+        f"{icons.LIGHT_BULB} VS16 and ZWJ strings fall back to visual_width(); "
+        "their width depends on the terminal mode."
+    )
+
+
+if __name__ == "__main__":
+    main()
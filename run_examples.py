@@ -6,7 +6,7 @@ StyledConsole Examples Runner
 A robust example runner that executes all StyledConsole examples in organized categories.
 
 Features:
-- Organized by numbered category (01-09)
+- Organized by numbered category (01-10)
 - Interactive mode with pauses between examples
 - Auto mode for continuous execution
 - Category filtering (run specific categories only)
@@ -162,6 +162,13 @@ class ExamplesRunner:
                 icon="🧪",
                 priority=9,
             ),
+            ExampleCategory(
+                name="10_performance",
+                path=examples_root / "10_performance",
+                description="Performance Patterns - Caching, Batching, Streaming",
+                icon="⚡",
+                priority=10,
+            ),
         ]
 
     def list_categories(self) -> None: